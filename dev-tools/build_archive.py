@@ -4,8 +4,12 @@ import os
 import logging
 import sys
 from bs4 import BeautifulSoup
-from collections import defaultdict
+from build_css import load_utility_css
+from standings import StandingsEngine
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 
 # --- Configuration ---
 # This section contains team name mappings that are static across seasons.
@@ -72,6 +76,9 @@ FILENAME_ABBR_MAP = {
     "BLMA": "BLMAR"
 }
 
+# Machine-readable standings written next to each season archive.
+STANDINGS_FILENAME = "standings.json"
+
 
 # --- CSV Division Loading ---
 def load_divisions_from_csv(csv_path, filename_abbr_map):
@@ -420,28 +427,19 @@ def parse_meet_file(file_path, team_name_map, schedule_name_map, filename_abbr_m
         logging.warning(f"Could not process file {file_path}. Error: {e}")
         return None
 
-def generate_html(meets_by_division, division_assignments, year):
-    """Generates the final HTML output file from the processed meet data."""
-    
-    # --- Calculate Standings ---
-    standings = defaultdict(lambda: {'wins': 0, 'losses': 0})
-    for division in meets_by_division:
-        for meet in meets_by_division[division]:
-            # Determine winner and loser
-            winner_abbr = meet['home_abbr'] if meet['home_score'] > meet['away_score'] else meet['away_abbr']
-            loser_abbr = meet['away_abbr'] if meet['home_score'] > meet['away_score'] else meet['home_abbr']
-            standings[winner_abbr]['wins'] += 1
-            standings[loser_abbr]['losses'] += 1
-
-    # --- Start HTML Generation ---
-    html_output = f"""
+# --- HTML Templates ---
+# The archive preamble (head, utility stylesheet, embedded CSS and page header) is
+# identical for every season apart from the year, so it is kept as static chunks
+# built once at import time and reused for every render.
+ARCHIVE_DOC_OPEN = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GPSA {year} Season Archive</title>
-    <script src="https://cdn.tailwindcss.com"></script>
+    <title>GPSA """
+
+ARCHIVE_HEAD_STATIC = """ Season Archive</title>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
 
     <!-- Favicon Links -->
@@ -449,120 +447,113 @@ def generate_html(meets_by_division, division_assignments, year):
     <link rel="icon" type="image/png" sizes="32x32" href="https://d1nmxxg9d5tdo.cloudfront.net/875/files/favicon-32x32.png?1651502547">
     <link rel="icon" type="image/png" sizes="16x16" href="https://d1nmxxg9d5tdo.cloudfront.net/875/files/favicon-16x16.png?1651502535">
 
-    <script>
-        tailwind.config = {{
-            theme: {{
-                extend: {{
-                    fontFamily: {{ sans: ['Inter', 'sans-serif'] }},
-                    colors: {{ 'gpsa-blue': '#002366', 'gpsa-blue-light': '#0033a0', 'gpsa-red': '#d9242b' }}
-                }}
-            }}
-        }}
-    </script>
+    <!-- Precompiled utility classes (css/gpsa-utilities.css), embedded to keep the archive self-contained -->
+    <style>
+""" + load_utility_css() + """    </style>
 
     <style>
         /* GPSA Embedded Styles for Season Archive */
-        body {{
+        body {
             font-family: 'Inter', sans-serif;
             background-color: #f0f2f5;
             color: #1f2937;
-        }}
+        }
 
-        .gpsa-header {{
+        .gpsa-header {
             background-color: #002366;
             color: white;
-        }}
+        }
 
-        .gpsa-header img {{
+        .gpsa-header img {
             border-radius: 50%;
-        }}
+        }
 
-        .gpsa-header-subtitle {{
+        .gpsa-header-subtitle {
             margin-top: 0.25rem;
             font-size: 0.875rem;
             text-align: center;
             color: #d1d5db;
-        }}
+        }
 
-        @media (min-width: 640px) {{
-            .gpsa-header-subtitle {{
+        @media (min-width: 640px) {
+            .gpsa-header-subtitle {
                 font-size: 1rem;
-            }}
-        }}
+            }
+        }
 
         /* Responsive table text sizing */
-        .table-date {{
+        .table-date {
             font-size: 0.75rem; /* 12px on mobile */
-        }}
+        }
 
-        .table-text {{
+        .table-text {
             font-size: 0.875rem; /* 14px on mobile */
-        }}
+        }
 
-        .table-header {{
+        .table-header {
             font-size: 0.875rem; /* 14px on mobile */
             padding: 0.25rem 0.5rem;
-        }}
+        }
 
-        .table-cell {{
+        .table-cell {
             padding: 0.25rem 0.5rem;
-        }}
+        }
 
         /* Date format responsive display */
-        .date-full {{
+        .date-full {
             display: none; /* Hide full date on mobile */
-        }}
+        }
 
-        .date-abbr {{
+        .date-abbr {
             display: inline; /* Show abbreviated date on mobile */
-        }}
+        }
 
-        @media (min-width: 640px) {{
-            .table-date {{
+        @media (min-width: 640px) {
+            .table-date {
                 font-size: 0.875rem; /* 14px on tablet */
-            }}
+            }
 
-            .table-text {{
+            .table-text {
                 font-size: 1rem; /* 16px on tablet */
-            }}
+            }
 
-            .table-header {{
+            .table-header {
                 font-size: 1rem; /* 16px on tablet */
                 padding: 0.5rem;
-            }}
+            }
 
-            .table-cell {{
+            .table-cell {
                 padding: 0.5rem;
-            }}
+            }
 
             /* Switch to full date format on tablet+ */
-            .date-full {{
+            .date-full {
                 display: inline;
-            }}
+            }
 
-            .date-abbr {{
+            .date-abbr {
                 display: none;
-            }}
-        }}
+            }
+        }
 
-        @media (min-width: 768px) {{
-            .table-header {{
+        @media (min-width: 768px) {
+            .table-header {
                 font-size: 1.125rem; /* 18px on desktop */
-            }}
-        }}
+            }
+        }
 
-        @media print {{
-            .no-print {{
+        @media print {
+            .no-print {
                 display: none !important;
-            }}
+            }
 
-            body, .container {{
+            body, .container {
                 margin: 0;
                 padding: 0;
                 border: none;
                 box-shadow: none;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -574,7 +565,9 @@ def generate_html(meets_by_division, division_assignments, year):
                      class="h-16 w-16 md:h-20 md:w-20 mr-4 rounded-full"
                      onerror="this.onerror=null; this.src='https://placehold.co/100x100/002366/FFFFFF?text=GPSA';">
                 <div>
-                    <h1 class="text-2xl sm:text-3xl md:text-4xl font-bold">GPSA {year} Season Archive</h1>
+                    <h1 class="text-2xl sm:text-3xl md:text-4xl font-bold">GPSA """
+
+ARCHIVE_HEADER_CLOSE = """ Season Archive</h1>
                     <p class="gpsa-header-subtitle">Season Results and Standings</p>
                 </div>
             </header>
@@ -585,122 +578,373 @@ def generate_html(meets_by_division, division_assignments, year):
                 <a href="#blue" class="text-base sm:text-lg md:text-xl font-bold text-gpsa-red hover:text-gpsa-blue transition-colors duration-300">Blue Division</a>
             </div>
 """
+
+ARCHIVE_DOC_CLOSE = '</div></main></body></html>'
+
+# --- Split Output Templates ---
+# With --split, index.html carries only the standings and each division's
+# schedule moves to its own page, which the landing page fetches on demand.
+SCHEDULE_PAGE_FILENAME = "schedule-{division_id}.html"
+
+SCHEDULE_PAGE_HEADER_CLOSE = """ Season Archive</h1>
+                    <p class="gpsa-header-subtitle">{division_name} Division Schedule</p>
+                </div>
+            </header>
+"""
+
+LAZY_SCHEDULE_SCRIPT = """
+<script>
+    // Load a division's schedule page the first time its section is opened
+    document.querySelectorAll('details[data-schedule]').forEach(function (details) {
+        details.addEventListener('toggle', function () {
+            if (!details.open || details.dataset.loaded) return;
+            details.dataset.loaded = 'true';
+            fetch(details.dataset.schedule)
+                .then(function (response) {
+                    if (!response.ok) throw new Error(response.status);
+                    return response.text();
+                })
+                .then(function (text) {
+                    var page = new DOMParser().parseFromString(text, 'text/html');
+                    var schedule = page.getElementById('schedule');
+                    if (schedule) details.querySelector('.schedule-content').innerHTML = schedule.innerHTML;
+                })
+                .catch(function () { delete details.dataset.loaded; });
+        });
+    });
+</script>
+"""
+
+SPLIT_DOC_CLOSE = '</div></main>' + LAZY_SCHEDULE_SCRIPT + '</body></html>'
+
+SCHEDULE_TABLE_OPEN = (
+    '<table class="w-full border-collapse min-w-full">'
+    '<thead><tr class="border-b border-black"><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">DATE</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">HOME</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">SCORE</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">VISITOR</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">SCORE</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">BEST TIMES</th></tr></thead><tbody>'
+)
+SCHEDULE_TABLE_CLOSE = '</tbody></table><div class="my-8"></div>'
+
+STANDINGS_TABLE_OPEN = (
+    '<table class="w-full border-collapse min-w-full">'
+    '<thead><tr class="border-b border-black"><th class="table-header bg-gpsa-red text-white text-center align-middle">Team</th><th class="table-header bg-gpsa-red text-white text-center align-middle">Win</th><th class="table-header bg-gpsa-red text-white text-center align-middle">Loss</th></tr></thead><tbody>'
+)
+# Used instead when any meet in the season ended in a tie
+STANDINGS_TABLE_OPEN_WITH_TIES = (
+    '<table class="w-full border-collapse min-w-full">'
+    '<thead><tr class="border-b border-black"><th class="table-header bg-gpsa-red text-white text-center align-middle">Team</th><th class="table-header bg-gpsa-red text-white text-center align-middle">Win</th><th class="table-header bg-gpsa-red text-white text-center align-middle">Loss</th><th class="table-header bg-gpsa-red text-white text-center align-middle">Tie</th></tr></thead><tbody>'
+)
+STANDINGS_TABLE_CLOSE = '</tbody></table>'
+
+BACK_TO_TOP = '<div class="mt-4 sm:mt-6 flex justify-end"><a href="#top" class="text-sm sm:text-base text-gpsa-blue-light hover:text-gpsa-red font-medium">Back to Top &uarr;</a></div></div>'
+
+CELL_OPEN = "<td class='table-cell table-text text-center align-middle'>"
+
+# --- Team Page Templates ---
+# With --team-pages, every team gets a season page of its own meets, and the
+# standings tables link each team to it.
+TEAM_PAGE_FILENAME = "team-{team_abbr}.html"
+
+TEAM_PAGE_HEADER_CLOSE = """ Season Archive</h1>
+                    <p class="gpsa-header-subtitle">{team_name}</p>
+                </div>
+            </header>
+"""
+
+TEAM_TABLE_OPEN = (
+    '<table class="w-full border-collapse min-w-full">'
+    '<thead><tr class="border-b border-black"><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">DATE</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">OPPONENT</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">SCORE</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">OPP</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">RESULT</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">RECORD</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">BEST TIMES</th></tr></thead><tbody>'
+)
+
+
+def render_schedule_rows(meets):
+    """Yields the schedule table rows for a division, grouped by meet date."""
+    # Group meets by date
+    meets_grouped_by_date = defaultdict(list)
+    for meet in meets:
+        meets_grouped_by_date[meet['date']].append(meet)
+
+    for date, meets_on_date in sorted(meets_grouped_by_date.items()):
+        # Generate both full and abbreviated date formats
+        full_date = date.strftime("%A %B %d").upper()
+        abbr_date = date.strftime("%a %b %d").upper()
+        date_cell = f'<td class="table-cell table-date text-center align-middle" rowspan="{len(meets_on_date)}"><span class="date-abbr">{abbr_date}</span><span class="date-full">{full_date}</span></td>'
+        for i, meet in enumerate(meets_on_date):
+            home_score_str = f"<strong>{meet['home_score']}</strong>" if meet['home_score'] > meet['away_score'] else str(meet['home_score'])
+            visitor_score_str = f"<strong>{meet['away_score']}</strong>" if meet['away_score'] > meet['home_score'] else str(meet['away_score'])
+
+            yield ''.join((
+                '<tr class="border-b border-black">',
+                date_cell if i == 0 else '',
+                CELL_OPEN, meet['home_schedule_name'], '</td>',
+                CELL_OPEN, home_score_str, '</td>',
+                CELL_OPEN, meet['away_schedule_name'], '</td>',
+                CELL_OPEN, visitor_score_str, '</td>',
+                CELL_OPEN, f"<a href='{meet['file_name']}' target='_blank' class='text-gpsa-blue-light underline font-medium hover:text-gpsa-red'>Results</a></td>",
+                '</tr>',
+            ))
+
+
+def render_standings_rows(division_teams, standings, inverted_team_map, team_pages=False):
+    """Yields the standings table rows for a division, in tie-breaker order (linking team pages if written)."""
+    for team_abbr in standings.rank(division_teams):
+        team_full_name = inverted_team_map.get(team_abbr, team_abbr)
+        team_label = f"{team_abbr} &ndash; {team_full_name}"
+        if team_pages:
+            team_label = f"<a href='{TEAM_PAGE_FILENAME.format(team_abbr=team_abbr)}' class='text-gpsa-blue-light underline font-medium hover:text-gpsa-red'>{team_label}</a>"
+        record = standings.record(team_abbr)
+        tie_cell = f"<td class='table-cell table-text text-center align-middle'>{record['ties']}</td>" if standings.has_ties else ''
+        yield f"<tr class='border-b border-black'><td class='table-cell table-text text-left align-middle'>{team_label}</td><td class='table-cell table-text text-center align-middle'>{record['wins']}</td><td class='table-cell table-text text-center align-middle'>{record['losses']}</td>{tie_cell}</tr>"
+
+
+def build_standings(meets_by_division, division_assignments):
+    """Builds the standings engine from every division's meets in a single pass."""
+    all_teams = [team for teams in division_assignments.values() for team in teams]
+    all_meets = (meet for meets in meets_by_division.values() for meet in meets)
+    return StandingsEngine.from_meets(all_meets, all_teams)
+
+
+def group_meets_by_team(meets_by_division):
+    """
+    Groups the season's meets by team in a single pass over every meet.
+
+    Each meet is filed under both its home and its away team, so a team's
+    page is built from its own list instead of rescanning the season.
+
+    Returns:
+        Dict mapping team abbreviation -> that team's meets sorted by date.
+    """
+    meets_by_team = defaultdict(list)
+    for meets in meets_by_division.values():
+        for meet in meets:
+            meets_by_team[meet['home_abbr']].append(meet)
+            meets_by_team[meet['away_abbr']].append(meet)
+    for meets in meets_by_team.values():
+        meets.sort(key=lambda x: x['date'])
+    return meets_by_team
+
+
+def render_archive(meets_by_division, division_assignments, year, standings=None, split=False, team_pages=False):
+    """
+    Renders the season archive as a stream of HTML chunks.
+
+    The static preamble is emitted from precomputed module-level chunks and
+    every division table is produced row by row, so callers can write the
+    archive straight to a file (see write_archive) without building the whole
+    document in memory first.
+
+    Args:
+        standings: Optional prebuilt StandingsEngine; built from the meets if omitted.
+        split: Render a standings-only landing page whose schedules are
+            lazy-loaded from the per-division pages (see render_schedule_page).
+        team_pages: Link each team in the standings to its team page
+            (see render_team_page).
+
+    Yields:
+        str: Consecutive fragments of the archive document.
+    """
+    if standings is None:
+        standings = build_standings(meets_by_division, division_assignments)
+
+    # Find the full name from the inverted map for display
+    inverted_team_map = {v: k for k, v in TEAM_NAME_MAP.items()}
+
+    yield ARCHIVE_DOC_OPEN
+    yield str(year)
+    yield ARCHIVE_HEAD_STATIC
+    yield str(year)
+    yield ARCHIVE_HEADER_CLOSE
+
     # --- Loop Through Divisions to Build Tables ---
     for division_name in ['Red', 'White', 'Blue']:
         division_id = division_name.lower()
-        html_output += f'<div id="{division_id}" class="bg-white rounded-xl shadow-lg p-4 sm:p-6 mb-8 overflow-x-auto">'
-        html_output += f'<h2 class="text-xl sm:text-2xl font-bold mb-4 sm:mb-6 text-gray-700">{division_name} Division</h2>'
+        yield f'<div id="{division_id}" class="bg-white rounded-xl shadow-lg p-4 sm:p-6 mb-8 overflow-x-auto">'
+        yield f'<h2 class="text-xl sm:text-2xl font-bold mb-4 sm:mb-6 text-gray-700">{division_name} Division</h2>'
 
         # --- Meet Schedule Table ---
-        html_output += '<table class="w-full border-collapse min-w-full">'
-        html_output += '<thead><tr class="border-b border-black"><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">DATE</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">HOME</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">SCORE</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">VISITOR</th><th class="w-1/12 table-header bg-gpsa-red text-white text-center align-middle">SCORE</th><th class="w-1/5 table-header bg-gpsa-red text-white text-center align-middle">BEST TIMES</th></tr></thead><tbody>'
-        
-        # Group meets by date
-        meets_grouped_by_date = defaultdict(list)
-        for meet in meets_by_division.get(division_name, []):
-            meets_grouped_by_date[meet['date']].append(meet)
-
-        for date, meets_on_date in sorted(meets_grouped_by_date.items()):
-            # Generate both full and abbreviated date formats
-            full_date = date.strftime("%A %B %d").upper()
-            abbr_date = date.strftime("%a %b %d").upper()
-            date_cell = f'<td class="table-cell table-date text-center align-middle" rowspan="{len(meets_on_date)}"><span class="date-abbr">{abbr_date}</span><span class="date-full">{full_date}</span></td>'
-            for i, meet in enumerate(meets_on_date):
-                html_output += '<tr class="border-b border-black">'
-                if i == 0:
-                    html_output += date_cell
-
-                home_score_str = f"<strong>{meet['home_score']}</strong>" if meet['home_score'] > meet['away_score'] else str(meet['home_score'])
-                visitor_score_str = f"<strong>{meet['away_score']}</strong>" if meet['away_score'] > meet['home_score'] else str(meet['away_score'])
-
-                html_output += f"<td class='table-cell table-text text-center align-middle'>{meet['home_schedule_name']}</td>"
-                html_output += f"<td class='table-cell table-text text-center align-middle'>{home_score_str}</td>"
-                html_output += f"<td class='table-cell table-text text-center align-middle'>{meet['away_schedule_name']}</td>"
-                html_output += f"<td class='table-cell table-text text-center align-middle'>{visitor_score_str}</td>"
-                html_output += f"<td class='table-cell table-text text-center align-middle'><a href='{meet['file_name']}' target='_blank' class='text-gpsa-blue-light underline font-medium hover:text-gpsa-red'>Results</a></td>"
-                html_output += '</tr>'
-        html_output += '</tbody></table><div class="my-8"></div>'
+        if not split:
+            yield SCHEDULE_TABLE_OPEN
+            yield from render_schedule_rows(meets_by_division.get(division_name, []))
+            yield SCHEDULE_TABLE_CLOSE
 
         # --- Standings Table ---
-        html_output += '<table class="w-full border-collapse min-w-full">'
-        html_output += '<thead><tr class="border-b border-black"><th class="table-header bg-gpsa-red text-white text-center align-middle">Team</th><th class="table-header bg-gpsa-red text-white text-center align-middle">Win</th><th class="table-header bg-gpsa-red text-white text-center align-middle">Loss</th></tr></thead><tbody>'
+        yield STANDINGS_TABLE_OPEN_WITH_TIES if standings.has_ties else STANDINGS_TABLE_OPEN
+        yield from render_standings_rows(division_assignments.get(division_name, []), standings, inverted_team_map,
+                                         team_pages)
+        yield STANDINGS_TABLE_CLOSE
+
+        # --- Lazy-Loaded Schedule Link ---
+        if split:
+            schedule_page = SCHEDULE_PAGE_FILENAME.format(division_id=division_id)
+            yield (
+                f'<details class="mt-4 sm:mt-6" data-schedule="{schedule_page}">'
+                f'<summary class="text-base sm:text-lg font-bold text-gpsa-red hover:text-gpsa-blue cursor-pointer">Meet Schedule</summary>'
+                f'<div class="schedule-content mt-4 overflow-x-auto"><a href="{schedule_page}" class="text-gpsa-blue-light underline font-medium hover:text-gpsa-red">View the {division_name} Division schedule</a></div>'
+                f'</details>'
+            )
+        yield BACK_TO_TOP
 
-        division_teams = division_assignments.get(division_name, [])
-        # Sort teams by wins (descending)
-        sorted_teams = sorted(division_teams, key=lambda abbr: standings[abbr]['wins'], reverse=True)
-        
-        # Find the full name from the inverted map for display
-        inverted_team_map = {v: k for k, v in TEAM_NAME_MAP.items()}
+    yield SPLIT_DOC_CLOSE if split else ARCHIVE_DOC_CLOSE
 
-        for team_abbr in sorted_teams:
-            team_full_name = inverted_team_map.get(team_abbr, team_abbr)
-            win_loss = standings[team_abbr]
-            html_output += f"<tr class='border-b border-black'><td class='table-cell table-text text-left align-middle'>{team_abbr} &ndash; {team_full_name}</td><td class='table-cell table-text text-center align-middle'>{win_loss['wins']}</td><td class='table-cell table-text text-center align-middle'>{win_loss['losses']}</td></tr>"
-        html_output += '</tbody></table>'
-        html_output += '<div class="mt-4 sm:mt-6 flex justify-end"><a href="#top" class="text-sm sm:text-base text-gpsa-blue-light hover:text-gpsa-red font-medium">Back to Top &uarr;</a></div></div>'
 
-    html_output += '</div></main></body></html>'
-    return html_output
+def render_schedule_page(division_name, meets, year):
+    """
+    Renders a standalone schedule page for one division (used by --split).
 
-def main():
-    """Main function to process a directory of meet files and generate an archive."""
-    parser = argparse.ArgumentParser(
-        description="Generate a GPSA season archive from a directory of meet result files.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python build_archive.py -i results/2025
-  python build_archive.py -i results/2025 -o results/2025
-  python build_archive.py -i ../2024_results -o ./output --verbose
+    The schedule table sits inside #schedule so the landing page can lift it
+    out when lazy-loading; meet result links stay relative to the season
+    directory, so they resolve from either page.
 
-The script automatically detects:
-  - Season year from meet filenames
-  - Division groupings based on which teams competed together
-        """
+    Yields:
+        str: Consecutive fragments of the schedule page.
+    """
+    division_id = division_name.lower()
+
+    yield ARCHIVE_DOC_OPEN
+    yield str(year)
+    yield ARCHIVE_HEAD_STATIC
+    yield str(year)
+    yield SCHEDULE_PAGE_HEADER_CLOSE.format(division_name=division_name)
+
+    yield '<div class="bg-white rounded-xl shadow-lg p-4 sm:p-6 mb-8 overflow-x-auto">'
+    yield f'<h2 class="text-xl sm:text-2xl font-bold mb-4 sm:mb-6 text-gray-700">{division_name} Division</h2>'
+    yield '<div id="schedule">'
+    yield SCHEDULE_TABLE_OPEN
+    yield from render_schedule_rows(meets)
+    yield '</tbody></table></div>'
+    yield f'<div class="mt-4 sm:mt-6 flex justify-end"><a href="index.html#{division_id}" class="text-sm sm:text-base text-gpsa-blue-light hover:text-gpsa-red font-medium">Back to Standings &uarr;</a></div></div>'
+
+    yield ARCHIVE_DOC_CLOSE
+
+
+def render_team_rows(team_abbr, meets, show_ties=False):
+    """Yields a team's schedule rows, one per meet in date order, with the running record."""
+    wins = losses = ties = 0
+    for meet in meets:
+        if meet['home_abbr'] == team_abbr:
+            opponent = f"vs {meet['away_schedule_name']}"
+            score, opponent_score = meet['home_score'], meet['away_score']
+        else:
+            opponent = f"at {meet['home_schedule_name']}"
+            score, opponent_score = meet['away_score'], meet['home_score']
+
+        if score > opponent_score:
+            wins += 1
+            result, score_str = 'W', f"<strong>{score}</strong>"
+        elif score < opponent_score:
+            losses += 1
+            result, score_str = 'L', str(score)
+        else:
+            ties += 1
+            result, score_str = 'T', str(score)
+        running_record = f"{wins}-{losses}-{ties}" if show_ties else f"{wins}-{losses}"
+
+        full_date = meet['date'].strftime("%A %B %d").upper()
+        abbr_date = meet['date'].strftime("%a %b %d").upper()
+        yield ''.join((
+            '<tr class="border-b border-black">',
+            f'<td class="table-cell table-date text-center align-middle"><span class="date-abbr">{abbr_date}</span><span class="date-full">{full_date}</span></td>',
+            CELL_OPEN, opponent, '</td>',
+            CELL_OPEN, score_str, '</td>',
+            CELL_OPEN, f"<strong>{opponent_score}</strong>" if opponent_score > score else str(opponent_score), '</td>',
+            CELL_OPEN, result, '</td>',
+            CELL_OPEN, running_record, '</td>',
+            CELL_OPEN, f"<a href='{meet['file_name']}' target='_blank' class='text-gpsa-blue-light underline font-medium hover:text-gpsa-red'>Results</a></td>",
+            '</tr>',
+        ))
+
+
+def render_team_page(team_abbr, division_name, meets, standings, year):
+    """
+    Renders a team's season page (used by --team-pages).
+
+    Lists the team's meets with scores, results and running record, and the
+    season totals from the standings engine. Meet result links are relative to
+    the season directory, like the schedule tables.
+
+    Yields:
+        str: Consecutive fragments of the team page.
+    """
+    inverted_team_map = {v: k for k, v in TEAM_NAME_MAP.items()}
+    team_full_name = inverted_team_map.get(team_abbr, team_abbr)
+    record = standings.record(team_abbr)
+    record_str = f"{record['wins']}-{record['losses']}"
+    if standings.has_ties:
+        record_str += f"-{record['ties']}"
+
+    yield ARCHIVE_DOC_OPEN
+    yield str(year)
+    yield ARCHIVE_HEAD_STATIC
+    yield str(year)
+    yield TEAM_PAGE_HEADER_CLOSE.format(team_name=team_full_name)
+
+    yield '<div class="bg-white rounded-xl shadow-lg p-4 sm:p-6 mb-8 overflow-x-auto">'
+    yield f'<h2 class="text-xl sm:text-2xl font-bold mb-4 sm:mb-6 text-gray-700">{team_abbr} &ndash; {team_full_name}</h2>'
+    yield (
+        f'<p class="text-base sm:text-lg text-gray-700 mb-4 sm:mb-6">{division_name} Division &middot; '
+        f'Record <strong>{record_str}</strong> &middot; Points For <strong>{record["points_for"]}</strong> &middot; '
+        f'Points Against <strong>{record["points_against"]}</strong></p>'
     )
-    parser.add_argument('-i', '--input', dest='input_dir', type=str, required=True,
-                        help='Path to the directory containing meet result HTML files')
-    parser.add_argument('-o', '--output', dest='output_dir', type=str, default='.',
-                        help='Directory where the archive HTML will be saved (default: current directory)')
-    parser.add_argument('-v', '--verbose', action='store_true',
-                        help='Enable verbose logging output')
-    parser.add_argument('--non-interactive', action='store_true',
-                        help='Run without prompts (requires divisions.csv in input directory)')
-    args = parser.parse_args()
+    yield TEAM_TABLE_OPEN
+    yield from render_team_rows(team_abbr, meets, standings.has_ties)
+    yield '</tbody></table>'
+    yield f'<div class="mt-4 sm:mt-6 flex justify-end"><a href="index.html#{division_name.lower()}" class="text-sm sm:text-base text-gpsa-blue-light hover:text-gpsa-red font-medium">Back to Standings &uarr;</a></div></div>'
 
-    # Setup logging
-    setup_logging(verbose=args.verbose)
+    yield ARCHIVE_DOC_CLOSE
 
-    # Validate input directory
-    if not os.path.isdir(args.input_dir):
-        logging.error(f"Input directory does not exist: {args.input_dir}")
-        sys.exit(1)
 
-    # Validate output directory
-    if not os.path.isdir(args.output_dir):
-        logging.error(f"Output directory does not exist: {args.output_dir}")
-        sys.exit(1)
+def write_archive(stream, meets_by_division, division_assignments, year, standings=None, split=False,
+                  team_pages=False):
+    """Writes the rendered season archive to an open text stream."""
+    stream.writelines(render_archive(meets_by_division, division_assignments, year, standings, split, team_pages))
+
+
+def generate_html(meets_by_division, division_assignments, year):
+    """Generates the final HTML output from the processed meet data as a single string."""
+    return ''.join(render_archive(meets_by_division, division_assignments, year))
+
+class ArchiveBuildError(Exception):
+    """Raised when a season archive cannot be built from its input directory."""
+
+
+# A season's parsed inputs: its year, division -> team abbreviations, and the
+# meets of each division sorted by date.
+SeasonData = namedtuple('SeasonData', ['year', 'division_assignments', 'meets_by_division'])
+
+
+def load_season(input_dir, non_interactive=False):
+    """
+    Reads a season's meet result files and division assignments (steps 1-5 of a build).
+
+    Args:
+        input_dir: Directory containing the season's meet result HTML files
+        non_interactive: Require divisions.csv instead of prompting
 
+    Returns:
+        SeasonData
+
+    Raises:
+        ArchiveBuildError: If the season cannot be loaded without user input.
+    """
     # Step 1: Auto-detect season year from filenames
     logging.info("="*80)
     logging.info("GPSA Season Archive Generator")
     logging.info("="*80)
     logging.info("\nStep 1: Detecting season year from filenames...")
 
-    year = detect_year_from_files(args.input_dir)
+    year = detect_year_from_files(input_dir)
     if year is None:
-        logging.error("Could not detect year from any files in the input directory.")
-        logging.error("Ensure files follow the naming pattern: YYYY-MM-DD_TEAM1_v_TEAM2.html")
-        sys.exit(1)
+        raise ArchiveBuildError(
+            "Could not detect year from any files in the input directory. "
+            "Ensure files follow the naming pattern: YYYY-MM-DD_TEAM1_v_TEAM2.html"
+        )
 
     # Step 2: Detect team clusters from meet results
     logging.info("\nStep 2: Analyzing meet results to detect team groupings...")
-    clusters = detect_team_clusters(args.input_dir, TEAM_NAME_MAP, FILENAME_ABBR_MAP)
+    clusters = detect_team_clusters(input_dir, TEAM_NAME_MAP, FILENAME_ABBR_MAP)
 
     if len(clusters) != 3:
         logging.warning(f"Expected 3 divisions but detected {len(clusters)} team clusters.")
         logging.warning("This may indicate incomplete meet data or unusual division structure.")
-        if not args.non_interactive:
+        if not non_interactive:
             response = input("\nDo you want to continue anyway? (y/n): ").strip().lower()
             if response != 'y':
                 logging.info("Operation cancelled by user.")
@@ -709,7 +953,7 @@ The script automatically detects:
     # Step 3: Load or prompt for division assignments
     logging.info("\nStep 3: Determining division assignments...")
 
-    csv_path = os.path.join(args.input_dir, 'divisions.csv')
+    csv_path = os.path.join(input_dir, 'divisions.csv')
     division_assignments = None
 
     # Try to load from CSV first
@@ -729,9 +973,8 @@ The script automatically detects:
 
             if missing:
                 logging.error(f"Teams in results but not in divisions.csv: {missing}")
-                if args.non_interactive:
-                    logging.error("Cannot proceed in non-interactive mode with missing team assignments.")
-                    sys.exit(1)
+                if non_interactive:
+                    raise ArchiveBuildError("Cannot proceed in non-interactive mode with missing team assignments.")
                 # In interactive mode, fall through to prompt
                 logging.info("Falling back to interactive division assignment...")
                 division_assignments = None
@@ -742,10 +985,11 @@ The script automatically detects:
 
     # Fall back to interactive prompt if needed
     if division_assignments is None:
-        if args.non_interactive:
-            logging.error("No valid divisions.csv found and --non-interactive specified.")
-            logging.error(f"Create a divisions.csv file at: {csv_path}")
-            sys.exit(1)
+        if non_interactive:
+            raise ArchiveBuildError(
+                f"No valid divisions.csv found and --non-interactive specified. "
+                f"Create a divisions.csv file at: {csv_path}"
+            )
 
         # Use interactive prompt
         division_assignments = prompt_division_assignment(clusters, TEAM_NAME_MAP)
@@ -756,10 +1000,11 @@ The script automatically detects:
     # Step 4: Process all meet files
     logging.info("\nStep 4: Processing meet result files...")
     all_meets = []
-    html_files = [f for f in os.listdir(args.input_dir) if f.endswith('.html')]
+    # Only meet pages; the archive's own pages (index, schedule and team pages) share the directory
+    html_files = [f for f in os.listdir(input_dir) if f.endswith('.html') and '_v_' in f]
 
     for i, filename in enumerate(html_files, 1):
-        file_path = os.path.join(args.input_dir, filename)
+        file_path = os.path.join(input_dir, filename)
         logging.debug(f"[{i}/{len(html_files)}] Processing {filename}")
 
         meet_data = parse_meet_file(file_path, TEAM_NAME_MAP, TEAM_SCHEDULE_NAME_MAP, FILENAME_ABBR_MAP)
@@ -786,21 +1031,266 @@ The script automatically detects:
         meets_by_division[division].sort(key=lambda x: x['date'])
         logging.info(f"  {division} Division: {len(meets_by_division[division])} meets")
 
-    # Step 6: Generate HTML archive
-    logging.info("\nStep 6: Generating HTML archive...")
-    final_html = generate_html(meets_by_division, division_assignments, year)
+    return SeasonData(year, division_assignments, meets_by_division)
+
+
+def render_season(input_dir):
+    """
+    Builds a season archive entirely in memory, without prompting or writing any files.
+
+    Returns:
+        The archive's index.html as a string.
+
+    Raises:
+        ArchiveBuildError: If the season cannot be built without user input.
+    """
+    season = load_season(input_dir, non_interactive=True)
+    standings = build_standings(season.meets_by_division, season.division_assignments)
+    return ''.join(render_archive(season.meets_by_division, season.division_assignments, season.year, standings))
+
 
-    # Step 7: Save output file
+def write_team_pages(output_dir, meets_by_division, division_assignments, standings, year):
+    """
+    Writes one season page per team in the division assignments.
+
+    Returns:
+        Number of team pages written.
+    """
+    meets_by_team = group_meets_by_team(meets_by_division)
+    written = 0
+    for division_name in ['Red', 'White', 'Blue']:
+        for team_abbr in division_assignments.get(division_name, []):
+            team_path = os.path.join(output_dir, TEAM_PAGE_FILENAME.format(team_abbr=team_abbr))
+            logging.debug(f"Writing {team_abbr} team page to: {team_path}")
+            with open(team_path, "w", encoding='utf-8') as file:
+                file.writelines(render_team_page(team_abbr, division_name, meets_by_team.get(team_abbr, []),
+                                                 standings, year))
+            written += 1
+    return written
+
+
+def build_season(input_dir, output_dir, non_interactive=False, split=False, team_pages=False):
+    """
+    Builds the season archive for a single results directory.
+
+    Args:
+        input_dir: Directory containing the season's meet result HTML files
+        output_dir: Directory where index.html will be written
+        non_interactive: Require divisions.csv instead of prompting
+        split: Write a standings-only index.html plus one lazy-loaded
+            schedule page per division
+        team_pages: Also write a season page per team (team-<ABBR>.html),
+            linked from the standings
+
+    Returns:
+        Dict summarizing the build (year, output path, meet counts per division).
+
+    Raises:
+        ArchiveBuildError: If the season cannot be built without user input.
+    """
+    year, division_assignments, meets_by_division = load_season(input_dir, non_interactive)
+
+    # Step 6: Calculate standings and save standings.json
+    logging.info("\nStep 6: Calculating standings...")
+    standings = build_standings(meets_by_division, division_assignments)
+    standings_path = os.path.join(output_dir, STANDINGS_FILENAME)
+    inverted_team_map = {v: k for k, v in TEAM_NAME_MAP.items()}
+    standings.write_json(standings_path, division_assignments, year, inverted_team_map)
+    logging.info(f"Wrote standings to: {standings_path}")
+
+    # Step 7: Generate and save HTML archive
+    logging.info("\nStep 7: Generating HTML archive...")
     output_filename = "index.html"
-    output_path = os.path.join(args.output_dir, output_filename)
+    output_path = os.path.join(output_dir, output_filename)
 
     logging.info(f"Writing output to: {output_path}")
     with open(output_path, "w", encoding='utf-8') as file:
-        file.write(final_html)
+        write_archive(file, meets_by_division, division_assignments, year, standings, split, team_pages)
+
+    if split:
+        for division_name in ['Red', 'White', 'Blue']:
+            schedule_filename = SCHEDULE_PAGE_FILENAME.format(division_id=division_name.lower())
+            schedule_path = os.path.join(output_dir, schedule_filename)
+            logging.info(f"Writing {division_name} Division schedule to: {schedule_path}")
+            with open(schedule_path, "w", encoding='utf-8') as file:
+                file.writelines(render_schedule_page(division_name, meets_by_division.get(division_name, []), year))
+
+    if team_pages:
+        team_count = write_team_pages(output_dir, meets_by_division, division_assignments, standings, year)
+        logging.info(f"Wrote {team_count} team pages to: {output_dir}")
 
     logging.info("\n" + "="*80)
     logging.info(f"✓ Successfully generated {output_filename}")
     logging.info("="*80)
 
+    return {
+        'year': year,
+        'output_path': output_path,
+        'meets': sum(len(meets) for meets in meets_by_division.values()),
+        'divisions': {division: len(meets) for division, meets in meets_by_division.items()}
+    }
+
+
+# --- Multi-Season Builds ---
+def discover_season_dirs(results_root):
+    """
+    Finds every season directory (named YYYY) directly under results_root.
+
+    Returns:
+        Sorted list of season directory paths.
+    """
+    season_dirs = []
+    with os.scandir(results_root) as entries:
+        for entry in entries:
+            if entry.is_dir() and len(entry.name) == 4 and entry.name.isdigit():
+                season_dirs.append(entry.path)
+    return sorted(season_dirs)
+
+
+def _build_season_worker(season_dir, split=False, team_pages=False):
+    """Process pool entry point: builds one season non-interactively and reports the outcome."""
+    outcome = {'season_dir': season_dir, 'status': 'failed', 'message': '', 'meets': 0}
+
+    if not os.path.exists(os.path.join(season_dir, 'divisions.csv')):
+        outcome['status'] = 'skipped'
+        outcome['message'] = 'divisions.csv not found'
+        return outcome
+
+    # A season that has divisions.csv but no results yet (pre-season) is not an error
+    if not any(f.endswith('.html') and '_v_' in f for f in os.listdir(season_dir)):
+        outcome['status'] = 'skipped'
+        outcome['message'] = 'no meet result files'
+        return outcome
+
+    try:
+        summary = build_season(season_dir, season_dir, non_interactive=True, split=split, team_pages=team_pages)
+        outcome['status'] = 'built'
+        outcome['meets'] = summary['meets']
+        outcome['message'] = summary['output_path']
+    except ArchiveBuildError as e:
+        outcome['message'] = str(e)
+    except Exception as e:
+        outcome['message'] = f"Unexpected error: {e}"
+
+    return outcome
+
+
+def build_all_seasons(results_root, jobs=None, verbose=False, split=False, team_pages=False):
+    """
+    Builds the archive for every season directory under results_root in a process pool.
+
+    Each season is built non-interactively from its own divisions.csv and written
+    back into its season directory. Seasons without divisions.csv are skipped.
+
+    Returns:
+        List of per-season outcome dicts, sorted by season directory.
+    """
+    season_dirs = discover_season_dirs(results_root)
+    if not season_dirs:
+        logging.warning(f"No season directories found under: {results_root}")
+        return []
+
+    logging.info(f"Building {len(season_dirs)} season(s) from {results_root}")
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=setup_logging, initargs=(verbose,)) as executor:
+        outcomes = list(executor.map(partial(_build_season_worker, split=split, team_pages=team_pages), season_dirs))
+
+    return sorted(outcomes, key=lambda outcome: outcome['season_dir'])
+
+
+def print_run_summary(outcomes):
+    """Logs a combined summary for a multi-season build."""
+    logging.info("\n" + "="*80)
+    logging.info("MULTI-SEASON BUILD SUMMARY")
+    logging.info("="*80)
+    for outcome in outcomes:
+        season = os.path.basename(outcome['season_dir'])
+        if outcome['status'] == 'built':
+            logging.info(f"  {season}: ✓ built ({outcome['meets']} meets) -> {outcome['message']}")
+        elif outcome['status'] == 'skipped':
+            logging.info(f"  {season}: - skipped ({outcome['message']})")
+        else:
+            logging.info(f"  {season}: ✗ failed ({outcome['message']})")
+
+    counts = defaultdict(int)
+    for outcome in outcomes:
+        counts[outcome['status']] += 1
+    logging.info("-"*80)
+    logging.info(f"Built: {counts['built']}  Skipped: {counts['skipped']}  Failed: {counts['failed']}")
+    logging.info("="*80)
+
+
+def main():
+    """Main function to process a directory of meet files and generate an archive."""
+    parser = argparse.ArgumentParser(
+        description="Generate a GPSA season archive from a directory of meet result files.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python build_archive.py -i results/2025
+  python build_archive.py -i results/2025 -o results/2025
+  python build_archive.py -i ../2024_results -o ./output --verbose
+  python build_archive.py --all results
+  python build_archive.py -i results/2025 -o results/2025 --team-pages
+
+The script automatically detects:
+  - Season year from meet filenames
+  - Division groupings based on which teams competed together
+        """
+    )
+    parser.add_argument('-i', '--input', dest='input_dir', type=str,
+                        help='Path to the directory containing meet result HTML files')
+    parser.add_argument('-o', '--output', dest='output_dir', type=str, default='.',
+                        help='Directory where the archive HTML will be saved (default: current directory)')
+    parser.add_argument('--all', dest='results_root', nargs='?', const='results', default=None,
+                        help='Build every YYYY season directory under RESULTS_ROOT (default: results) '
+                             'non-interactively, writing each archive into its season directory')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of worker processes for --all (default: CPU count)')
+    parser.add_argument('--split', action='store_true',
+                        help='Write a standings-only index.html plus per-division schedule pages loaded on demand')
+    parser.add_argument('--team-pages', action='store_true',
+                        help='Also write a season page per team (team-<ABBR>.html) linked from the standings')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    parser.add_argument('--non-interactive', action='store_true',
+                        help='Run without prompts (requires divisions.csv in input directory)')
+    args = parser.parse_args()
+
+    if bool(args.input_dir) == bool(args.results_root):
+        parser.error("specify exactly one of -i/--input or --all")
+
+    # Setup logging
+    setup_logging(verbose=args.verbose)
+
+    if args.results_root:
+        if not os.path.isdir(args.results_root):
+            logging.error(f"Results directory does not exist: {args.results_root}")
+            sys.exit(1)
+
+        outcomes = build_all_seasons(args.results_root, jobs=args.jobs, verbose=args.verbose, split=args.split,
+                                     team_pages=args.team_pages)
+        print_run_summary(outcomes)
+        if any(outcome['status'] == 'failed' for outcome in outcomes):
+            sys.exit(1)
+        return
+
+    # Validate input directory
+    if not os.path.isdir(args.input_dir):
+        logging.error(f"Input directory does not exist: {args.input_dir}")
+        sys.exit(1)
+
+    # Validate output directory
+    if not os.path.isdir(args.output_dir):
+        logging.error(f"Output directory does not exist: {args.output_dir}")
+        sys.exit(1)
+
+    try:
+        build_season(args.input_dir, args.output_dir, non_interactive=args.non_interactive, split=args.split,
+                     team_pages=args.team_pages)
+    except ArchiveBuildError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
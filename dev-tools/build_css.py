@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+GPSA Static Stylesheet Builder
+Builds a small, purged utility stylesheet for the pages generated by the dev tools.
+
+The generators used to load the Tailwind CDN runtime, which compiles CSS in the
+visitor's browser on every page view. This script does that work once, offline:
+it scans the generator templates for the utility classes they actually use and
+writes only the matching rules to css/gpsa-utilities.css.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+# --- Configuration ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+
+# Output stylesheet, relative to the repository root.
+UTILITY_CSS_RELPATH = 'css/gpsa-utilities.css'
+
+# Generator sources scanned for class attributes (the "content" to purge against).
+TEMPLATE_SOURCES = [
+    os.path.join(SCRIPT_DIR, 'build_archive.py'),
+    os.path.join(SCRIPT_DIR, 'generate_index.py'),
+]
+
+# Classes styled by the generators' own embedded CSS or by gpsa-tools-common.css.
+CUSTOM_CLASSES = {
+    'gpsa-header', 'gpsa-header-subtitle', 'no-print',
+    'table-header', 'table-cell', 'table-text', 'table-date', 'date-full', 'date-abbr',
+    'directory-item', 'directory-icon', 'schedule-content',
+}
+
+# Responsive breakpoints (min-width), matching Tailwind's defaults.
+BREAKPOINTS = [('sm', 640), ('md', 768), ('lg', 1024), ('xl', 1280), ('2xl', 1536)]
+
+# GPSA brand colors (previously supplied through tailwind.config).
+GPSA_COLORS = {
+    'gpsa-blue': '#002366',
+    'gpsa-blue-light': '#0033a0',
+    'gpsa-red': '#d9242b',
+}
+
+# Subset of Tailwind's preflight reset that the generated pages rely on.
+PREFLIGHT = """*, ::before, ::after { box-sizing: border-box; border-width: 0; border-style: solid; border-color: #e5e7eb; }
+html { line-height: 1.5; -webkit-text-size-adjust: 100%; tab-size: 4; font-family: 'Inter', ui-sans-serif, system-ui, sans-serif; }
+body { margin: 0; line-height: inherit; }
+h1, h2, h3, p, ul { margin: 0; }
+h1, h2, h3 { font-size: inherit; font-weight: inherit; }
+ul { list-style: none; padding: 0; }
+a { color: inherit; text-decoration: inherit; }
+strong { font-weight: bolder; }
+table { text-indent: 0; border-color: inherit; border-collapse: collapse; }
+img { display: block; max-width: 100%; height: auto; }
+"""
+
+# Utility class -> declarations. A tuple value supplies a selector template
+# for utilities that target children rather than the element itself.
+UTILITY_RULES = {
+    'container': 'width: 100%;',
+    'mx-auto': 'margin-left: auto; margin-right: auto;',
+    'ml-auto': 'margin-left: auto;',
+    'my-8': 'margin-top: 2rem; margin-bottom: 2rem;',
+    'mb-4': 'margin-bottom: 1rem;',
+    'mb-6': 'margin-bottom: 1.5rem;',
+    'mb-8': 'margin-bottom: 2rem;',
+    'mr-4': 'margin-right: 1rem;',
+    'mt-4': 'margin-top: 1rem;',
+    'mt-6': 'margin-top: 1.5rem;',
+    'p-3': 'padding: 0.75rem;',
+    'p-4': 'padding: 1rem;',
+    'p-6': 'padding: 1.5rem;',
+    'p-8': 'padding: 2rem;',
+    'py-8': 'padding-top: 2rem; padding-bottom: 2rem;',
+    'space-y-2': ('{} > :not([hidden]) ~ :not([hidden])', 'margin-top: 0.5rem;'),
+    'max-w-7xl': 'max-width: 80rem;',
+    'flex': 'display: flex;',
+    'flex-wrap': 'flex-wrap: wrap;',
+    'items-center': 'align-items: center;',
+    'justify-center': 'justify-content: center;',
+    'justify-around': 'justify-content: space-around;',
+    'justify-end': 'justify-content: flex-end;',
+    'gap-2': 'gap: 0.5rem;',
+    'gap-4': 'gap: 1rem;',
+    'h-16': 'height: 4rem;',
+    'h-20': 'height: 5rem;',
+    'w-16': 'width: 4rem;',
+    'w-20': 'width: 5rem;',
+    'w-full': 'width: 100%;',
+    'w-1/5': 'width: 20%;',
+    'w-1/12': 'width: 8.333333%;',
+    'min-w-full': 'min-width: 100%;',
+    'overflow-x-auto': 'overflow-x: auto;',
+    'rounded-lg': 'border-radius: 0.5rem;',
+    'rounded-xl': 'border-radius: 0.75rem;',
+    'rounded-full': 'border-radius: 9999px;',
+    'border': 'border-width: 1px;',
+    'border-b': 'border-bottom-width: 1px;',
+    'border-black': 'border-color: #000;',
+    'border-gray-200': 'border-color: #e5e7eb;',
+    'border-collapse': 'border-collapse: collapse;',
+    'shadow-md': 'box-shadow: 0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1);',
+    'shadow-lg': 'box-shadow: 0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1);',
+    'bg-white': 'background-color: #fff;',
+    'text-sm': 'font-size: 0.875rem; line-height: 1.25rem;',
+    'text-base': 'font-size: 1rem; line-height: 1.5rem;',
+    'text-lg': 'font-size: 1.125rem; line-height: 1.75rem;',
+    'text-xl': 'font-size: 1.25rem; line-height: 1.75rem;',
+    'text-2xl': 'font-size: 1.5rem; line-height: 2rem;',
+    'text-3xl': 'font-size: 1.875rem; line-height: 2.25rem;',
+    'text-4xl': 'font-size: 2.25rem; line-height: 2.5rem;',
+    'font-medium': 'font-weight: 500;',
+    'font-semibold': 'font-weight: 600;',
+    'font-bold': 'font-weight: 700;',
+    'text-left': 'text-align: left;',
+    'text-center': 'text-align: center;',
+    'align-middle': 'vertical-align: middle;',
+    'underline': 'text-decoration-line: underline;',
+    'text-white': 'color: #fff;',
+    'text-gray-500': 'color: #6b7280;',
+    'text-gray-700': 'color: #374151;',
+    'transition-colors': 'transition-property: color, background-color, border-color, text-decoration-color, fill, stroke; '
+                         'transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1); transition-duration: 150ms;',
+    'duration-300': 'transition-duration: 300ms;',
+    'cursor-pointer': 'cursor: pointer;',
+}
+for _name, _hex in GPSA_COLORS.items():
+    UTILITY_RULES[f'text-{_name}'] = f'color: {_hex};'
+    UTILITY_RULES[f'bg-{_name}'] = f'background-color: {_hex};'
+
+# The container's max-width steps up at each breakpoint.
+CONTAINER_MAX_WIDTHS = {'sm': '640px', 'md': '768px', 'lg': '1024px', 'xl': '1280px', '2xl': '1536px'}
+
+CLASS_ATTR_PATTERN = re.compile(r'''class=(["'])(.*?)\1''')
+
+
+def collect_classes(source_paths):
+    """
+    Collects every class name used in class="..." attributes of the given source files.
+
+    Tokens that contain template placeholders are ignored.
+
+    Returns:
+        Set of class names.
+    """
+    classes = set()
+    for path in source_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for match in CLASS_ATTR_PATTERN.finditer(f.read()):
+                for token in match.group(2).split():
+                    if '{' not in token and '}' not in token:
+                        classes.add(token)
+    return classes
+
+
+def _escape_class(name):
+    """Escapes a class name for use in a CSS selector (e.g. sm:p-6 -> sm\\:p-6)."""
+    return re.sub(r'([:/.])', r'\\\1', name)
+
+
+def _rule(class_name, utility, pseudo=''):
+    """Formats the CSS rule for a (possibly variant-prefixed) class name."""
+    spec = UTILITY_RULES[utility]
+    selector = f'.{_escape_class(class_name)}{pseudo}'
+    if isinstance(spec, tuple):
+        template, declarations = spec
+        selector = template.format(selector)
+    else:
+        declarations = spec
+    return f'{selector} {{ {declarations} }}'
+
+
+def build_stylesheet(class_names):
+    """
+    Builds the purged stylesheet for the given class names.
+
+    Base utilities come first, then hover variants, then one media query per
+    breakpoint, mirroring Tailwind's ordering so responsive classes win.
+
+    Returns:
+        Tuple (css_text: str, unknown_classes: set)
+    """
+    base, hover = [], []
+    responsive = {prefix: [] for prefix, _ in BREAKPOINTS}
+    unknown = set()
+
+    for class_name in sorted(class_names):
+        if class_name in CUSTOM_CLASSES:
+            continue
+
+        prefix, _, utility = class_name.rpartition(':')
+        if utility not in UTILITY_RULES:
+            unknown.add(class_name)
+        elif not prefix:
+            base.append(_rule(class_name, utility))
+        elif prefix == 'hover':
+            hover.append(_rule(class_name, utility, ':hover'))
+        elif prefix in responsive:
+            responsive[prefix].append(_rule(class_name, utility))
+        else:
+            unknown.add(class_name)
+
+    parts = [
+        '/**',
+        ' * GPSA Generated Page Utilities',
+        ' * Built by dev-tools/build_css.py from the classes used in the generator templates.',
+        ' * Do not edit by hand; re-run the script after changing template classes.',
+        ' */',
+        '',
+        PREFLIGHT,
+    ]
+    parts.extend(base)
+    parts.extend(hover)
+
+    for prefix, min_width in BREAKPOINTS:
+        rules = responsive[prefix]
+        if 'container' in class_names:
+            rules = [f'.container {{ max-width: {CONTAINER_MAX_WIDTHS[prefix]}; }}'] + rules
+        if rules:
+            parts.append(f'@media (min-width: {min_width}px) {{')
+            parts.extend(f'  {rule}' for rule in rules)
+            parts.append('}')
+
+    return '\n'.join(parts) + '\n', unknown
+
+
+def load_utility_css(repo_root=REPO_ROOT):
+    """
+    Returns the prebuilt utility stylesheet text, building it in memory if the file is missing.
+    """
+    css_path = os.path.join(repo_root, UTILITY_CSS_RELPATH)
+    if os.path.exists(css_path):
+        with open(css_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    css_text, _ = build_stylesheet(collect_classes(TEMPLATE_SOURCES))
+    return css_text
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Build the purged utility stylesheet used by generated GPSA pages.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/build_css.py
+  python dev-tools/build_css.py -o /tmp/gpsa-utilities.css
+        """
+    )
+    parser.add_argument('-o', '--output', type=str,
+                        default=os.path.join(REPO_ROOT, UTILITY_CSS_RELPATH),
+                        help=f'Output stylesheet path (default: {UTILITY_CSS_RELPATH} in the repository)')
+    args = parser.parse_args()
+
+    class_names = collect_classes(TEMPLATE_SOURCES)
+    css_text, unknown = build_stylesheet(class_names)
+
+    if unknown:
+        print(f"❌ No utility rule defined for: {', '.join(sorted(unknown))}")
+        print("   Add them to UTILITY_RULES (or CUSTOM_CLASSES) in build_css.py.")
+        return 1
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(css_text)
+
+    print(f"✅ Wrote {len(class_names)} classes ({len(css_text.encode('utf-8'))} bytes) to '{args.output}'")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
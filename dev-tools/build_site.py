@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+GPSA Site Build
+Publishes meet results end to end, rebuilding only what is out of date.
+
+Publishing a meet night used to mean running bulk_process_results.py, then
+build_archive.py for each affected season, then generate_index.py, each of them
+rebuilding everything. This script models those steps as one dependency graph:
+
+    .sd3 file (or .sd3 inside a .zip)    ->  meet page      results/YYYY/<date>_<HOME>_v_<AWAY>.html
+    meet pages + divisions.csv           ->  season archive results/YYYY/index.html (+ standings.json)
+    season folders                       ->  directory index results/index.html
+
+Each node fingerprints its inputs (size and modification time) and records them
+in .build-state.json at the repository root after it is built, together with
+the archive options (--split, --team-pages) for season nodes. On the next run
+only nodes whose inputs or options changed, whose outputs are missing, or whose
+upstream nodes are being rebuilt are run. Independent nodes of the same stage run in
+parallel.
+
+Only the results/ listing page is regenerated, never the season folders'
+index.html, which are the season archives.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from build_archive import _build_season_worker, discover_season_dirs, setup_logging
+from bulk_process_results import HTMLGenerator, SDIFParser, decode_sdif, generate_filename, sdif_fingerprint
+from generate_index import (OUTPUT_FILE, calculate_relative_path_to_css, directory_listing,
+                            find_repository_root, generate_index_for_single_directory,
+                            load_manifest, save_manifest, scan_directories)
+
+# --- Configuration ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+
+# Build state kept at the repository root (hidden, so never listed on index pages).
+STATE_FILENAME = '.build-state.json'
+STATE_VERSION = 2
+
+# A stale meet node: where its SDIF comes from (a .sd3 path, optionally a member of a
+# .zip), the fingerprint of that source, the parsed meet and the page it produces.
+MeetNode = namedtuple('MeetNode', ['key', 'source', 'member', 'fingerprint', 'data', 'output_path', 'reason'])
+
+# A stale season node: the season directory, the reason it is stale.
+SeasonNode = namedtuple('SeasonNode', ['season_dir', 'reason'])
+
+# The results/ listing node: the results directory, the reason it is stale.
+IndexNode = namedtuple('IndexNode', ['results_dir', 'reason'])
+
+# failures counts meet sources that could not be planned (unreadable, unnamed or colliding).
+BuildPlan = namedtuple('BuildPlan', ['meets', 'seasons', 'index', 'up_to_date', 'failures'])
+
+
+def load_state(state_path):
+    """
+    Loads the build state file.
+
+    Returns:
+        Dict with "meets" and "seasons" maps (empty if missing, unreadable or outdated).
+    """
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': STATE_VERSION, 'meets': {}, 'seasons': {}}
+
+
+def save_state(state_path, state):
+    """Writes the build state file."""
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def archive_options(split=False, team_pages=False):
+    """The build_archive.py options a season archive was built with, as recorded in the build state."""
+    return {'split': split, 'team_pages': team_pages}
+
+
+def file_fingerprint(path):
+    """Returns [size, mtime_ns] for a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def season_fingerprint(season_dir):
+    """
+    Fingerprints a season's archive inputs: divisions.csv and every meet result page.
+
+    Returns:
+        Dict mapping file name -> [size, mtime_ns].
+    """
+    fingerprint = {}
+    with os.scandir(season_dir) as entries:
+        for entry in entries:
+            if entry.name == 'divisions.csv' or (entry.name.endswith('.html') and '_v_' in entry.name):
+                stat = entry.stat()
+                fingerprint[entry.name] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def discover_sources(input_dir):
+    """
+    Lists the SDIF sources in an input directory without modifying it.
+
+    .sd3 files are used directly and the .sd3 members of .zip files are read in
+    place (unlike bulk_process_results.py, archives are neither extracted nor deleted).
+
+    Returns:
+        Sorted list of (key, source path, zip member or None) tuples.
+    """
+    sources = []
+    for name in sorted(os.listdir(input_dir)):
+        path = os.path.join(input_dir, name)
+        lower = name.lower()
+        if lower.endswith('.sd3'):
+            sources.append((os.path.abspath(path), path, None))
+        elif lower.endswith('.zip'):
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    members = [m for m in archive.namelist() if m.lower().endswith('.sd3')]
+            except zipfile.BadZipFile:
+                logging.error(f"Invalid zip file: {name}")
+                continue
+            for member in members:
+                sources.append((f"{os.path.abspath(path)}:{member}", path, member))
+    return sources
+
+
+def read_source(source, member=None):
+    """Reads an SDIF source (a .sd3 file or a .sd3 member of a .zip) as text."""
+    if member is None:
+        with open(source, 'rb') as f:
+            raw = f.read()
+    else:
+        with zipfile.ZipFile(source) as archive:
+            raw = archive.read(member)
+    return decode_sdif(raw)
+
+
+def meet_output_path(data, results_dir):
+    """
+    Derives a meet page's output path, using bulk_process_results.py's naming rules.
+
+    Returns:
+        The output path, or None if no file name could be derived.
+    """
+    filename, year = generate_filename(data)
+    if not filename:
+        return None
+    return os.path.join(results_dir, str(year), filename) if year else os.path.join(results_dir, filename)
+
+
+def write_meet_page(data, output_path):
+    """Renders one parsed meet and writes its page (process pool entry point)."""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(HTMLGenerator.generate(data))
+    return output_path
+
+
+def plan_build(results_dir, input_dir, state, force=False, options=None):
+    """
+    Works out which nodes of the graph are stale.
+
+    Stale meet sources are parsed here (parsing is cheap) so the plan knows which
+    season each new meet lands in; rendering is left to the build. As in
+    bulk_process_results.py, sources with the same content (sdif_fingerprint)
+    are built once, and a source whose page is already claimed by different
+    content (an up-to-date source, or an earlier stale one) is a collision: it
+    is not built and counts as a failure, like a source that cannot be read.
+
+    Args:
+        results_dir: The results/ directory
+        input_dir: Directory of .sd3/.zip files, or None to skip the meet stage
+        state: Build state from load_state()
+        force: Treat every node as stale
+        options: archive_options() for this build; seasons built with other options are stale
+
+    Returns:
+        BuildPlan
+    """
+    options = options if options is not None else archive_options()
+    meets = []
+    up_to_date = 0
+    failures = 0
+    touched_seasons = {}
+
+    if input_dir:
+        stale = []
+        # Output path -> [content fingerprint (None until needed), key, source, member] of the source that owns it
+        claimed = {}
+        for key, source, member in discover_sources(input_dir):
+            fingerprint = file_fingerprint(source)
+            recorded = state['meets'].get(key)
+
+            if recorded is None:
+                reason = 'new source'
+            elif recorded['fingerprint'] != fingerprint:
+                reason = 'source changed'
+            elif not os.path.exists(recorded['output']):
+                reason = 'output missing'
+            elif force:
+                reason = 'forced'
+            else:
+                up_to_date += 1
+                claimed[recorded['output']] = [None, key, source, member]
+                continue
+            stale.append((key, source, member, fingerprint, reason))
+
+        seen_content = {}
+        for key, source, member, fingerprint, reason in stale:
+            name = os.path.basename(key)
+            try:
+                text = read_source(source, member)
+                content = sdif_fingerprint(text)
+                data = SDIFParser().parse(text)
+            except Exception as e:
+                logging.error(f"Could not read {name}: {e}")
+                failures += 1
+                continue
+
+            if content in seen_content:
+                logging.info(f"Skipping {name}: same meet content as {seen_content[content]}")
+                continue
+            seen_content[content] = name
+
+            output_path = meet_output_path(data, results_dir)
+            if output_path is None:
+                logging.error(f"Could not derive a meet page name for {name}")
+                failures += 1
+                continue
+
+            owner = claimed.get(output_path)
+            if owner is not None:
+                if owner[0] is None:
+                    try:
+                        owner[0] = sdif_fingerprint(read_source(owner[2], owner[3]))
+                    except Exception:
+                        owner[0] = ''  # Unreadable now: keep its page rather than guess
+                owner_name = os.path.basename(owner[1])
+                if owner[0] == content:
+                    logging.info(f"Skipping {name}: same meet content as {owner_name}")
+                    continue
+                logging.error(f"Collision: {name} and {owner_name} both produce {os.path.relpath(output_path)} "
+                              f"with different results; keeping {owner_name}, skipping {name}")
+                failures += 1
+                continue
+            claimed[output_path] = [content, key, source, member]
+
+            meets.append(MeetNode(key, source, member, fingerprint, data, output_path, reason))
+            touched_seasons.setdefault(os.path.dirname(output_path), f"meet page {os.path.basename(output_path)}")
+
+    seasons = []
+    season_dirs = set(discover_season_dirs(results_dir)) | set(touched_seasons)
+    for season_dir in sorted(season_dirs):
+        if not os.path.exists(os.path.join(season_dir, 'divisions.csv')):
+            if season_dir in touched_seasons:
+                logging.warning(f"No divisions.csv in {season_dir}; its archive will not be built")
+            continue
+
+        recorded = state['seasons'].get(season_dir)
+        fingerprint = season_fingerprint(season_dir)
+        has_meets = any('_v_' in name for name in fingerprint)
+
+        if season_dir in touched_seasons:
+            reason = touched_seasons[season_dir]
+        elif not has_meets:
+            continue  # Pre-season: nothing to archive yet
+        elif recorded is None:
+            reason = 'not built before'
+        elif recorded['fingerprint'] != fingerprint:
+            reason = 'meet pages or divisions.csv changed'
+        elif recorded.get('options') != options:
+            reason = 'archive options changed'
+        elif not os.path.exists(os.path.join(season_dir, 'index.html')):
+            reason = 'archive missing'
+        elif force:
+            reason = 'forced'
+        else:
+            up_to_date += 1
+            continue
+
+        seasons.append(SeasonNode(season_dir, reason))
+
+    index = None
+    new_dirs = sorted(os.path.basename(d) for d in touched_seasons if not os.path.isdir(d))
+    repo_root = find_repository_root(results_dir)
+    key = os.path.relpath(os.path.abspath(results_dir), repo_root).replace('\\', '/')
+    scan = next(scan_directories(results_dir, key, ''))
+    listing = directory_listing(scan.subdirs + new_dirs, scan.files)
+
+    if new_dirs:
+        index = IndexNode(results_dir, f"new season folder {', '.join(new_dirs)}")
+    elif OUTPUT_FILE not in scan.files:
+        index = IndexNode(results_dir, 'index missing')
+    elif load_manifest(repo_root)['directories'].get(key) != listing:
+        index = IndexNode(results_dir, 'listing changed')
+    elif force:
+        index = IndexNode(results_dir, 'forced')
+    else:
+        up_to_date += 1
+
+    return BuildPlan(meets, seasons, index, up_to_date, failures)
+
+
+def print_plan(plan):
+    """Logs the nodes a build would run, one line per node."""
+    for node in plan.meets:
+        source = os.path.basename(node.source) + (f":{node.member}" if node.member else '')
+        logging.info(f"  meet    {os.path.relpath(node.output_path)}  <-  {source}  ({node.reason})")
+    for node in plan.seasons:
+        logging.info(f"  season  {os.path.relpath(os.path.join(node.season_dir, 'index.html'))}  ({node.reason})")
+    if plan.index:
+        logging.info(f"  index   {os.path.relpath(os.path.join(plan.index.results_dir, OUTPUT_FILE))}  ({plan.index.reason})")
+
+    stale = len(plan.meets) + len(plan.seasons) + (1 if plan.index else 0)
+    logging.info(f"{stale} node(s) to build, {plan.up_to_date} up to date")
+    if plan.failures:
+        logging.error(f"{plan.failures} meet source(s) failed to plan")
+
+
+def run_stage(func, args_list, jobs, verbose):
+    """
+    Runs one stage of independent nodes.
+
+    A single node runs in this process, which avoids the process pool start-up
+    cost and keeps a one-meet update fast; larger stages fan out across processes.
+
+    Returns:
+        List of results in the order of args_list.
+    """
+    if len(args_list) <= 1 or jobs == 1:
+        return [func(*args) for args in args_list]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=setup_logging, initargs=(verbose,)) as executor:
+        return list(executor.map(func, *zip(*args_list)))
+
+
+def build_index(results_dir):
+    """Regenerates the results/ listing page and records it in generate_index.py's manifest."""
+    repo_root = find_repository_root(results_dir)
+    key = os.path.relpath(os.path.abspath(results_dir), repo_root).replace('\\', '/')
+    prefix = calculate_relative_path_to_css(results_dir, repo_root)
+    scan = next(scan_directories(results_dir, key, prefix))
+
+    if not generate_index_for_single_directory(scan.path, scan.subdirs, scan.files, repo_root,
+                                               scan.rel_to_root, scan.key, scan.file_entries):
+        return False
+
+    manifest = load_manifest(repo_root)
+    manifest['directories'][key] = directory_listing(scan.subdirs, scan.files)
+    save_manifest(repo_root, manifest)
+    return True
+
+
+def run_build(plan, state, jobs=None, verbose=False, split=False, team_pages=False):
+    """
+    Runs the stale nodes stage by stage (meets, then seasons, then the index),
+    recording each successful node in the build state.
+
+    Returns:
+        Number of failed nodes.
+    """
+    failures = 0
+
+    if plan.meets:
+        logging.info(f"\nBuilding {len(plan.meets)} meet page(s)...")
+        written = run_stage(write_meet_page, [(node.data, node.output_path) for node in plan.meets], jobs, verbose)
+        for node, output_path in zip(plan.meets, written):
+            logging.info(f"  Generated: {os.path.relpath(output_path)}")
+            state['meets'][node.key] = {'fingerprint': node.fingerprint, 'output': output_path}
+
+    if plan.seasons:
+        logging.info(f"\nBuilding {len(plan.seasons)} season archive(s)...")
+        outcomes = run_stage(_build_season_worker, [(node.season_dir, split, team_pages) for node in plan.seasons],
+                             jobs, verbose)
+        for outcome in outcomes:
+            season_dir = outcome['season_dir']
+            if outcome['status'] == 'failed':
+                logging.error(f"  {os.path.basename(season_dir)}: {outcome['message']}")
+                failures += 1
+                continue
+            state['seasons'][season_dir] = {'fingerprint': season_fingerprint(season_dir),
+                                            'options': archive_options(split, team_pages)}
+
+    if plan.index:
+        logging.info("\nRegenerating the results index...")
+        if not build_index(plan.index.results_dir):
+            failures += 1
+
+    return failures
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Build meet pages, season archives and the results index, running only stale steps.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/build_site.py -i ~/meet_night
+  python dev-tools/build_site.py -i ~/meet_night --dry-run
+  python dev-tools/build_site.py                    # seasons and index only
+  python dev-tools/build_site.py -i ./sd3 -r results --jobs 4 --split
+        """
+    )
+    parser.add_argument('-i', '--input', dest='input_dir', type=str, default=None,
+                        help='Directory containing .sd3 and/or .zip files (omit to rebuild seasons and the index only)')
+    parser.add_argument('-r', '--results', dest='results_dir', type=str,
+                        default=os.path.join(REPO_ROOT, 'results'),
+                        help='Results directory (default: results/ in the repository)')
+    parser.add_argument('--state', type=str, default=os.path.join(REPO_ROOT, STATE_FILENAME),
+                        help=f'Build state file (default: {STATE_FILENAME} in the repository root)')
+    parser.add_argument('-n', '--dry-run', action='store_true',
+                        help='Print the stale nodes and exit without building anything')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild every node regardless of the build state')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Worker processes per stage (default: CPU count)')
+    parser.add_argument('--split', action='store_true',
+                        help='Build season archives with per-division schedule pages (see build_archive.py --split)')
+    parser.add_argument('--team-pages', action='store_true',
+                        help='Also write a season page per team (see build_archive.py --team-pages)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    if not os.path.isdir(args.results_dir):
+        logging.error(f"Results directory does not exist: {args.results_dir}")
+        sys.exit(1)
+    if args.input_dir and not os.path.isdir(args.input_dir):
+        logging.error(f"Input directory does not exist: {args.input_dir}")
+        sys.exit(1)
+
+    results_dir = os.path.abspath(args.results_dir)
+    state = load_state(args.state)
+    plan = plan_build(results_dir, args.input_dir, state, force=args.force,
+                      options=archive_options(args.split, args.team_pages))
+
+    logging.info("Build plan:")
+    print_plan(plan)
+    if args.dry_run:
+        if plan.failures:
+            sys.exit(1)
+        return
+
+    try:
+        failures = plan.failures + run_build(plan, state, jobs=args.jobs, verbose=args.verbose, split=args.split,
+                             team_pages=args.team_pages)
+    finally:
+        # Keep the progress of completed nodes even if a later stage crashed
+        save_state(args.state, state)
+
+    if failures:
+        logging.error(f"{failures} node(s) failed")
+        sys.exit(1)
+    logging.info("\nBuild complete.")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,29 +3,69 @@
 GPSA Bulk Meet Results Processor
 Processes SDIF (.sd3) files and generates formatted HTML result pages.
 Supports .zip file extraction and automatic year-based organization.
+
+Besides the command line, the module can be imported as a library (importing
+it has no side effects; logging is only configured by main()):
+
+    from bulk_process_results import process_sdif, iter_sdif_sources, process_many
+
+    meet = process_sdif(open('meet.sd3', 'rb').read())
+    meet.filename, meet.year, meet.html, meet.summary
+
+    for result in process_many(iter_sdif_sources(['incoming/', 'night.zip'])):
+        ...
+
+Large multi-team meets can instead be split into an index page plus per-team
+and per-event pages (--invitational, or process_invitational() in code).
 """
 
 import argparse
+import functools
+import hashlib
+import html
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+import traceback
 import zipfile
+from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bulk_process_results.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from event_catalog import EventCatalog, EventKey, default_catalog
+from sdif_layout import default_layout
+
+
 logger = logging.getLogger(__name__)
 
+LOG_FILE = 'bulk_process_results.log'
+
+# Items buffered between pipeline stages (bounds memory regardless of batch size).
+DEFAULT_QUEUE_DEPTH = 8
+
+# Records left out of content fingerprints: A0 (file description, which carries
+# the export date and software) and Z0 (file terminator with record counts).
+FINGERPRINT_SKIP_CODES = ('A0', 'Z0')
+
+# Run journal kept in the output directory (hidden, one JSON object per line).
+JOURNAL_FILENAME = '.bulk_process_journal.jsonl'
+
+# Line numbers kept per (record code, error kind) in parse diagnostics.
+MAX_DIAGNOSTIC_SAMPLES = 3
+
+# Invitational mode: landing page inside each meet's directory, and the
+# characters allowed in per-team page names.
+INVITATIONAL_INDEX = 'index.html'
+PAGE_NAME_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_')
+
+# Marks the end of a pipeline stage's input.
+_END_OF_STREAM = object()
+
 
 # SDIF Constants
 STROKE_MAP = {
@@ -47,10 +87,95 @@ GENDER_MAP = {
 LOGO_URL = 'https://publicity.gpsaswimming.org/assets/gpsa_logo.png'
 
 
-class SDIFParser:
-    """Parses SDIF format swim meet data files."""
+class ParseDiagnostics:
+    """
+    Counts problems found while parsing, keyed by (record code, error kind).
+
+    Malformed records are tallied instead of logged one by one, so a corrupt
+    export costs parse time rather than thousands of log writes. A few sample
+    line numbers and the first message are kept per key for reporting.
+    """
 
     def __init__(self):
+        self.counts: Counter = Counter()
+        self.samples: Dict[Tuple[str, str], List[int]] = {}
+        self.messages: Dict[Tuple[str, str], str] = {}
+
+    def record(self, code: str, kind: str, line_number: int, message: str = ''):
+        """Count one problem on a 1-based line number."""
+        key = (code, kind)
+        self.counts[key] += 1
+        samples = self.samples.setdefault(key, [])
+        if len(samples) < MAX_DIAGNOSTIC_SAMPLES:
+            samples.append(line_number)
+        if message and key not in self.messages:
+            self.messages[key] = message
+
+    def merge(self, other: 'ParseDiagnostics'):
+        """Add another file's counts (samples and messages are kept per file)."""
+        self.counts.update(other.counts)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def __bool__(self):
+        return bool(self.counts)
+
+    def describe(self) -> str:
+        """One-line summary, e.g. 'D0 ValueError x12 (lines 40, 41, 57: invalid literal...)'."""
+        parts = []
+        for (code, kind), count in self.counts.most_common():
+            detail = ''
+            samples = self.samples.get((code, kind))
+            if samples:
+                detail = f"lines {', '.join(map(str, samples))}"
+            message = self.messages.get((code, kind))
+            if message:
+                detail = f"{detail}: {message}" if detail else message
+            parts.append(f"{code} {kind} x{count}" + (f" ({detail})" if detail else ''))
+        return '; '.join(parts)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable form: {'total': n, 'issues': [{'code', 'kind', 'count', 'lines', 'message'}]}."""
+        return {
+            'total': self.total,
+            'issues': [
+                {'code': code, 'kind': kind, 'count': count,
+                 'lines': self.samples.get((code, kind), []),
+                 'message': self.messages.get((code, kind), '')}
+                for (code, kind), count in self.counts.most_common()
+            ]
+        }
+
+
+class SDIFParser:
+    """
+    Parses SDIF format swim meet data files.
+
+    Each event is tagged with its canonical id from the event catalog
+    ('eventId'; see event_catalog.py), the shared default catalog unless
+    another one is given. Record columns come from lib/sdif-layout.json, which
+    lib/publicity-core.js reads too (see sdif_layout.py).
+    """
+
+    def __init__(self, catalog: Optional[EventCatalog] = None):
+        self.catalog = catalog if catalog is not None else default_catalog()
+        self.layout = default_layout()
+        # Field extractors compiled from the layout, one call per record
+        records = self.layout.records
+        self._b1 = records['B1'].getter('meetName', 'startDate')
+        self._b2 = records['B2'].getter('hostName')
+        self._c1 = records['C1'].getter('teamCode', 'teamName')
+        self._d0 = records['D0'].getter('eventNumber', 'swimmerName', 'finalTime', 'place', 'points')
+        self._d0_swimmer = records['D0'].getter('swimmerId', 'age')
+        self._d0_event = records['D0'].getter('gender', 'ageCode', 'distance', 'stroke')
+        self._e0 = records['E0'].getter('eventNumber', 'relayTeam', 'finalTime', 'place', 'points')
+        self._e0_event = records['E0'].getter('gender', 'ageCode', 'distance', 'stroke')
+        self._f0 = records['F0'].getter('swimmerName')
+        self._min_length = {code: record.min_length for code, record in records.items()}
+        self.diagnostics = ParseDiagnostics()
+        self.line_number = 0
         self.meet = {}
         self.teams = {}
         self.events = {}
@@ -61,11 +186,12 @@ class SDIFParser:
         """Parse SDIF file content and return structured data."""
         lines = content.split('\n')
 
-        for line in lines:
+        record_code = self.layout.record_code
+        for self.line_number, line in enumerate(lines, 1):
             if len(line) < 2:
                 continue
 
-            code = line[0:2]
+            code = line[record_code]
 
             try:
                 if code == 'B1':
@@ -81,7 +207,7 @@ class SDIFParser:
                 elif code == 'F0':
                     self._parse_f0(line)
             except Exception as e:
-                logger.warning(f"Error parsing line (code {code}): {str(e)}")
+                self.diagnostics.record(code, type(e).__name__, self.line_number, str(e))
                 continue
 
         # Generate meet title for dual meets
@@ -94,24 +220,27 @@ class SDIFParser:
         return {
             'meet': self.meet,
             'teams': self.teams,
-            'events': self.events
+            'events': self.events,
+            'diagnostics': self.diagnostics
         }
 
     def _parse_b1(self, line: str):
         """Parse B1 record - Meet information."""
-        self.meet['name'] = line[11:41].strip()
-        self.meet['startDate'] = line[121:129].strip()  # MMDDYYYY
+        name, start_date = self._b1(line)
+        self.meet['name'] = name.strip()
+        self.meet['startDate'] = start_date.strip()  # MMDDYYYY
         self.last_relay_result = None
 
     def _parse_b2(self, line: str):
         """Parse B2 record - Host team information."""
         if 'hostName' not in self.meet:
-            self.meet['hostName'] = line[11:41].strip()
+            self.meet['hostName'] = self._b2(line).strip()
 
     def _parse_c1(self, line: str):
         """Parse C1 record - Team information."""
-        raw_team_code = line[11:17].strip()
-        team_name = line[17:47].strip()
+        raw_team_code, team_name = self._c1(line)
+        raw_team_code = raw_team_code.strip()
+        team_name = team_name.strip()
         self.current_team_code = raw_team_code
 
         if raw_team_code not in self.teams:
@@ -131,17 +260,19 @@ class SDIFParser:
         """Parse D0 record - Individual swimmer result."""
         self.last_relay_result = None
 
-        if len(line) < 142:
+        if len(line) < self._min_length['D0']:
+            self.diagnostics.record('D0', 'short record', self.line_number)
             return
 
-        event_num = line[72:76].strip()
+        event_num, swimmer_name, final_time, place_str, points_str = self._d0(line)
+        event_num = event_num.strip()
         if not event_num or event_num == '0':
             return
 
-        swimmer_name = line[11:39].strip()
-        final_time = line[115:123].strip()
-        place_str = line[135:138].strip()
-        points_str = line[138:142].strip()
+        swimmer_name = swimmer_name.strip()
+        final_time = final_time.strip()
+        place_str = place_str.strip()
+        points_str = points_str.strip()
 
         if not place_str:
             return
@@ -150,12 +281,15 @@ class SDIFParser:
         points = float(points_str) if points_str else 0.0
 
         if event_num not in self.events:
-            self.events[event_num] = self._create_event_object(line, 'Individual')
+            self.events[event_num] = self._create_event_object(line, 'Individual', self._d0_event)
 
         if place and self.current_team_code:
+            swimmer_id, age = self._d0_swimmer(line)
             self.events[event_num]['results'].append({
                 'place': place,
                 'swimmer': swimmer_name,
+                'swimmerId': swimmer_id.strip(),
+                'age': age.strip(),
                 'teamCode': self.teams[self.current_team_code]['code'],
                 'time': final_time,
                 'points': points
@@ -166,27 +300,31 @@ class SDIFParser:
 
     def _parse_e0(self, line: str):
         """Parse E0 record - Relay team result."""
-        if len(line) < 99:
+        # F0 names that follow belong to this relay, or to none if it is skipped
+        self.last_relay_result = None
+
+        if len(line) < self._min_length['E0']:
+            self.diagnostics.record('E0', 'short record', self.line_number)
             return
 
-        event_num = line[26:30].strip()
+        event_num, relay_team_char, relay_final_time, relay_place_str, relay_points_str = self._e0(line)
+        event_num = event_num.strip()
         if not event_num or event_num == '0':
             return
 
-        relay_team_char = line[11:12].strip()
-        relay_final_time = line[72:80].strip()
-        relay_place_str = line[92:95].strip()
-        relay_points_str = line[95:99].strip()
+        relay_team_char = relay_team_char.strip()
+        relay_final_time = relay_final_time.strip()
+        relay_place_str = relay_place_str.strip()
+        relay_points_str = relay_points_str.strip()
 
         if not relay_place_str:
-            self.last_relay_result = None
             return
 
         relay_place = int(relay_place_str)
         relay_points = float(relay_points_str) if relay_points_str else 0.0
 
         if event_num not in self.events:
-            self.events[event_num] = self._create_event_object(line, 'Relay')
+            self.events[event_num] = self._create_event_object(line, 'Relay', self._e0_event)
 
         if relay_place and self.current_team_code:
             team_name = self.teams.get(self.current_team_code, {}).get('name', self.current_team_code)
@@ -206,28 +344,18 @@ class SDIFParser:
 
             if self.current_team_code in self.teams:
                 self.teams[self.current_team_code]['score'] += relay_points
-        else:
-            self.last_relay_result = None
 
     def _parse_f0(self, line: str):
         """Parse F0 record - Individual relay swimmer names."""
-        if self.last_relay_result and len(line) >= 50:
-            swimmer_name = line[22:50].strip()
+        if self.last_relay_result and len(line) >= self._min_length['F0']:
+            swimmer_name = self._f0(line).strip()
             if swimmer_name:
                 self.last_relay_result['swimmers'].append(swimmer_name)
 
-    def _create_event_object(self, line: str, event_type: str) -> Dict:
-        """Create event object from SDIF line."""
-        if event_type == 'Individual':
-            gender_code = line[66:67] if len(line) > 66 else ''
-            age_code = line[76:80] if len(line) >= 80 else ''
-            distance = line[67:71].strip() if len(line) >= 71 else ''
-            stroke_code = line[71:72] if len(line) >= 72 else ''
-        else:  # Relay
-            gender_code = line[20:21] if len(line) > 20 else ''
-            age_code = line[30:34] if len(line) >= 34 else ''
-            distance = line[21:25].strip() if len(line) >= 25 else ''
-            stroke_code = line[25:26] if len(line) >= 26 else ''
+    def _create_event_object(self, line: str, event_type: str, event_fields: Callable) -> Dict:
+        """Create event object from SDIF line (event_fields extracts gender, age code, distance, stroke)."""
+        gender_code, age_code, distance, stroke_code = event_fields(line)
+        distance = distance.strip()
 
         gender = GENDER_MAP.get(gender_code, 'Unknown')
         age = self._parse_age_code(age_code)
@@ -240,31 +368,41 @@ class SDIFParser:
         description = f"{gender} {age} {distance}m {stroke}".strip()
         description = ' '.join(description.split())  # Normalize whitespace
 
+        event_id = None
+        if distance.isdigit():
+            key = EventKey(gender_code, self._parse_age_code(age_code), int(distance), stroke_code,
+                           event_type == 'Relay')
+            event_id = self.catalog.event_id(key, description)
+
         return {
             'description': description,
             'results': [],
-            'type': event_type
+            'type': event_type,
+            'eventId': event_id
         }
 
-    def _parse_age_code(self, age_code: str) -> str:
-        """Parse age code into human-readable format."""
-        if not age_code or len(age_code) < 4:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _parse_age_code(age_code: str) -> str:
+        """Parse age code into human-readable format (memoized; meets reuse a handful of codes)."""
+        layout = default_layout().age_code
+        if not age_code or len(age_code) < layout.length:
             return 'Open'
 
-        lower_str = age_code[0:2]
-        upper_str = age_code[2:4]
+        lower_str = age_code[layout.lower]
+        upper_str = age_code[layout.upper]
 
-        if lower_str == 'UN' and upper_str == 'OV':
+        if lower_str == layout.under and upper_str == layout.over:
             return 'Open'
 
-        if lower_str == 'UN':
+        if lower_str == layout.under:
             try:
                 upper_age = int(upper_str)
                 return f'{upper_age} & Under'
             except ValueError:
                 return 'Open'
 
-        if upper_str == 'OV':
+        if upper_str == layout.over:
             try:
                 lower_age = int(lower_str)
                 return f'{lower_age} & Over'
@@ -286,7 +424,7 @@ class SDIFParser:
         """Generate meet title for dual meets."""
         team_list = list(self.teams.values())
 
-        if 'hostName' in self.meet and 'startDate' in self.meet and len(team_list) == 2:
+        if self.meet.get('hostName') and 'startDate' in self.meet and len(team_list) == 2:
             start_date = self.meet['startDate']
             if len(start_date) == 8:
                 year = start_date[4:]
@@ -353,6 +491,49 @@ class HTMLGenerator:
         )
 
         meet_name = meet.get('name', 'Swim Meet Results')
+
+        main = f"""            <h2>Team Scores</h2>
+            <div class="table-wrapper narrow">
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Team</th>
+                            <th>Score</th>
+                        </tr>
+                    </thead>
+                    <tbody>{scores_rows}</tbody>
+                </table>
+            </div>
+
+            <h2>Event Winners</h2>
+            <div class="table-wrapper">
+                <table>
+                    <thead>
+                        <tr>
+                            <th class="center">Event</th>
+                            <th>Description</th>
+                            <th>Winner(s)</th>
+                            <th class="center">Team</th>
+                            <th class="center">Time</th>
+                        </tr>
+                    </thead>
+                    <tbody>{winners_html}</tbody>
+                </table>
+            </div>"""
+
+        return HTMLGenerator.page(meet_name, main, logo_url)
+
+    @staticmethod
+    def page(title: str, main: str, logo_url: str = LOGO_URL, extra_styles: str = '') -> str:
+        """
+        Wrap pre-rendered <main> content in the standard GPSA results page.
+
+        Args:
+            title: Page title, also shown in the header
+            main: HTML placed inside <main>
+            logo_url: Logo shown in the page header
+            extra_styles: Additional CSS appended to the embedded stylesheet
+        """
         generation_date = datetime.now().strftime('%Y-%m-%d')
 
         return f"""<!DOCTYPE html>
@@ -360,7 +541,7 @@ class HTMLGenerator:
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{meet_name}</title>
+    <title>{title}</title>
 
     <!-- Google Fonts -->
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
@@ -590,44 +771,17 @@ class HTMLGenerator:
                 font-size: 2.25rem;
             }}
         }}
-    </style>
+{extra_styles}    </style>
 </head>
 <body>
     <div class="container">
         <header>
             <img src="{logo_url}" alt="GPSA Logo" onerror="this.onerror=null; this.src='https://placehold.co/100x100/002366/FFFFFF?text=GPSA';">
-            <h1>{meet_name}</h1>
+            <h1>{title}</h1>
         </header>
 
         <main>
-            <h2>Team Scores</h2>
-            <div class="table-wrapper narrow">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Team</th>
-                            <th>Score</th>
-                        </tr>
-                    </thead>
-                    <tbody>{scores_rows}</tbody>
-                </table>
-            </div>
-
-            <h2>Event Winners</h2>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th class="center">Event</th>
-                            <th>Description</th>
-                            <th>Winner(s)</th>
-                            <th class="center">Team</th>
-                            <th class="center">Time</th>
-                        </tr>
-                    </thead>
-                    <tbody>{winners_html}</tbody>
-                </table>
-            </div>
+{main}
         </main>
 
         <footer>
@@ -638,18 +792,549 @@ class HTMLGenerator:
 </html>"""
 
 
-class BulkProcessor:
-    """Handles bulk processing of SDIF files."""
+class InvitationalGenerator:
+    """
+    Renders a multi-team meet as a set of small linked pages.
+
+    One parse produces:
+        index.html          team scores and event winners, linking to the pages below
+        team-<CODE>.html    every swim by one team, with its place and score
+        event-<N>.html      full results of one event
+
+    Team standings and the per-team swim lists are computed once, in a single
+    pass over the events, and shared by every page. No page repeats another
+    page's results, so page size depends on one team or one event, never on
+    the size of the whole meet.
+    """
+
+    EXTRA_STYLES = """
+        nav.meet-nav {
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: space-between;
+            gap: 0.5rem;
+            margin-bottom: 1.5rem;
+            font-size: 0.875rem;
+        }
+
+        main a {
+            color: #0033a0;
+        }
+
+        .subtitle {
+            text-align: center;
+            color: #6b7280;
+            margin-bottom: 1.5rem;
+        }
+
+        @media print {
+            nav.meet-nav {
+                display: none;
+            }
+        }
+"""
+
+    @staticmethod
+    def generate(data: Dict, logo_url: str = LOGO_URL) -> Dict[str, str]:
+        """
+        Render every page of an invitational.
+
+        Returns:
+            Dict mapping page file name -> HTML.
+        """
+        meet_name = data['meet'].get('name', 'Swim Meet Results')
+        events = data['events']
+        event_nums = sorted(events.keys(), key=int)
+
+        # Standings (tied scores share a place), computed once for every page
+        standings = []
+        for team in sorted(data['teams'].values(), key=lambda x: x['score'], reverse=True):
+            tied = standings and standings[-1][1]['score'] == team['score']
+            place = standings[-1][0] if tied else len(standings) + 1
+            standings.append((place, team))
+        places = {team['code']: place for place, team in standings}
+        team_names = {team['code']: team['name'] for team in data['teams'].values()}
+
+        # Single pass over the results, grouping swims by team
+        swims_by_team = defaultdict(list)
+        for event_num in event_nums:
+            for result in events[event_num]['results']:
+                swims_by_team[result.get('teamCode', '')].append((event_num, result))
+
+        pages = {
+            INVITATIONAL_INDEX: InvitationalGenerator._index_page(
+                meet_name, standings, events, event_nums, logo_url),
+        }
+        for place, team in standings:
+            pages[team_page_name(team['code'])] = InvitationalGenerator._team_page(
+                meet_name, place, len(standings), team, events, swims_by_team[team['code']], logo_url)
+        for position, event_num in enumerate(event_nums):
+            previous_num = event_nums[position - 1] if position else None
+            next_num = event_nums[position + 1] if position + 1 < len(event_nums) else None
+            pages[event_page_name(event_num)] = InvitationalGenerator._event_page(
+                meet_name, event_num, events[event_num], team_names, places, previous_num, next_num, logo_url)
+        return pages
+
+    @staticmethod
+    def _page(title: str, main: str, logo_url: str) -> str:
+        return HTMLGenerator.page(html.escape(title), main, logo_url, InvitationalGenerator.EXTRA_STYLES)
+
+    @staticmethod
+    def _swimmers(result: Dict) -> str:
+        """Swimmer cell: relay legs if known, otherwise the swimmer (or relay team) name."""
+        if result.get('swimmers'):
+            return '<br>'.join(html.escape(name) for name in result['swimmers'])
+        return html.escape(result['swimmer'])
+
+    @staticmethod
+    def _table(headers: List[Tuple[str, bool]], rows: List[str], narrow: bool = False) -> str:
+        """Table in the standard wrapper; headers are (label, centered) pairs."""
+        head = ''.join(f'<th class="center">{label}</th>' if centered else f'<th>{label}</th>'
+                       for label, centered in headers)
+        wrapper = 'table-wrapper narrow' if narrow else 'table-wrapper'
+        return (f'            <div class="{wrapper}">\n'
+                f'                <table>\n'
+                f'                    <thead><tr>{head}</tr></thead>\n'
+                f'                    <tbody>{"".join(rows)}</tbody>\n'
+                f'                </table>\n'
+                f'            </div>')
+
+    @staticmethod
+    def _index_page(meet_name: str, standings: List[Tuple[int, Dict]], events: Dict,
+                    event_nums: List[str], logo_url: str) -> str:
+        score_rows = [
+            f'<tr><td class="center">{place}</td>'
+            f'<td><a href="{team_page_name(team["code"])}">{html.escape(team["name"])}</a></td>'
+            f'<td class="center">{html.escape(team["code"])}</td>'
+            f'<td class="center">{team["score"]:.1f}</td></tr>'
+            for place, team in standings
+        ]
+
+        event_rows = []
+        for event_num in event_nums:
+            event = events[event_num]
+            winner = next((r for r in event['results'] if r['place'] == 1), None)
+            link = f'<a href="{event_page_name(event_num)}">{html.escape(event["description"])}</a>'
+            if winner:
+                event_rows.append(
+                    f'<tr><td class="center">{event_num}</td><td>{link}</td>'
+                    f'<td>{InvitationalGenerator._swimmers(winner)}</td>'
+                    f'<td class="center">{html.escape(winner.get("teamCode", ""))}</td>'
+                    f'<td class="center">{html.escape(winner["time"])}</td></tr>'
+                )
+            else:
+                event_rows.append(f'<tr><td class="center">{event_num}</td><td>{link}</td>'
+                                  f'<td></td><td></td><td></td></tr>')
+
+        main = '\n'.join([
+            f'            <p class="subtitle">{len(standings)} teams, {len(event_nums)} events. '
+            f'Select a team or event for full results.</p>',
+            '            <h2>Team Scores</h2>',
+            InvitationalGenerator._table([('Place', True), ('Team', False), ('Code', True), ('Score', True)],
+                                         score_rows, narrow=True),
+            '            <h2>Events</h2>',
+            InvitationalGenerator._table([('Event', True), ('Description', False), ('Winner(s)', False),
+                                          ('Team', True), ('Time', True)], event_rows),
+        ])
+        return InvitationalGenerator._page(meet_name, main, logo_url)
+
+    @staticmethod
+    def _team_page(meet_name: str, place: int, team_count: int, team: Dict, events: Dict,
+                   swims: List[Tuple[str, Dict]], logo_url: str) -> str:
+        rows = [
+            f'<tr><td class="center"><a href="{event_page_name(event_num)}">{event_num}</a></td>'
+            f'<td>{html.escape(events[event_num]["description"])}</td>'
+            f'<td>{InvitationalGenerator._swimmers(result)}</td>'
+            f'<td class="center">{result["place"]}</td>'
+            f'<td class="center">{html.escape(result["time"])}</td>'
+            f'<td class="center">{result.get("points", 0.0):g}</td></tr>'
+            for event_num, result in swims
+        ]
+
+        main = '\n'.join([
+            f'            <nav class="meet-nav">'
+            f'<a href="{INVITATIONAL_INDEX}">&larr; {html.escape(meet_name)}</a></nav>',
+            f'            <h2>{html.escape(team["name"])} ({html.escape(team["code"])})</h2>',
+            f'            <p class="subtitle">Place {place} of {team_count} with {team["score"]:.1f} points '
+            f'from {len(swims)} swims</p>',
+            InvitationalGenerator._table([('Event', True), ('Description', False), ('Swimmer(s)', False),
+                                          ('Place', True), ('Time', True), ('Points', True)], rows),
+        ])
+        return InvitationalGenerator._page(f"{meet_name} - {team['name']}", main, logo_url)
+
+    @staticmethod
+    def _event_page(meet_name: str, event_num: str, event: Dict, team_names: Dict[str, str],
+                    places: Dict[str, int], previous_num: Optional[str], next_num: Optional[str],
+                    logo_url: str) -> str:
+        rows = []
+        for result in event['results']:
+            code = result.get('teamCode', '')
+            team_cell = html.escape(code)
+            if code in places:
+                team_cell = f'<a href="{team_page_name(code)}" title="{html.escape(team_names[code])}">{team_cell}</a>'
+            rows.append(
+                f'<tr><td class="center">{result["place"]}</td>'
+                f'<td>{InvitationalGenerator._swimmers(result)}</td>'
+                f'<td class="center">{team_cell}</td>'
+                f'<td class="center">{html.escape(result["time"])}</td>'
+                f'<td class="center">{result.get("points", 0.0):g}</td></tr>'
+            )
+
+        links = [f'<a href="{INVITATIONAL_INDEX}">&larr; {html.escape(meet_name)}</a>', '<span>']
+        if previous_num is not None:
+            links.append(f'<a href="{event_page_name(previous_num)}">Event {previous_num}</a>')
+        if previous_num is not None and next_num is not None:
+            links.append(' | ')
+        if next_num is not None:
+            links.append(f'<a href="{event_page_name(next_num)}">Event {next_num}</a>')
+        links.append('</span>')
+
+        description = html.escape(event['description'])
+        main = '\n'.join([
+            f'            <nav class="meet-nav">{"".join(links)}</nav>',
+            f'            <h2>Event {event_num}: {description}</h2>',
+            InvitationalGenerator._table([('Place', True), ('Swimmer(s)', False), ('Team', True),
+                                          ('Time', True), ('Points', True)], rows),
+        ])
+        return InvitationalGenerator._page(f"{meet_name} - Event {event_num} {event['description']}", main, logo_url)
+
+
+class ProcessedMeet(NamedTuple):
+    """A rendered meet: output file name, season year (None if undated), HTML and summary."""
+    filename: str
+    year: Optional[int]
+    html: str
+    summary: Dict
+
+
+class ProcessedInvitational(NamedTuple):
+    """A rendered invitational: output directory name, season year (None if undated), pages and summary."""
+    dirname: str
+    year: Optional[int]
+    pages: Dict[str, str]
+    summary: Dict
+
+
+class ProcessResult(NamedTuple):
+    """Outcome for one input of process_many(): the meet, or the error that stopped it."""
+    source: str
+    meet: Optional[ProcessedMeet]
+    error: Optional[str]
+
+
+def generate_filename(data: Dict) -> Tuple[Optional[str], Optional[int]]:
+    """Generate output filename from parsed data."""
+    meet = data['meet']
+    teams = data['teams']
+
+    meet_date = meet.get('startDate', '')
+
+    if not meet_date or len(meet_date) != 8:
+        # Fallback to meet name
+        meet_name = meet.get('name', 'swim_meet').replace(' ', '_')
+        return f"{meet_name}_Results.html", None
+
+    # Parse date MMDDYYYY -> YYYY-MM-DD
+    year = meet_date[4:]
+    month = meet_date[0:2]
+    day = meet_date[2:4]
+    formatted_date = f"{year}-{month}-{day}"
+
+    team_list = list(teams.values())
+
+    # For dual meets, use team codes
+    if len(team_list) == 2:
+        team1_code = team_list[0]['code']
+        team2_code = team_list[1]['code']
+        filename = f"{formatted_date}_{team1_code}_v_{team2_code}.html"
+    else:
+        # For multi-team meets, use meet name
+        meet_name = meet.get('name', 'meet').replace(' ', '_')
+        filename = f"{formatted_date}_{meet_name}.html"
+
+    return filename, int(year)
+
+
+def invitational_dirname(data: Dict) -> Tuple[Optional[str], Optional[int]]:
+    """Output directory name for an invitational: generate_filename() without the extension."""
+    filename, year = generate_filename(data)
+    return filename[:-len('.html')], year
+
+
+def team_page_name(team_code: str) -> str:
+    """File name of a team's page in invitational mode."""
+    return f"team-{''.join(c if c in PAGE_NAME_CHARS else '_' for c in team_code)}.html"
+
+
+def event_page_name(event_num: str) -> str:
+    """File name of an event's page in invitational mode."""
+    return f"event-{int(event_num)}.html"
+
+
+def summarize(data: Dict) -> Dict:
+    """Build a small JSON-serializable summary of a parsed meet."""
+    meet = data['meet']
+    return {
+        'name': meet.get('name', ''),
+        'startDate': meet.get('startDate', ''),
+        'teams': {team['code']: {'name': team['name'], 'score': team['score']}
+                  for team in data['teams'].values()},
+        'events': len(data['events']),
+        'results': sum(len(event['results']) for event in data['events'].values()),
+        'diagnostics': data['diagnostics'].to_dict() if 'diagnostics' in data else {'total': 0, 'issues': []},
+    }
+
+
+def decode_sdif(raw: bytes) -> str:
+    """Decode raw .sd3 bytes like a text-mode read: UTF-8 ignoring bad bytes, universal newlines."""
+    return raw.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def sdif_fingerprint(content: Union[bytes, str]) -> str:
+    """
+    Fingerprint an SDIF file by its normalized record content.
+
+    Line endings, trailing padding, blank lines and the export-specific A0/Z0
+    records are ignored, so re-exports and copies of the same meet (bare or
+    zipped, under any file name) share a fingerprint.
+
+    Returns:
+        SHA-256 hex digest.
+    """
+    if isinstance(content, bytes):
+        content = decode_sdif(content)
+    digest = hashlib.sha256()
+    for line in content.split('\n'):
+        line = line.rstrip()
+        if line and line[:2] not in FINGERPRINT_SKIP_CODES:
+            digest.update(line.encode('utf-8'))
+            digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def process_sdif(content: Union[bytes, str], logo_url: str = LOGO_URL) -> ProcessedMeet:
+    """
+    Parse one SDIF file's content and render its results page, entirely in memory.
+
+    Args:
+        content: Raw .sd3 bytes (decoded with decode_sdif()) or text
+        logo_url: Logo shown in the page header
+
+    Returns:
+        ProcessedMeet with the output filename, season year, HTML and summary.
+    """
+    if isinstance(content, bytes):
+        content = decode_sdif(content)
+
+    data = SDIFParser().parse(content)
+    filename, year = generate_filename(data)
+    return ProcessedMeet(filename, year, HTMLGenerator.generate(data, logo_url), summarize(data))
+
+
+def process_invitational(content: Union[bytes, str], logo_url: str = LOGO_URL) -> ProcessedInvitational:
+    """
+    Parse one SDIF file's content and render it as invitational pages, entirely in memory.
+
+    Args:
+        content: Raw .sd3 bytes (decoded with decode_sdif()) or text
+        logo_url: Logo shown in the page headers
+
+    Returns:
+        ProcessedInvitational with the output directory name, season year,
+        pages (file name -> HTML) and summary.
+    """
+    if isinstance(content, bytes):
+        content = decode_sdif(content)
+
+    data = SDIFParser().parse(content)
+    dirname, year = invitational_dirname(data)
+    return ProcessedInvitational(dirname, year, InvitationalGenerator.generate(data, logo_url), summarize(data))
+
+
+def iter_sdif_sources(paths: Iterable[Union[str, Path]]) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield (source name, content) for every SDIF input under the given paths.
+
+    Paths may be .sd3 files, .zip files (their .sd3 members are read in place,
+    nothing is extracted or deleted) or directories (their .sd3 and .zip files,
+    in name order). Zip members are named "archive.zip:member.sd3".
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            children = sorted(p for p in path.iterdir() if p.suffix.lower() in ('.sd3', '.zip'))
+            yield from iter_sdif_sources(children)
+        elif path.suffix.lower() == '.zip':
+            try:
+                with zipfile.ZipFile(path) as zip_ref:
+                    for member in zip_ref.namelist():
+                        if member.lower().endswith('.sd3'):
+                            yield f"{path.name}:{member}", zip_ref.read(member)
+            except zipfile.BadZipFile:
+                logger.error(f"Invalid zip file: {path.name}")
+        elif path.suffix.lower() == '.sd3':
+            yield path.name, path.read_bytes()
+
+
+def process_many(sources: Iterable[Tuple[str, bytes]]) -> Iterator[ProcessResult]:
+    """
+    Process many SDIF inputs lazily, one ProcessResult per input.
+
+    A failing input yields a result with its error message instead of stopping
+    the batch.
+
+    Args:
+        sources: (source name, content) pairs, e.g. from iter_sdif_sources()
+    """
+    for source, content in sources:
+        try:
+            yield ProcessResult(source, process_sdif(content), None)
+        except Exception as e:
+            logger.error(f"Error processing {source}: {str(e)}", exc_info=True)
+            yield ProcessResult(source, None, str(e))
+
+
+class RunJournal:
+    """
+    Append-only JSONL journal of per-input outcomes, used to resume bulk runs.
+
+    Each finished input appends one line (status "done", "failed" or
+    "collision") and the file is flushed immediately, so a crash loses at most
+    the inputs that were in flight. Inputs are identified by their content
+    fingerprint, so renamed copies of a finished meet are not redone either.
+    Each output is owned by its latest "done" entry: when a corrected export
+    rewrites a page, the entry of the content it replaced is dropped. Inputs
+    whose latest entry is "failed" form the quarantine, together with their
+    tracebacks.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # Fingerprint -> latest "done" entry
+        self.done: Dict[str, Dict] = {}
+        # Output (relative path) -> fingerprint of the "done" entry that owns it
+        self.owners: Dict[str, str] = {}
+        # Input name -> latest entry, for inputs whose latest entry is "failed"
+        self.quarantine: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Replay the journal; a torn last line from a crash is ignored."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._apply(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+
+    def _apply(self, entry: Dict):
+        if entry.get('status') == 'done':
+            fingerprint, output = entry['fingerprint'], entry['output']
+            # The output now holds this content, not whatever was written there before
+            previous = self.owners.get(output)
+            if previous is not None and previous != fingerprint:
+                del self.done[previous]
+            # ...and this content no longer owns the output it was written to before
+            earlier = self.done.get(fingerprint)
+            if earlier is not None and self.owners.get(earlier['output']) == fingerprint:
+                del self.owners[earlier['output']]
+            self.owners[output] = fingerprint
+            self.done[fingerprint] = entry
+            self.quarantine.pop(entry['input'], None)
+        elif entry.get('status') == 'failed':
+            self.quarantine[entry['input']] = entry
+        else:
+            self.quarantine.pop(entry['input'], None)
+
+    def record(self, input_name: str, status: str, fingerprint: Optional[str] = None, **details):
+        """Append one outcome and flush it to disk."""
+        entry = {'time': datetime.now().isoformat(timespec='seconds'), 'input': input_name,
+                 'fingerprint': fingerprint, 'status': status, **details}
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._apply(entry)
+
+    def is_done(self, fingerprint: str, output_dir: Path) -> bool:
+        """True if content with this fingerprint was processed and its output still exists."""
+        entry = self.done.get(fingerprint)
+        return entry is not None and (output_dir / entry['output']).exists()
+
+    def owner(self, output: str) -> Optional[Dict]:
+        """The "done" entry whose content an output (relative path) currently holds, or None."""
+        fingerprint = self.owners.get(output)
+        return self.done[fingerprint] if fingerprint is not None else None
+
+    def reset(self):
+        """Start a fresh journal, forgetting previous runs."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self.done.clear()
+            self.owners.clear()
+            self.quarantine.clear()
+
 
-    def __init__(self, input_dir: Path, output_dir: Path):
+class BulkProcessor:
+    """
+    Handles bulk processing of SDIF files.
+
+    Files flow through four stages, each on its own thread, connected by
+    bounded queues: read (lazy directory scan + file read) -> parse -> render
+    -> write. Disk reads and writes overlap with parsing and rendering, and
+    at most queue_depth items wait between any two stages, so memory depends
+    on the queue depth rather than the batch size.
+
+    Inputs are fingerprinted by normalized content (sdif_fingerprint) as they
+    are read; copies of a meet already seen in the run are skipped before
+    parsing. Two different inputs that map to the same output file are reported
+    as a collision and only one is written: the input whose page is already
+    done (resumed) keeps it, otherwise the first one written.
+
+    Every outcome is appended to a RunJournal in the output directory. A later
+    run skips inputs whose content is already done (resuming an interrupted
+    run); an input edited since then has new content and replaces its page.
+    With retry_failed it processes only the quarantined inputs.
+
+    With invitational, each meet is written as a directory of pages
+    (InvitationalGenerator) instead of a single page.
+    """
+
+    def __init__(self, input_dir: Path, output_dir: Path, queue_depth: int = DEFAULT_QUEUE_DEPTH,
+                 retry_failed: bool = False, fresh: bool = False, invitational: bool = False):
         self.input_dir = input_dir
         self.output_dir = output_dir
+        self.queue_depth = queue_depth
+        self.retry_failed = retry_failed
+        self.fresh = fresh
+        self.invitational = invitational
+        self.journal: Optional[RunJournal] = None
         self.stats = {
             'processed': 0,
             'failed': 0,
             'zips_extracted': 0,
-            'files_generated': 0
+            'files_generated': 0,
+            'files_found': 0,
+            'duplicates': 0,
+            'collisions': 0,
+            'resumed': 0
         }
+        self._stats_lock = threading.Lock()
+        # Fingerprint -> first input with that content (read stage only)
+        self._seen_content: Dict[str, str] = {}
+        # Output file -> (fingerprint, input) that keeps it this run: written, or resumed and left as is
+        self._written: Dict[Path, Tuple[str, str]] = {}
+        self.collisions: List[Tuple[str, str, str]] = []
+        # Parse problems across the run, and the files they came from
+        self.diagnostics = ParseDiagnostics()
+        self.files_with_diagnostics: List[Tuple[str, int]] = []
+
+    def _count(self, key: str, amount: int = 1):
+        """Increment a stats counter (called from several pipeline threads)."""
+        with self._stats_lock:
+            self.stats[key] += amount
 
     def process(self):
         """Process all SDIF and ZIP files in input directory."""
@@ -657,32 +1342,224 @@ class BulkProcessor:
         logger.info(f"Input directory: {self.input_dir}")
         logger.info(f"Output directory: {self.output_dir}")
 
-        if not self.input_dir.exists():
-            logger.error(f"Input directory does not exist: {self.input_dir}")
+        if not self.input_dir.is_dir():
+            logger.error(f"Input directory does not exist or is not a directory: {self.input_dir}")
             return False
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        self.journal = RunJournal(self.output_dir / JOURNAL_FILENAME)
+        if self.fresh:
+            self.journal.reset()
+        elif self.journal.done:
+            logger.info(f"Resuming: {len(self.journal.done)} input(s) already done according to {JOURNAL_FILENAME}")
+        if self.retry_failed:
+            logger.info(f"Retrying {len(self.journal.quarantine)} quarantined input(s)")
+
         # Extract all zip files first
         self._extract_zip_files()
 
-        # Process all .sd3 files
-        sd3_files = list(self.input_dir.glob('*.sd3')) + list(self.input_dir.glob('*.SD3'))
+        # Process all .sd3 files through the pipeline
+        read_queue = queue.Queue(maxsize=self.queue_depth)
+        parse_queue = queue.Queue(maxsize=self.queue_depth)
+        render_queue = queue.Queue(maxsize=self.queue_depth)
 
-        if not sd3_files:
-            logger.warning("No .sd3 files found in input directory")
-            return False
+        stages = [
+            threading.Thread(target=self._read_stage, args=(read_queue,), name='sdif-read'),
+            threading.Thread(target=self._run_stage, args=(self._parse, read_queue, parse_queue), name='sdif-parse'),
+            threading.Thread(target=self._run_stage, args=(self._render, parse_queue, render_queue), name='sdif-render'),
+        ]
+        for stage in stages:
+            stage.start()
 
-        logger.info(f"Found {len(sd3_files)} .sd3 file(s) to process")
+        # Writing runs on this thread
+        self._run_stage(self._write, render_queue, None)
 
-        for sd3_file in sd3_files:
-            self._process_sdif_file(sd3_file)
+        for stage in stages:
+            stage.join()
+
+        if not self.stats['files_found']:
+            logger.warning("No .sd3 files found in input directory")
+            return False
 
         # Print summary
         self._print_summary()
         return True
 
+    def _iter_sd3_paths(self) -> Iterator[Path]:
+        """Lazily yield the .sd3 files in the input directory (any case of extension)."""
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith('.sd3') and entry.is_file():
+                    yield Path(entry.path)
+
+    def _read_stage(self, out_queue: queue.Queue):
+        """Pipeline stage 1: scan the input directory, read each .sd3 file and drop duplicates."""
+        try:
+            for sd3_path in self._iter_sd3_paths():
+                self._count('files_found')
+                if self.retry_failed and sd3_path.name not in self.journal.quarantine:
+                    continue
+                try:
+                    raw = sd3_path.read_bytes()
+                except OSError as e:
+                    logger.error(f"Error reading {sd3_path.name}: {str(e)}")
+                    self._fail(sd3_path, None)
+                    continue
+
+                fingerprint = sdif_fingerprint(raw)
+                if self.journal.is_done(fingerprint, self.output_dir):
+                    self._count('resumed')
+                    self._seen_content.setdefault(fingerprint, sd3_path.name)
+                    # Its page stays; other content aimed at the same page is a collision
+                    output_file = self.output_dir / self.journal.done[fingerprint]['output']
+                    self._written.setdefault(output_file, (fingerprint, sd3_path.name))
+                    continue
+
+                original = self._seen_content.get(fingerprint)
+                if original is not None:
+                    logger.info(f"Skipping {sd3_path.name}: same meet content as {original}")
+                    self._count('duplicates')
+                    continue
+                self._seen_content[fingerprint] = sd3_path.name
+
+                out_queue.put((sd3_path, fingerprint, raw))
+        finally:
+            out_queue.put(_END_OF_STREAM)
+
+    def _run_stage(self, func, in_queue: queue.Queue, out_queue: Optional[queue.Queue]):
+        """
+        Run one pipeline stage until its input ends.
+
+        func maps an item to the next stage's item. An item that raises is
+        logged and counted as failed without stopping the stage.
+        """
+        while True:
+            item = in_queue.get()
+            if item is _END_OF_STREAM:
+                break
+            sd3_path, fingerprint = item[0], item[1]
+            try:
+                result = func(*item)
+            except Exception as e:
+                logger.error(f"Error processing {sd3_path.name}: {str(e)}", exc_info=True)
+                self._fail(sd3_path, fingerprint)
+                continue
+            if out_queue is not None:
+                out_queue.put(result)
+
+        if out_queue is not None:
+            out_queue.put(_END_OF_STREAM)
+
+    def _fail(self, sd3_path: Path, fingerprint: Optional[str]):
+        """Count a failed input and quarantine it in the journal (call from an except block)."""
+        self._count('failed')
+        error = sys.exc_info()[1]
+        self.journal.record(sd3_path.name, 'failed', fingerprint, error=str(error),
+                            traceback=traceback.format_exc())
+
+    def _parse(self, sd3_path: Path, fingerprint: str, raw: bytes):
+        """Pipeline stage 2: parse SDIF records."""
+        logger.info(f"Processing {sd3_path.name}...")
+        data = SDIFParser().parse(decode_sdif(raw))
+
+        diagnostics = data['diagnostics']
+        if diagnostics:
+            # One line per file, however many records were bad
+            logger.warning(f"  {sd3_path.name}: {diagnostics.total} malformed record(s): {diagnostics.describe()}")
+            with self._stats_lock:
+                self.diagnostics.merge(diagnostics)
+                self.files_with_diagnostics.append((sd3_path.name, diagnostics.total))
+        return sd3_path, fingerprint, data
+
+    def _render(self, sd3_path: Path, fingerprint: str, data: Dict):
+        """Pipeline stage 3: name the output file (or directory, for invitationals) and render its HTML."""
+        if self.invitational:
+            dirname, year = invitational_dirname(data)
+            return sd3_path, fingerprint, dirname, year, InvitationalGenerator.generate(data)
+        filename, year = generate_filename(data)
+        if not filename:
+            raise ValueError(f"Could not generate filename for {sd3_path.name}")
+        return sd3_path, fingerprint, filename, year, HTMLGenerator.generate(data)
+
+    def _write(self, sd3_path: Path, fingerprint: str, filename: str, year: Optional[int],
+               html_content: Union[str, Dict[str, str]]):
+        """
+        Pipeline stage 4: write the page into its year directory, refusing same-run collisions.
+
+        Invitationals (html_content is a dict of pages) are written into a
+        directory named filename; pages left over from an earlier version of
+        the meet are removed.
+        """
+        # Determine output directory
+        if year:
+            output_path = self.output_dir / str(year)
+            output_path.mkdir(parents=True, exist_ok=True)
+        else:
+            output_path = self.output_dir
+
+        output_file = output_path / filename
+        relative_output = output_file.relative_to(self.output_dir)
+
+        earlier = self._written.get(output_file) or self._journal_claim(relative_output, fingerprint)
+        if earlier is not None:
+            # Different content (identical content never gets this far)
+            logger.error(f"Collision: {sd3_path.name} and {earlier[1]} both produce {relative_output} "
+                         f"with different results; kept {earlier[1]}, skipped {sd3_path.name}")
+            self.collisions.append((str(relative_output), earlier[1], sd3_path.name))
+            self._count('collisions')
+            self.journal.record(sd3_path.name, 'collision', fingerprint, output=relative_output.as_posix(),
+                                kept=earlier[1])
+            return
+        self._written[output_file] = (fingerprint, sd3_path.name)
+
+        if isinstance(html_content, dict):
+            self._write_pages(output_file, html_content)
+            logger.info(f"  Generated: {relative_output}/ ({len(html_content)} pages)")
+            generated = len(html_content)
+        else:
+            # Write output file
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+            logger.info(f"  Generated: {relative_output}")
+            generated = 1
+
+        self._count('processed')
+        self._count('files_generated', generated)
+        self.journal.record(sd3_path.name, 'done', fingerprint, output=relative_output.as_posix())
+
+    def _journal_claim(self, relative_output: Path, fingerprint: str) -> Optional[Tuple[str, str]]:
+        """
+        (fingerprint, input) of a resumed input that owns this output but has not been
+        read yet this run, or None.
+
+        The owner keeps the page only while its input file is still in the input
+        directory with the same content; an input edited in place (a corrected
+        export) replaces its page.
+        """
+        owner = self.journal.owner(relative_output.as_posix())
+        if owner is None or owner['fingerprint'] == fingerprint:
+            return None
+        source = self.input_dir / owner['input']
+        try:
+            if not source.is_file() or sdif_fingerprint(source.read_bytes()) != owner['fingerprint']:
+                return None
+        except OSError:
+            return None
+        return owner['fingerprint'], owner['input']
+
+    @staticmethod
+    def _write_pages(meet_dir: Path, pages: Dict[str, str]):
+        """Write an invitational's pages, removing stale team/event pages from a previous render."""
+        meet_dir.mkdir(parents=True, exist_ok=True)
+        for stale in list(meet_dir.glob('team-*.html')) + list(meet_dir.glob('event-*.html')):
+            if stale.name not in pages:
+                stale.unlink()
+        for name, page in pages.items():
+            with open(meet_dir / name, 'w', encoding='utf-8') as f:
+                f.write(page)
+
     def _extract_zip_files(self):
         """Extract all .zip files in input directory."""
         zip_files = list(self.input_dir.glob('*.zip')) + list(self.input_dir.glob('*.ZIP'))
@@ -701,6 +1578,18 @@ class BulkProcessor:
                         continue
 
                     for member in sd3_members:
+                        target = self.input_dir / member
+                        if target.exists():
+                            content = zip_ref.read(member)
+                            if sdif_fingerprint(content) == sdif_fingerprint(target.read_bytes()):
+                                logger.info(f"  Skipped: {member} (same meet content as the existing file)")
+                                continue
+                            # Keep both versions rather than overwriting the existing file
+                            target = target.with_name(f"{target.stem}.{zip_path.stem}{target.suffix}")
+                            target.write_bytes(content)
+                            logger.warning(f"  Extracted: {member} as {target.name} "
+                                           f"(a different file with that name already exists)")
+                            continue
                         zip_ref.extract(member, self.input_dir)
                         logger.info(f"  Extracted: {member}")
 
@@ -715,96 +1604,85 @@ class BulkProcessor:
             except Exception as e:
                 logger.error(f"Error extracting {zip_path.name}: {str(e)}")
 
-    def _process_sdif_file(self, sd3_path: Path):
-        """Process a single SDIF file."""
-        try:
-            logger.info(f"Processing {sd3_path.name}...")
-
-            # Read file content
-            with open(sd3_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # Parse SDIF data
-            parser = SDIFParser()
-            data = parser.parse(content)
-
-            # Generate filename and output path
-            filename, year = self._generate_filename(data)
-
-            if not filename:
-                logger.error(f"Could not generate filename for {sd3_path.name}")
-                self.stats['failed'] += 1
-                return
-
-            # Determine output directory
-            if year:
-                output_path = self.output_dir / str(year)
-                output_path.mkdir(parents=True, exist_ok=True)
-            else:
-                output_path = self.output_dir
-
-            output_file = output_path / filename
-
-            # Generate HTML
-            html_content = HTMLGenerator.generate(data)
-
-            # Write output file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            logger.info(f"  Generated: {output_file.relative_to(self.output_dir)}")
-
-            self.stats['processed'] += 1
-            self.stats['files_generated'] += 1
-
-        except Exception as e:
-            logger.error(f"Error processing {sd3_path.name}: {str(e)}", exc_info=True)
-            self.stats['failed'] += 1
-
-    def _generate_filename(self, data: Dict) -> Tuple[Optional[str], Optional[int]]:
-        """Generate output filename from parsed data."""
-        meet = data['meet']
-        teams = data['teams']
-
-        meet_date = meet.get('startDate', '')
-
-        if not meet_date or len(meet_date) != 8:
-            # Fallback to meet name
-            meet_name = meet.get('name', 'swim_meet').replace(' ', '_')
-            return f"{meet_name}_Results.html", None
-
-        # Parse date MMDDYYYY -> YYYY-MM-DD
-        year = meet_date[4:]
-        month = meet_date[0:2]
-        day = meet_date[2:4]
-        formatted_date = f"{year}-{month}-{day}"
-
-        team_list = list(teams.values())
-
-        # For dual meets, use team codes
-        if len(team_list) == 2:
-            team1_code = team_list[0]['code']
-            team2_code = team_list[1]['code']
-            filename = f"{formatted_date}_{team1_code}_v_{team2_code}.html"
-        else:
-            # For multi-team meets, use meet name
-            meet_name = meet.get('name', 'meet').replace(' ', '_')
-            filename = f"{formatted_date}_{meet_name}.html"
-
-        return filename, int(year)
-
     def _print_summary(self):
         """Print processing summary."""
         logger.info("=" * 60)
         logger.info("PROCESSING SUMMARY")
         logger.info("=" * 60)
         logger.info(f"Zip files extracted: {self.stats['zips_extracted']}")
+        logger.info(f"SDIF files found: {self.stats['files_found']}")
+        logger.info(f"Already done (resumed): {self.stats['resumed']}")
         logger.info(f"SDIF files processed: {self.stats['processed']}")
         logger.info(f"HTML files generated: {self.stats['files_generated']}")
+        logger.info(f"Duplicates skipped: {self.stats['duplicates']}")
+        logger.info(f"Collisions (not written): {self.stats['collisions']}")
+        for output, kept, skipped in self.collisions:
+            logger.info(f"  {output}: kept {kept}, skipped {skipped}")
+        if self.diagnostics:
+            logger.info(f"Parse diagnostics: {self.diagnostics.total} malformed record(s) "
+                        f"in {len(self.files_with_diagnostics)} file(s)")
+            for (code, kind), count in self.diagnostics.counts.most_common():
+                logger.info(f"  {code} {kind}: {count}")
+            for name, count in sorted(self.files_with_diagnostics, key=lambda item: -item[1]):
+                logger.info(f"  {name}: {count}")
         logger.info(f"Failed: {self.stats['failed']}")
+        if self.journal and self.journal.quarantine:
+            logger.info(f"Quarantined inputs ({len(self.journal.quarantine)}); retry with --retry-failed, "
+                        f"tracebacks in {JOURNAL_FILENAME}:")
+            for name, entry in sorted(self.journal.quarantine.items()):
+                logger.info(f"  {name}: {entry.get('error', '')}")
         logger.info("=" * 60)
 
 
+def setup_logging(log_file: Optional[str] = LOG_FILE) -> logging.handlers.QueueListener:
+    """
+    Configure logging for command-line runs (console, plus a log file unless log_file is None).
+
+    Records are handed to a QueueHandler and written by a QueueListener thread,
+    so pipeline threads never block on console or file I/O.
+
+    Returns:
+        The started QueueListener; call stop() before exiting to flush it.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
+def run(args) -> int:
+    """Run the processor for parsed command-line arguments and return the exit status."""
+    # Convert to Path objects
+    input_dir = Path(args.input).resolve()
+    output_dir = Path(args.output).resolve()
+
+    # Create processor and run
+    processor = BulkProcessor(input_dir, output_dir, queue_depth=args.queue_depth,
+                              retry_failed=args.retry_failed, fresh=args.fresh,
+                              invitational=args.invitational)
+    success = processor.process()
+
+    if success and processor.collisions:
+        logger.error("Processing finished with collisions; check which version of each meet should be published")
+        return 1
+    elif success:
+        logger.info("Processing completed successfully!")
+        return 0
+    else:
+        logger.error("Processing failed or no files were processed")
+        return 1
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -817,6 +1695,9 @@ Examples:
 
   # Process with repository structure
   %(prog)s -i ./meet_files -o ./results
+
+  # City Meet: index, team and event pages under invitationals/CityMeet/2025/
+  %(prog)s -i ./city_meet -o ./invitationals/CityMeet --invitational
         """
     )
 
@@ -834,22 +1715,44 @@ Examples:
         help='Output directory for generated HTML files (year subdirectories will be created automatically)'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--queue-depth',
+        type=int,
+        default=DEFAULT_QUEUE_DEPTH,
+        help=f'Files buffered between pipeline stages (default: {DEFAULT_QUEUE_DEPTH}); bounds memory use'
+    )
 
-    # Convert to Path objects
-    input_dir = Path(args.input).resolve()
-    output_dir = Path(args.output).resolve()
+    parser.add_argument(
+        '--retry-failed',
+        action='store_true',
+        help='Reprocess only the inputs quarantined (failed) in earlier runs'
+    )
 
-    # Create processor and run
-    processor = BulkProcessor(input_dir, output_dir)
-    success = processor.process()
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help=f'Ignore and reset the run journal ({JOURNAL_FILENAME}), reprocessing every input'
+    )
 
-    if success:
-        logger.info("Processing completed successfully!")
-        return 0
-    else:
-        logger.error("Processing failed or no files were processed")
-        return 1
+    parser.add_argument(
+        '--invitational',
+        action='store_true',
+        help='Render each meet as a directory with an index page plus per-team and per-event pages '
+             '(for large multi-team meets)'
+    )
+
+    args = parser.parse_args()
+
+    if args.retry_failed and args.fresh:
+        parser.error("--retry-failed and --fresh cannot be combined")
+    if args.queue_depth < 1:
+        parser.error("--queue-depth must be at least 1")
+
+    listener = setup_logging()
+    try:
+        return run(args)
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
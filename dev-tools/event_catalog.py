@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+GPSA Event Catalog
+Canonical integer ids for swim events, shared by every meet and season tool.
+
+Meet files number their events locally (event 12 is a different race in every
+meet), and SDIFParser only describes each one with display text. The catalog
+maps an event's canonical key
+
+    (gender code, age group, distance, stroke code, relay)
+
+to a small integer id. The age group is the label from
+SDIFParser._parse_age_code() rather than the raw age code. The catalog is
+event_catalog.json next to this script, committed with the repository so that
+every machine uses the same ids. It was seeded with the GPSA program (every
+event in the published 2022-2026 seasons) in program order, ids 0-65.
+
+The file is append-only: an event not in it gets the next id the first time
+it is seen, and an assigned id never changes or is reused. Commit the file
+whenever it grows; never reorder, renumber or delete entries, since published
+season files refer to events by id.
+
+SDIFParser tags every event with its id ('eventId'), and the season tools
+(leaderboards.py, season_store.py, swim_columns.py, swim_analytics.py) index,
+join and group on these ints instead of description strings. Those tools save
+the catalog before writing anything that refers to a new id. Ids assigned
+elsewhere (e.g. while only rendering pages) are simply not kept.
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# --- Configuration ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CATALOG_PATH = os.path.join(SCRIPT_DIR, 'event_catalog.json')
+FORMAT_VERSION = 1
+
+# Program order of SDIF gender and stroke codes (unknown codes sort last).
+GENDER_ORDER = ('F', 'M', 'X')
+STROKE_ORDER = ('1', '2', '3', '4', '5', '6', '7')
+
+
+class EventKey(NamedTuple):
+    """Canonical identity of an event, independent of any meet's numbering."""
+    gender: str     # SDIF event sex code: F, M or X
+    age: str        # age group label, e.g. "8 & Under", "9-10", "Open"
+    distance: int   # meters
+    stroke: str     # SDIF stroke code, '1' (free) to '7' (medley relay)
+    relay: bool
+
+    def sort_key(self) -> Tuple:
+        """Program order: individual events before relays, then gender, age group, stroke, distance."""
+        return (self.relay, _order(GENDER_ORDER, self.gender), age_sort_key(self.age),
+                _order(STROKE_ORDER, self.stroke), self.distance)
+
+
+def _order(order: Tuple[str, ...], value: str) -> int:
+    return order.index(value) if value in order else len(order)
+
+
+def age_sort_key(age: str) -> Tuple[int, int]:
+    """Sort key for age group labels: "8 & Under" < "9-10" < ... < "15-18" < "Open"."""
+    numbers = [int(n) for n in re.findall(r'\d+', age)]
+    if not numbers:
+        return (1000, 0)
+    if 'Under' in age:
+        return (0, numbers[0])
+    return (numbers[0], numbers[-1])
+
+
+class EventCatalog:
+    """
+    Event key <-> id mapping, loaded from and saved to a JSON file.
+
+    Lookups of known events are a dict access; assigning a new id takes a lock,
+    so parsers on several threads can share one catalog.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CATALOG_PATH):
+        self.path = path
+        self.events: List[EventKey] = []
+        self.labels: List[str] = []
+        self.dirty = False
+        self._ids: Dict[EventKey, int] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{self.path} has an unsupported format")
+        for position, event in enumerate(state['events']):
+            if event['id'] != position:
+                raise ValueError(f"{self.path}: event ids must be consecutive from 0 (found {event['id']} "
+                                 f"at position {position})")
+            key = EventKey(event['gender'], event['age'], event['distance'], event['stroke'], event['relay'])
+            self._ids[key] = position
+            self.events.append(key)
+            self.labels.append(event['label'])
+
+    def event_id(self, key: EventKey, label: str) -> int:
+        """The id for an event, assigning the next id (with this display label) if it is new."""
+        found = self._ids.get(key)
+        if found is not None:
+            return found
+        with self._lock:
+            found = self._ids.get(key)
+            if found is None:
+                found = self._ids[key] = len(self.events)
+                self.events.append(key)
+                self.labels.append(label)
+                self.dirty = True
+        return found
+
+    def key(self, event_id: int) -> EventKey:
+        return self.events[event_id]
+
+    def label(self, event_id: int) -> str:
+        """Display label, e.g. "Girls 9-10 50m Freestyle"."""
+        return self.labels[event_id]
+
+    def sort_key(self, event_id: int) -> Tuple:
+        """Sort key putting event ids in program order."""
+        return self.events[event_id].sort_key()
+
+    def find(self, label: str) -> Optional[int]:
+        """The id of the event with this display label, or None."""
+        try:
+            return self.labels.index(label)
+        except ValueError:
+            return None
+
+    def save(self):
+        """Write the catalog if new events were added since it was loaded or last saved."""
+        if not self.dirty or not self.path:
+            return
+        with self._lock:
+            state = {
+                'version': FORMAT_VERSION,
+                'events': [
+                    {'id': event_id, 'gender': key.gender, 'age': key.age, 'distance': key.distance,
+                     'stroke': key.stroke, 'relay': key.relay, 'label': self.labels[event_id]}
+                    for event_id, key in enumerate(self.events)
+                ],
+            }
+            with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=1)
+                f.write('\n')
+            os.replace(self.path + '.tmp', self.path)
+            self.dirty = False
+
+    def __len__(self):
+        return len(self.events)
+
+
+_default_catalog: Optional[EventCatalog] = None
+_default_lock = threading.Lock()
+
+
+def default_catalog() -> EventCatalog:
+    """The shared catalog backed by event_catalog.json, loaded on first use."""
+    global _default_catalog
+    with _default_lock:
+        if _default_catalog is None:
+            _default_catalog = EventCatalog()
+        return _default_catalog
@@ -2,6 +2,16 @@ import os
 import sys
 import argparse
 import html
+import hashlib
+import json
+import re
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+from build_css import UTILITY_CSS_RELPATH
 
 # --- Configuration ---
 # The name of the output HTML file.
@@ -10,6 +20,270 @@ OUTPUT_FILE = "index.html"
 PAGE_TITLE = "Directory Listing"
 # List of directory names to exclude from indexing.
 EXCLUDE_DIRS = ['.git', 'scripts', 'assets', 'resources', 'css']
+# Listing manifest kept at the repository root (hidden, so never listed itself).
+MANIFEST_FILE = ".index-manifest.json"
+# Bump whenever the generated page markup changes so every index is rebuilt once.
+# 2: precompiled skeleton, sitemap crawl, grouped/detailed/paginated listings.
+TEMPLATE_VERSION = 2
+# Listing presentation: grouping ("none", "date" or "type"), per-file size and
+# date details, and the number of entries per page before a listing is split
+# into index.html, index-2.html, ... (0 disables pagination).
+ListingOptions = namedtuple('ListingOptions', ['group_by', 'details', 'page_size'])
+DEFAULT_LISTING_OPTIONS = ListingOptions('none', False, 100)
+GROUP_CHOICES = ('none', 'date', 'type')
+# Extra pages of a paginated listing (never listed themselves).
+PAGE_FILE_PATTERN = re.compile(r'^index-(\d+)\.html$')
+# Meet files start with their date, e.g. 2025-06-16_GG_v_WW.html
+DATE_PREFIX_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})')
+# Site-wide machine-readable outputs written to the repository root on request.
+SITE_MANIFEST_FILE = "manifest.json"
+SITEMAP_FILE = "sitemap.xml"
+SITE_MANIFEST_VERSION = 1
+# File types listed in sitemap.xml (directory pages are always listed).
+SITEMAP_EXTENSIONS = ('.html', '.pdf')
+
+# One crawled directory: its path, repository-relative key and "../" prefix back to
+# the root, its visible subdirectory and file names, and the DirEntry objects for
+# its visible files (whose stat results os.scandir has already cached).
+DirectoryScan = namedtuple('DirectoryScan', ['path', 'key', 'rel_to_root', 'subdirs', 'files', 'file_entries'])
+
+# Pages are written from worker threads; keep their progress lines from interleaving.
+_print_lock = threading.Lock()
+
+def report(message):
+    """Prints a progress line atomically (safe to call from writer threads)."""
+    with _print_lock:
+        print(message)
+
+# --- Page Skeleton ---
+# Everything except the title, stylesheet paths, breadcrumb and item list is
+# identical for every directory, so the page is split into static chunks once
+# at import and each directory only fills in its slots.
+PAGE_HEAD_OPEN = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>""" + html.escape(PAGE_TITLE) + " - "
+
+PAGE_CSS_LINK_OPEN = """</title>
+  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
+  <link rel="stylesheet" href=\""""
+
+PAGE_UTILITIES_LINK_OPEN = """">
+  <link rel="stylesheet" href=\""""
+
+PAGE_HEADER_OPEN = """">
+  <style>
+    /* Breadcrumb navigation styles */
+    .gpsa-header h1 a {
+      color: white;
+      text-decoration: none;
+      opacity: 0.9;
+      transition: opacity 0.2s;
+    }
+    .gpsa-header h1 a:hover {
+      opacity: 1;
+      text-decoration: underline;
+    }
+
+    /* Directory-specific styles */
+    .directory-item {
+      transition: all 0.2s;
+    }
+    .directory-item:hover {
+      transform: translateX(4px);
+      background-color: #f9fafb;
+    }
+    .directory-icon {
+      font-size: 1.5rem;
+      margin-right: 0.75rem;
+    }
+  </style>
+</head>
+<body>
+  <main class="container mx-auto p-4 sm:p-6 lg:p-8">
+    <div class="max-w-7xl mx-auto">
+      <!-- Standardized GPSA header with logo -->
+      <header class="gpsa-header p-4 shadow-md flex items-center justify-center no-print mb-6 rounded-lg">
+        <img src="https://publicity.gpsaswimming.org/assets/gpsa_logo.png"
+             alt="GPSA Logo"
+             class="h-16 w-16 md:h-20 md:w-20 mr-4 rounded-full"
+             onerror="this.onerror=null; this.src='https://placehold.co/100x100/002366/FFFFFF?text=GPSA';">
+        <div>
+          """
+
+PAGE_LISTING_OPEN = """
+          <p class="gpsa-header-subtitle">Directory Listing</p>
+        </div>
+      </header>
+
+      <!-- Directory contents -->
+      <div class="bg-white rounded-xl shadow-lg p-6">
+"""
+
+PAGE_EMPTY_LISTING = """        <p class="text-gray-500 text-center py-8">No files or directories found.</p>\n"""
+
+PAGE_SUFFIX = """      </div>
+
+      <!-- Footer -->
+      <div class="text-center mt-6 text-gray-500 text-sm">
+        <p>Greater Peninsula Swimming Association</p>
+      </div>
+    </div>
+  </main>
+</body>
+</html>"""
+
+# List item chunks: ITEM_OPEN + link + ITEM_ICON_OPEN + icon + ITEM_NAME_OPEN + name + ITEM_CLOSE
+ITEM_OPEN = """          <li class="directory-item">
+            <a href='"""
+ITEM_ICON_OPEN = """' class="flex items-center p-3 rounded-lg border border-gray-200" style="text-decoration: none; color: #002366;">
+              <span class="directory-icon">"""
+ITEM_NAME_OPEN = """</span>
+              <span class="font-medium">"""
+ITEM_DETAILS_OPEN = """</span>
+              <span class="ml-auto text-sm text-gray-500">"""
+ITEM_CLOSE = """</span>
+            </a>
+          </li>\n"""
+
+GROUP_OPEN = """        <section class="mb-6">
+          <h2 class="text-lg font-semibold text-gpsa-blue mb-4">"""
+GROUP_LIST_OPEN = """</h2>
+"""
+GROUP_CLOSE = """        </section>\n"""
+
+PAGER_OPEN = """        <nav class="flex flex-wrap justify-center gap-2 mt-6" aria-label="Pages">\n"""
+PAGER_CLOSE = """        </nav>\n"""
+
+def is_page_file(name):
+    """True for files the generator writes itself (index.html and its extra pages)."""
+    return name == OUTPUT_FILE or PAGE_FILE_PATTERN.match(name) is not None
+
+def page_filename(page_number):
+    """Returns the file name of a listing page (1 -> index.html, 2 -> index-2.html)."""
+    return OUTPUT_FILE if page_number == 1 else f"index-{page_number}.html"
+
+def format_size(size):
+    """Formats a byte count for display (e.g. 512 B, 14.2 KB, 3.1 MB)."""
+    if size < 1024:
+        return f"{size} B"
+    for unit in ('KB', 'MB', 'GB'):
+        size /= 1024
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f} {unit}"
+
+def format_details(stat_result):
+    """Formats the size and modification date shown next to a file."""
+    size, mtime = stat_result
+    modified = datetime.fromtimestamp(mtime, timezone.utc).strftime('%Y-%m-%d')
+    return f"{format_size(size)} · {modified}"
+
+def item_group(name, is_dir, group_by):
+    """
+    Returns the (sort key, heading) of the group an entry belongs to.
+
+    Folders always come first. Date grouping uses the YYYY-MM-DD prefix of meet
+    files; type grouping uses the file extension.
+    """
+    if is_dir:
+        return (0, ''), "Folders"
+    if group_by == 'date':
+        match = DATE_PREFIX_PATTERN.match(name)
+        if match:
+            try:
+                day = datetime(*map(int, match.groups()))
+            except ValueError:
+                pass
+            else:
+                return (1, match.group(0)), f"{day:%B} {day.day}, {day.year}"
+    else:
+        extension = os.path.splitext(name)[1].lower().lstrip('.')
+        if extension:
+            return (1, extension), f"{extension.upper()} files"
+    return (2, ''), "Other files"
+
+def order_items(items, subdir_set, group_by):
+    """
+    Orders entries for display, keeping each group's entries contiguous so that
+    pagination never interleaves groups.
+
+    Returns:
+        list: (name, group heading or None) tuples.
+    """
+    if group_by == 'none':
+        return [(name, None) for name in items]
+    keyed = []
+    for name in items:
+        key, heading = item_group(name, name in subdir_set, group_by)
+        keyed.append((key, name.lower(), name, heading))
+    keyed.sort()
+    return [(name, heading) for _, _, name, heading in keyed]
+
+def render_pager(page_number, page_count):
+    """Renders the links between the pages of a paginated listing."""
+    parts = [PAGER_OPEN]
+    for number in range(1, page_count + 1):
+        if number == page_number:
+            parts.append(f'          <span class="p-3 rounded-lg border border-gray-200 font-bold" aria-current="page">{number}</span>\n')
+        else:
+            parts.append(f'          <a href="{page_filename(number)}" class="p-3 rounded-lg border border-gray-200">{number}</a>\n')
+    parts.append(PAGER_CLOSE)
+    return ''.join(parts)
+
+def render_listing(items, subdir_set, file_stats=None):
+    """
+    Renders the directory list for a page.
+
+    Args:
+        items (list): Sorted entry names to list.
+        subdir_set (set): Names among items that are directories.
+        file_stats (dict, optional): File name -> (size, mtime); when given, each
+                                     file shows its size and modification date.
+
+    Returns:
+        str: The <ul> block with one <li> per entry.
+    """
+    parts = ["""        <ul class="space-y-2">\n"""]
+    for item_name in items:
+        escaped_item = html.escape(item_name)
+
+        # Check if the item is a directory (it will be in the subdirs set)
+        if item_name in subdir_set:
+            parts += (ITEM_OPEN, escaped_item, '/', ITEM_ICON_OPEN, "📁", ITEM_NAME_OPEN, escaped_item, ITEM_CLOSE)
+        elif file_stats is not None and item_name in file_stats:
+            parts += (ITEM_OPEN, escaped_item, ITEM_ICON_OPEN, "📄", ITEM_NAME_OPEN, escaped_item,
+                      ITEM_DETAILS_OPEN, format_details(file_stats[item_name]), ITEM_CLOSE)
+        else:
+            parts += (ITEM_OPEN, escaped_item, ITEM_ICON_OPEN, "📄", ITEM_NAME_OPEN, escaped_item, ITEM_CLOSE)
+    parts.append("""        </ul>\n""")
+    return ''.join(parts)
+
+def render_grouped_listing(ordered, subdir_set, file_stats=None):
+    """
+    Renders a page's entries as one headed section per group.
+
+    Args:
+        ordered (list): (name, heading) tuples from order_items(), already grouped.
+        subdir_set (set): Names that are directories.
+        file_stats (dict, optional): See render_listing().
+
+    Returns:
+        str: The grouped listing markup.
+    """
+    parts = []
+    start = 0
+    while start < len(ordered):
+        heading = ordered[start][1]
+        end = start
+        while end < len(ordered) and ordered[end][1] == heading:
+            end += 1
+        names = [name for name, _ in ordered[start:end]]
+        parts += (GROUP_OPEN, html.escape(heading), GROUP_LIST_OPEN,
+                  render_listing(names, subdir_set, file_stats), GROUP_CLOSE)
+        start = end
+    return ''.join(parts)
 
 def find_repository_root(start_path):
     """
@@ -59,32 +333,45 @@ def calculate_relative_path_to_css(current_path, repo_root):
     # os.path.relpath returns things like "..", "../..", etc.
     return rel_path.replace('\\', '/') + '/'  # Ensure forward slashes for URLs
 
-def generate_index_for_single_directory(current_path, subdirs, files, repo_root):
+def generate_index_for_single_directory(current_path, subdirs, files, repo_root, rel_to_root=None, rel_path=None,
+                                        file_entries=None, options=DEFAULT_LISTING_OPTIONS):
     """
     Generates an index.html file for a single directory using GPSA branding.
 
+    Listings longer than options.page_size are split across index.html,
+    index-2.html, ... with page links; extra pages left over from a longer
+    listing are removed.
+
     Args:
         current_path (str): The path to the directory where the index file will be created.
         subdirs (list): A list of visible subdirectory names in current_path.
         files (list): A list of visible file names in current_path.
         repo_root (str): The repository root path where css/ folder exists.
+        rel_to_root (str, optional): Precomputed prefix back to the repository root ("../..").
+        rel_path (str, optional): Precomputed path of current_path relative to the root ("." for the root).
+        file_entries (list, optional): os.DirEntry objects for the files, used for size and date details.
+        options (ListingOptions): Grouping, details and pagination settings.
+
+    Returns:
+        bool: True if the index file was written.
     """
     try:
         # Calculate relative path to CSS file in repository root
-        rel_to_root = calculate_relative_path_to_css(current_path, repo_root)
+        if rel_to_root is None:
+            rel_to_root = calculate_relative_path_to_css(current_path, repo_root)
         css_path = f"{rel_to_root}css/gpsa-tools-common.css"
+        utilities_css_path = f"{rel_to_root}{UTILITY_CSS_RELPATH}"
 
         # Get the display name and build breadcrumb navigation
-        current_abs = os.path.abspath(current_path)
-        repo_abs = os.path.abspath(repo_root)
+        if rel_path is None:
+            rel_path = os.path.relpath(os.path.abspath(current_path), os.path.abspath(repo_root)).replace('\\', '/')
 
-        if current_abs == repo_abs:
+        if rel_path == '.':
             # We're at the repository root
-            dir_name = os.path.basename(repo_abs)
+            dir_name = os.path.basename(os.path.abspath(repo_root))
             breadcrumb_html = f'<h1 class="text-2xl sm:text-3xl md:text-4xl font-bold">{html.escape(dir_name)}</h1>'
         else:
             # Build breadcrumb navigation
-            rel_path = os.path.relpath(current_abs, repo_abs).replace('\\', '/')
             path_parts = rel_path.split('/')
 
             breadcrumbs = []
@@ -108,124 +395,328 @@ def generate_index_for_single_directory(current_path, subdirs, files, repo_root)
             dir_name = rel_path  # For debug output
 
         # Debug output to show path calculation
-        print(f"  → CSS path: {css_path} | Display: {dir_name}")
+        report(f"  → CSS path: {css_path} | Display: {dir_name}")
 
         # Combine subdirectories and files, then sort alphabetically
         all_items = sorted(subdirs + files, key=str.lower)
 
-        # Filter out the index.html file itself from the list
-        all_items = [item for item in all_items if item != OUTPUT_FILE]
+        # Filter out the index pages themselves from the list
+        all_items = [item for item in all_items if not is_page_file(item)]
+
+        subdir_set = set(subdirs)
+        file_stats = None
+        if options.details and file_entries is not None:
+            file_stats = {}
+            for entry in file_entries:
+                stat = entry.stat()
+                file_stats[entry.name] = (stat.st_size, stat.st_mtime)
+
+        ordered = order_items(all_items, subdir_set, options.group_by)
+        page_size = options.page_size if options.page_size > 0 else max(len(ordered), 1)
+        pages = [ordered[i:i + page_size] for i in range(0, len(ordered), page_size)] or [[]]
+
+        for page_number, page_items in enumerate(pages, 1):
+            if not page_items:
+                listing_html = PAGE_EMPTY_LISTING
+            elif options.group_by == 'none':
+                listing_html = render_listing([name for name, _ in page_items], subdir_set, file_stats)
+            else:
+                listing_html = render_grouped_listing(page_items, subdir_set, file_stats)
+            if len(pages) > 1:
+                listing_html += render_pager(page_number, len(pages))
+
+            # Fill the per-directory slots of the precompiled skeleton in a single join
+            html_content = ''.join((
+                PAGE_HEAD_OPEN, html.escape(dir_name),
+                PAGE_CSS_LINK_OPEN, css_path,
+                PAGE_UTILITIES_LINK_OPEN, utilities_css_path,
+                PAGE_HEADER_OPEN, breadcrumb_html,
+                PAGE_LISTING_OPEN,
+                listing_html,
+                PAGE_SUFFIX,
+            ))
+
+            # Write the content to the HTML file in the current directory
+            output_file_path = os.path.join(current_path, page_filename(page_number))
+            with open(output_file_path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+
+        # Remove extra pages left over from a previously longer listing
+        for name in files:
+            match = PAGE_FILE_PATTERN.match(name)
+            if match and int(match.group(1)) > len(pages):
+                os.remove(os.path.join(current_path, name))
+
+        page_note = f" ({len(pages)} pages)" if len(pages) > 1 else ""
+        report(f"✅ Index generated for: '{os.path.join(current_path, OUTPUT_FILE)}'{page_note}")
+        return True
 
-        # Start building the HTML content with GPSA branding
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{html.escape(PAGE_TITLE)} - {html.escape(dir_name)}</title>
-  <script src="https://cdn.tailwindcss.com"></script>
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-  <link rel="stylesheet" href="{css_path}">
-  <style>
-    /* Breadcrumb navigation styles */
-    .gpsa-header h1 a {{
-      color: white;
-      text-decoration: none;
-      opacity: 0.9;
-      transition: opacity 0.2s;
-    }}
-    .gpsa-header h1 a:hover {{
-      opacity: 1;
-      text-decoration: underline;
-    }}
+    except Exception as e:
+        report(f"❌ An error occurred while processing {current_path}: {e}")
+        return False
 
-    /* Directory-specific styles */
-    .directory-item {{
-      transition: all 0.2s;
-    }}
-    .directory-item:hover {{
-      transform: translateX(4px);
-      background-color: #f9fafb;
-    }}
-    .directory-icon {{
-      font-size: 1.5rem;
-      margin-right: 0.75rem;
-    }}
-  </style>
-</head>
-<body>
-  <main class="container mx-auto p-4 sm:p-6 lg:p-8">
-    <div class="max-w-7xl mx-auto">
-      <!-- Standardized GPSA header with logo -->
-      <header class="gpsa-header p-4 shadow-md flex items-center justify-center no-print mb-6 rounded-lg">
-        <img src="https://publicity.gpsaswimming.org/assets/gpsa_logo.png"
-             alt="GPSA Logo"
-             class="h-16 w-16 md:h-20 md:w-20 mr-4 rounded-full"
-             onerror="this.onerror=null; this.src='https://placehold.co/100x100/002366/FFFFFF?text=GPSA';">
-        <div>
-          {breadcrumb_html}
-          <p class="gpsa-header-subtitle">Directory Listing</p>
-        </div>
-      </header>
+def load_manifest(repo_root):
+    """
+    Loads the listing manifest from the repository root.
 
-      <!-- Directory contents -->
-      <div class="bg-white rounded-xl shadow-lg p-6">
-"""
+    Returns:
+        dict: Manifest with "template_version", "listing_options" and "directories" keys.
+              A missing, unreadable or outdated manifest yields an empty one, forcing a full rebuild.
+    """
+    manifest_path = os.path.join(repo_root, MANIFEST_FILE)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('template_version') == TEMPLATE_VERSION:
+            return manifest
+        print("ℹ️  Template version changed, rebuilding all index pages")
+    except (OSError, ValueError):
+        pass
+    return {'template_version': TEMPLATE_VERSION, 'listing_options': list(DEFAULT_LISTING_OPTIONS), 'directories': {}}
+
+def save_manifest(repo_root, manifest):
+    """
+    Writes the listing manifest to the repository root.
+
+    Args:
+        repo_root (str): The repository root path.
+        manifest (dict): Manifest as returned by load_manifest().
+    """
+    manifest_path = os.path.join(repo_root, MANIFEST_FILE)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
 
-        # Generate list items for each file/directory
-        if not all_items:
-            html_content += """        <p class="text-gray-500 text-center py-8">No files or directories found.</p>\n"""
+def directory_listing(subdirs, files, file_entries=None):
+    """
+    Builds the manifest listing for a directory: the sorted visible entries the page shows.
+
+    Directories carry a trailing slash so a file and folder swap is detected.
+    When file_entries are given (pages showing file details), each file also
+    carries its size and mtime so an edited file refreshes the page.
+
+    Args:
+        subdirs (list): Visible subdirectory names.
+        files (list): Visible file names.
+        file_entries (list, optional): os.DirEntry objects for the files.
+
+    Returns:
+        list: Sorted listing entries.
+    """
+    if file_entries is None:
+        entries = [f for f in files if not is_page_file(f)]
+    else:
+        entries = []
+        for entry in file_entries:
+            if not is_page_file(entry.name):
+                stat = entry.stat()
+                entries.append(f"{entry.name}\t{stat.st_size}\t{int(stat.st_mtime)}")
+    entries += [f"{d}/" for d in subdirs]
+    return sorted(entries)
+
+def scan_directories(root_path, root_key, root_prefix):
+    """
+    Walks a directory tree top-down with os.scandir.
+
+    Excluded and hidden entries are filtered while scanning, and each child's
+    root-relative key and "../" prefix are derived from its parent's instead of
+    being recomputed with relpath. Symlinked directories are listed but not
+    descended into, matching os.walk's defaults.
+
+    Args:
+        root_path (str): The directory to start from.
+        root_key (str): root_path relative to the repository root ("." for the root).
+        root_prefix (str): Relative prefix from root_path back to the repository root.
+
+    Yields:
+        DirectoryScan: One entry per visited directory.
+    """
+    stack = [(root_path, root_key, root_prefix)]
+    while stack:
+        path, key, prefix = stack.pop()
+        subdirs, files, file_entries = [], [], []
+        descend = []
+
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        if name in EXCLUDE_DIRS:
+                            continue
+                        subdirs.append(name)
+                        if not entry.is_symlink():
+                            descend.append(name)
+                    else:
+                        files.append(name)
+                        file_entries.append(entry)
+        except OSError as e:
+            print(f"❌ Could not scan {path}: {e}")
+            continue
+
+        yield DirectoryScan(path, key, prefix, subdirs, files, file_entries)
+
+        child_prefix = '../' + prefix
+        for name in sorted(descend, reverse=True):
+            child_key = name if key == '.' else f"{key}/{name}"
+            stack.append((os.path.join(path, name), child_key, child_prefix))
+
+def file_sha256(path):
+    """
+    Computes the SHA-256 hex digest of a file, reading it in 1 MB chunks.
+
+    Args:
+        path (str): The file to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def describe_files(file_entries, previous_files):
+    """
+    Builds manifest records (size, mtime, sha256) for a directory's files.
+
+    Sizes and mtimes come from the DirEntry stat results cached by the crawl;
+    a file is only re-hashed when its size or mtime differs from the previous
+    manifest.
+
+    Args:
+        file_entries (list): os.DirEntry objects for the directory's visible files.
+        previous_files (dict): The directory's "files" mapping from the previous manifest.
+
+    Returns:
+        dict: File name -> {"size", "mtime", "sha256"}.
+    """
+    files = {}
+    for entry in file_entries:
+        stat = entry.stat()
+        size, mtime = stat.st_size, int(stat.st_mtime)
+        previous = previous_files.get(entry.name)
+        if previous and previous.get('size') == size and previous.get('mtime') == mtime:
+            sha256 = previous['sha256']
         else:
-            html_content += """        <ul class="space-y-2">\n"""
-            for item_name in all_items:
-                escaped_item = html.escape(item_name)
-
-                # Check if the item is a directory (it will be in the subdirs list)
-                if item_name in subdirs:
-                    icon = "📁"
-                    link_target = f"{escaped_item}/"
-                    item_type = "Directory"
-                else:
-                    icon = "📄"
-                    link_target = escaped_item
-                    item_type = "File"
-
-                html_content += f"""          <li class="directory-item">
-            <a href='{link_target}' class="flex items-center p-3 rounded-lg border border-gray-200" style="text-decoration: none; color: #002366;">
-              <span class="directory-icon">{icon}</span>
-              <span class="font-medium">{escaped_item}</span>
-            </a>
-          </li>\n"""
-            html_content += """        </ul>\n"""
+            sha256 = file_sha256(entry.path)
+        files[entry.name] = {'size': size, 'mtime': mtime, 'sha256': sha256}
+    return files
 
-        # Finish the HTML content
-        html_content += """      </div>
+def load_site_manifest(repo_root):
+    """
+    Loads manifest.json from the repository root.
 
-      <!-- Footer -->
-      <div class="text-center mt-6 text-gray-500 text-sm">
-        <p>Greater Peninsula Swimming Association</p>
-      </div>
-    </div>
-  </main>
-</body>
-</html>"""
+    Returns:
+        dict: Manifest with "version" and "directories" keys (empty if missing or outdated).
+    """
+    try:
+        with open(os.path.join(repo_root, SITE_MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == SITE_MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': SITE_MANIFEST_VERSION, 'directories': {}}
+
+def save_site_manifest(repo_root, manifest):
+    """
+    Writes manifest.json to the repository root in compact form.
 
-        # Write the content to the HTML file in the current directory
-        output_file_path = os.path.join(current_path, OUTPUT_FILE)
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    Args:
+        repo_root (str): The repository root path.
+        manifest (dict): Manifest as returned by load_site_manifest().
+    """
+    with open(os.path.join(repo_root, SITE_MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, separators=(',', ':'), sort_keys=True)
+        f.write('\n')
 
-        print(f"✅ Index generated for: '{output_file_path}'")
+def site_base_url(repo_root):
+    """
+    Derives the site's base URL from the CNAME file in the repository root.
 
-    except Exception as e:
-        print(f"❌ An error occurred while processing {current_path}: {e}")
+    Returns:
+        str: Base URL ending in "/", or None if there is no CNAME file.
+    """
+    try:
+        with open(os.path.join(repo_root, 'CNAME'), 'r', encoding='utf-8') as f:
+            domain = f.read().strip()
+    except OSError:
+        return None
+    return f"https://{domain}/" if domain else None
+
+def write_sitemap(repo_root, manifest, base_url):
+    """
+    Writes sitemap.xml to the repository root from the site manifest.
+
+    Every indexed directory is listed by its directory URL, plus any files with
+    a SITEMAP_EXTENSIONS extension other than the index pages themselves.
+
+    Args:
+        repo_root (str): The repository root path.
+        manifest (dict): Site manifest covering the crawled directories.
+        base_url (str): Absolute site URL ending in "/".
 
-def crawl_and_index(root_path):
+    Returns:
+        int: Number of URLs written.
+    """
+    def lastmod(mtime):
+        return datetime.fromtimestamp(mtime, timezone.utc).strftime('%Y-%m-%d')
+
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    count = 0
+    for key in sorted(manifest['directories']):
+        directory = manifest['directories'][key]
+        dir_url = base_url if key == '.' else f"{base_url}{quote(key)}/"
+        index_record = directory['files'].get(OUTPUT_FILE)
+
+        lines.append(f"  <url><loc>{html.escape(dir_url)}</loc>"
+                     + (f"<lastmod>{lastmod(index_record['mtime'])}</lastmod>" if index_record else '')
+                     + "</url>")
+        count += 1
+
+        for name in sorted(directory['files']):
+            if name == OUTPUT_FILE or not name.lower().endswith(SITEMAP_EXTENSIONS):
+                continue
+            record = directory['files'][name]
+            lines.append(f"  <url><loc>{html.escape(dir_url + quote(name))}</loc>"
+                         f"<lastmod>{lastmod(record['mtime'])}</lastmod></url>")
+            count += 1
+
+    lines.append('</urlset>')
+    with open(os.path.join(repo_root, SITEMAP_FILE), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return count
+
+def crawl_and_index(root_path, force=False, jobs=None, sitemap=False, site_manifest=False, base_url=None,
+                    options=DEFAULT_LISTING_OPTIONS):
     """
     Recursively walks through a directory tree and generates an index file in each subdirectory.
 
+    Directories are scanned with os.scandir on the calling thread while pages are
+    rendered and written on a thread pool, so indexing overlaps with disk I/O.
+
+    Only directories whose visible listing differs from the manifest (or whose
+    index.html is missing) are regenerated. Breadcrumbs depend only on a
+    directory's own path, which is its manifest key, so adding or removing a
+    folder rebuilds just that folder and its parent, whose listing changed.
+
+    With sitemap or site_manifest, the same pass also records every file's size,
+    mtime and content hash into manifest.json at the repository root (merged
+    with entries outside the crawled subtree), and sitemap.xml is rebuilt from it.
+
     Args:
         root_path (str): The root directory to start crawling from.
+        force (bool): Regenerate every index page regardless of the manifest.
+        jobs (int, optional): Number of writer threads (default: ThreadPoolExecutor's default).
+        sitemap (bool): Write sitemap.xml to the repository root.
+        site_manifest (bool): Write manifest.json to the repository root.
+        base_url (str, optional): Absolute site URL for sitemap.xml (default: from CNAME).
+        options (ListingOptions): Grouping, details and pagination settings for the pages.
     """
     if not os.path.isdir(root_path):
         print(f"❌ Error: The specified root path '{root_path}' is not a valid directory.")
@@ -240,17 +731,100 @@ def crawl_and_index(root_path):
     print(f"🚀 Starting crawl from '{crawl_start_path}'...")
     print(f"📁 Repository root detected at '{repo_root}'")
 
-    for current_path, dir_names, file_names in os.walk(root_path, topdown=True):
-        # Modify dir_names in-place to prevent os.walk from traversing into excluded or hidden directories
-        dir_names[:] = [d for d in dir_names if d not in EXCLUDE_DIRS and not d.startswith('.')]
-
-        # Filter out hidden files from the file_names list
-        visible_files = [f for f in file_names if not f.startswith('.')]
-
-        # Pass the repository root (not the crawl start path) for CSS path calculation
-        generate_index_for_single_directory(current_path, dir_names, visible_files, repo_root)
-
-    print("\n✨ Crawl complete!")
+    if sitemap:
+        base_url = base_url or site_base_url(repo_root)
+        if not base_url:
+            print("❌ Error: No CNAME file found; pass --base-url to build the sitemap.")
+            sys.exit(1)
+        if not base_url.endswith('/'):
+            base_url += '/'
+
+    describe = sitemap or site_manifest
+    site = load_site_manifest(repo_root) if describe else None
+
+    manifest = load_manifest(repo_root)
+    listings = manifest['directories']
+    if manifest.get('listing_options', list(DEFAULT_LISTING_OPTIONS)) != list(options):
+        print("ℹ️  Listing options changed, rebuilding all index pages")
+        listings.clear()
+    manifest['listing_options'] = list(options)
+    crawl_key = os.path.relpath(crawl_start_path, repo_root).replace('\\', '/')
+    crawl_prefix = calculate_relative_path_to_css(crawl_start_path, repo_root)
+    seen_keys = set()
+    pending = []
+    described = []
+    unchanged = 0
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for scan in scan_directories(root_path, crawl_key, crawl_prefix):
+            if scan.key == '.':
+                # The site-wide outputs are not part of the root listing
+                generated_files = {SITE_MANIFEST_FILE, SITEMAP_FILE}
+                scan = scan._replace(
+                    files=[f for f in scan.files if f not in generated_files],
+                    file_entries=[e for e in scan.file_entries if e.name not in generated_files])
+
+            listing = directory_listing(scan.subdirs, scan.files,
+                                        scan.file_entries if options.details else None)
+            seen_keys.add(scan.key)
+
+            if describe:
+                previous_files = site['directories'].get(scan.key, {}).get('files', {})
+                future = executor.submit(describe_files, scan.file_entries, previous_files)
+                described.append((scan.key, sorted(scan.subdirs), future))
+
+            if (not force and listings.get(scan.key) == listing
+                    and OUTPUT_FILE in scan.files):
+                unchanged += 1
+                continue
+
+            # Pass the repository root (not the crawl start path) for CSS path calculation
+            future = executor.submit(generate_index_for_single_directory, scan.path, scan.subdirs,
+                                     scan.files, repo_root, scan.rel_to_root, scan.key,
+                                     scan.file_entries, options)
+            pending.append((scan.key, listing, future))
+
+    regenerated = set()
+    for key, listing, future in pending:
+        if future.result():
+            listings[key] = listing
+            regenerated.add(key)
+    generated = len(regenerated)
+
+    # Forget directories under the crawl root that no longer exist
+    def in_crawl(key):
+        return crawl_key == '.' or key == crawl_key or key.startswith(crawl_key + '/')
+
+    for key in list(listings):
+        if in_crawl(key) and key not in seen_keys:
+            del listings[key]
+
+    save_manifest(repo_root, manifest)
+
+    print(f"\n✨ Crawl complete! {generated} index page(s) generated, {unchanged} unchanged.")
+
+    if describe:
+        directories = site['directories']
+        for key in list(directories):
+            if in_crawl(key) and key not in seen_keys:
+                del directories[key]
+        for key, subdirs, future in described:
+            files = future.result()
+            if key in regenerated:
+                # The pages were rewritten after the scan, so describe the new files
+                for name in [name for name in files if is_page_file(name)]:
+                    del files[name]
+                with os.scandir(os.path.join(repo_root, key)) as entries:
+                    pages = [entry for entry in entries if is_page_file(entry.name)]
+                files.update(describe_files(pages, {}))
+            directories[key] = {'dirs': subdirs, 'files': files}
+
+        if site_manifest:
+            save_site_manifest(repo_root, site)
+            print(f"🗂️  Manifest written: {len(directories)} directories in '{SITE_MANIFEST_FILE}'")
+        if sitemap:
+            url_count = write_sitemap(repo_root, site, base_url)
+            print(f"🗺️  Sitemap written: {url_count} URLs in '{SITEMAP_FILE}'")
 
 def main():
     """
@@ -264,9 +838,55 @@ def main():
         "folder_path",
         help="The root path of the folder to crawl and index."
     )
-    
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every index page, ignoring the listing manifest."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Number of threads rendering and writing pages (default: Python's thread pool default)."
+    )
+    parser.add_argument(
+        "--group-by",
+        choices=GROUP_CHOICES,
+        default=DEFAULT_LISTING_OPTIONS.group_by,
+        help="Group entries under headings by meet date or file type (default: none)."
+    )
+    parser.add_argument(
+        "--details",
+        action="store_true",
+        help="Show each file's size and modification date."
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_LISTING_OPTIONS.page_size,
+        help=f"Entries per page before a listing is split into index-2.html, ... "
+             f"(default: {DEFAULT_LISTING_OPTIONS.page_size}, 0 disables pagination)."
+    )
+    parser.add_argument(
+        "--sitemap",
+        action="store_true",
+        help="Also write sitemap.xml to the repository root."
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help="Also write manifest.json (names, sizes, mtimes, SHA-256 hashes) to the repository root."
+    )
+    parser.add_argument(
+        "--base-url",
+        help="Absolute site URL for sitemap.xml (default: https://<CNAME>/)."
+    )
+
     args = parser.parse_args()
-    crawl_and_index(args.folder_path)
+    options = ListingOptions(args.group_by, args.details, args.page_size)
+    crawl_and_index(args.folder_path, force=args.force, jobs=args.jobs,
+                    sitemap=args.sitemap, site_manifest=args.manifest, base_url=args.base_url,
+                    options=options)
 
 if __name__ == "__main__":
     main()
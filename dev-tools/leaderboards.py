@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+GPSA Season Leaderboards
+Keeps the season's top times per event and publishes them as a page and JSON.
+
+For every individual event (by event catalog id) the k fastest
+swims of the season are kept, at most one per swimmer (their best). Each event
+holds a bounded max-heap of its current top k, so ingesting a meet night costs
+O(swims x log k) no matter how many meets the season already has; earlier
+meets are never reparsed.
+
+The leaderboards are stored in leaderboards.json next to the season's meet
+pages (results/YYYY/), and rendered as leaderboards.html; events carry their
+catalog id and label. Neither publishes swimmers' ages or ids (most swimmers are
+minors). The state the next run loads and updates, with those fields and the
+meets already ingested (so feeding the same .sd3 again is a no-op), is
+.leaderboards-state.json next to them, which is gitignored.
+"""
+
+import argparse
+import heapq
+import html
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from build_archive import setup_logging
+from bulk_process_results import HTMLGenerator
+from event_catalog import EventCatalog
+from swims import PRIVATE_FIELDS, IncrementalSwimStore, Swim, check_store_paths, folder_season, format_time
+
+# --- Configuration ---
+DEFAULT_TOP_K = 10
+LEADERBOARDS_JSON = 'leaderboards.json'
+LEADERBOARDS_HTML = 'leaderboards.html'
+STATE_FILENAME = '.leaderboards-state.json'
+FORMAT_VERSION = 3
+
+
+class TopK:
+    """
+    The k fastest swims of one event, at most one per swimmer.
+
+    The heap is keyed on (-seconds, -order), so its root is the entry that
+    would be dropped next: the slowest time, and among equal times the one
+    added last (earlier swims keep ties). A swim that does not beat the root of
+    a full heap is rejected in O(1); admitting one costs O(log k). A swimmer
+    already on the board who improves is updated in place, which costs O(k) but
+    only happens when that swimmer sets a new best.
+    """
+
+    __slots__ = ('k', '_heap', '_best')
+
+    def __init__(self, k: int):
+        self.k = k
+        # (-seconds, -order, swimmer_key, entry)
+        self._heap: List[Tuple[float, int, str, Dict]] = []
+        # swimmer_key -> seconds, for swimmers currently on the board
+        self._best: Dict[str, float] = {}
+
+    def offer(self, seconds: float, order: int, key: str, entry: Dict) -> bool:
+        """Add a swim if it makes the board; returns True if the board changed."""
+        best = self._best.get(key)
+        if best is not None:
+            if seconds >= best:
+                return False
+            self._heap = [item for item in self._heap if item[2] != key]
+            self._heap.append((-seconds, -order, key, entry))
+            heapq.heapify(self._heap)
+        elif len(self._heap) < self.k:
+            heapq.heappush(self._heap, (-seconds, -order, key, entry))
+        elif seconds < -self._heap[0][0]:
+            dropped = heapq.heapreplace(self._heap, (-seconds, -order, key, entry))
+            del self._best[dropped[2]]
+        else:
+            return False
+        self._best[key] = seconds
+        return True
+
+    def ranked(self) -> List[Dict]:
+        """Board entries, fastest first."""
+        return [item[3] for item in sorted(self._heap, key=lambda item: (-item[0], -item[1]))]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class Leaderboards(IncrementalSwimStore):
+    """Season top-k leaderboards for every individual event, updated one meet at a time."""
+
+    SEASON_MISMATCH = "these are the {season} leaderboards"
+    CHANGE_LABEL = 'leaderboard change(s)'
+
+    def __init__(self, k: int = DEFAULT_TOP_K, season: Optional[int] = None,
+                 catalog: Optional[EventCatalog] = None):
+        super().__init__(season, catalog)
+        self.k = k
+        # Event catalog id -> board
+        self.boards: Dict[int, TopK] = {}
+        self._order = 0
+
+    def add(self, swim: Swim) -> bool:
+        """Offer one swim to its event's board; returns True if the board changed."""
+        board = self.boards.get(swim.event)
+        if board is None:
+            board = self.boards[swim.event] = TopK(self.k)
+        self._order += 1
+        entry = {'swimmer': swim.swimmer, 'swimmer_id': swim.swimmer_key, 'team': swim.team, 'age': swim.age,
+                 'time': format_time(swim.seconds), 'seconds': swim.seconds, 'meet': swim.meet, 'date': swim.date}
+        return board.offer(swim.seconds, self._order, swim.swimmer_key, entry)
+
+    def add_swims(self, data: Dict, swims: List[Swim]) -> int:
+        """Offer every swim of a new meet; returns the number of board changes."""
+        return sum(self.add(swim) for swim in swims)
+
+    def events(self) -> List[int]:
+        """Event ids with a board, in program order."""
+        return sorted(self.boards, key=self.catalog.sort_key)
+
+    def _entries(self, event_id: int, private: bool) -> List[Dict]:
+        """An event's ranked entries, with their rank and (if private) PRIVATE_FIELDS."""
+        entries = []
+        for rank, entry in enumerate(self.boards[event_id].ranked(), 1):
+            if not private:
+                entry = {name: value for name, value in entry.items() if name not in PRIVATE_FIELDS}
+            entries.append(dict(entry, rank=rank))
+        return entries
+
+    def to_dict(self, private: bool = False) -> Dict:
+        """
+        JSON-serializable leaderboards: the format of leaderboards.json, or with
+        private=True the state file, whose entries keep PRIVATE_FIELDS.
+        """
+        return {
+            'version': FORMAT_VERSION,
+            'season': self.season,
+            'k': self.k,
+            'meets': self.meets,
+            'events': [
+                {'event_id': event_id, 'label': self.catalog.label(event_id),
+                 'entries': self._entries(event_id, private)}
+                for event_id in self.events()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict, catalog: Optional[EventCatalog] = None) -> 'Leaderboards':
+        """Rebuild the heaps from to_dict(private=True) output; entries keep their relative order for ties."""
+        leaderboards = cls(state['k'], state.get('season'), catalog)
+        leaderboards.meets = state.get('meets', {})
+        for event in state.get('events', []):
+            board = leaderboards.boards[event['event_id']] = TopK(leaderboards.k)
+            for entry in event['entries']:
+                entry = {name: value for name, value in entry.items() if name != 'rank'}
+                leaderboards._order += 1
+                board.offer(entry['seconds'], leaderboards._order, entry['swimmer_id'], entry)
+        return leaderboards
+
+    def render_html(self) -> str:
+        """Render the leaderboards page: one table per event."""
+        sections = []
+        for event_id in self.events():
+            rows = ''.join(
+                f'<tr><td class="center">{rank}</td><td>{html.escape(entry["swimmer"])}</td>'
+                f'<td class="center">{html.escape(entry["team"])}</td>'
+                f'<td class="center">{entry["time"]}</td>'
+                f'<td>{html.escape(entry["meet"])}</td><td class="center">{entry["date"]}</td></tr>'
+                for rank, entry in enumerate(self.boards[event_id].ranked(), 1)
+            )
+            sections.append(f"""            <h2>{html.escape(self.catalog.label(event_id))}</h2>
+            <div class="table-wrapper">
+                <table>
+                    <thead>
+                        <tr>
+                            <th class="center">Rank</th>
+                            <th>Swimmer</th>
+                            <th class="center">Team</th>
+                            <th class="center">Time</th>
+                            <th>Meet</th>
+                            <th class="center">Date</th>
+                        </tr>
+                    </thead>
+                    <tbody>{rows}</tbody>
+                </table>
+            </div>""")
+
+        title = f"{self.season or ''} Season Top {self.k} Times".strip()
+        return HTMLGenerator.page(title, '\n\n'.join(sections))
+
+
+def load_leaderboards(output_dir: str, k: int) -> Leaderboards:
+    """Load the leaderboards state in output_dir, or start empty boards if there are none yet."""
+    path = os.path.join(output_dir, STATE_FILENAME)
+    if not os.path.exists(path):
+        if os.path.exists(os.path.join(output_dir, LEADERBOARDS_JSON)):
+            raise ValueError(f"{output_dir} has leaderboards but no {STATE_FILENAME}; "
+                             f"rerun with --rebuild and every meet of the season")
+        return Leaderboards(k)
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    if state.get('version') != FORMAT_VERSION or state.get('k') != k:
+        raise ValueError(f"{path} was built with different settings (k={state.get('k')}); "
+                         f"rerun with --rebuild and every meet of the season")
+    return Leaderboards.from_dict(state)
+
+
+def save_leaderboards(leaderboards: Leaderboards, output_dir: str):
+    """
+    Write leaderboards.json and leaderboards.html, then the state file, into
+    output_dir (saving new catalog events first).
+    """
+    leaderboards.catalog.save()
+    with open(os.path.join(output_dir, LEADERBOARDS_JSON), 'w', encoding='utf-8') as f:
+        json.dump(leaderboards.to_dict(), f, indent=1)
+    with open(os.path.join(output_dir, LEADERBOARDS_HTML), 'w', encoding='utf-8') as f:
+        f.write(leaderboards.render_html())
+    with open(os.path.join(output_dir, STATE_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(leaderboards.to_dict(private=True), f, separators=(',', ':'))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Update the season top-times leaderboards from SDIF meet files.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/leaderboards.py -i ~/meet_night -o results/2025
+  python dev-tools/leaderboards.py -i ~/season_2025 -o results/2025 --rebuild
+  python dev-tools/leaderboards.py -i week1.zip -i week2.zip -o results/2025 -k 25 --rebuild
+        """
+    )
+    parser.add_argument('-i', '--input', dest='inputs', action='append', required=True,
+                        help='.sd3/.zip file or directory of them (repeatable)')
+    parser.add_argument('-o', '--output', dest='output_dir', type=str, required=True,
+                        help=f'Season folder for {LEADERBOARDS_JSON} and {LEADERBOARDS_HTML} (e.g. results/2025)')
+    parser.add_argument('-k', '--top', dest='k', type=int, default=DEFAULT_TOP_K,
+                        help=f'Swims kept per event (default: {DEFAULT_TOP_K})')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Ignore the existing leaderboards and start from empty boards')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    if args.k < 1:
+        parser.error("-k must be at least 1")
+    check_store_paths(args.inputs, args.output_dir)
+
+    try:
+        leaderboards = Leaderboards(args.k) if args.rebuild else load_leaderboards(args.output_dir, args.k)
+        leaderboards.check_season(folder_season(args.output_dir))
+    except ValueError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+    previous_meets = len(leaderboards.meets)
+    ingested, changes = leaderboards.update_from_sources(args.inputs)
+    save_leaderboards(leaderboards, args.output_dir)
+
+    logging.info(f"Ingested {ingested} meet(s) ({changes} leaderboard change(s)); "
+                 f"{previous_meets + ingested} meet(s) and {len(leaderboards.boards)} event(s) on the boards")
+    logging.info(f"Wrote {LEADERBOARDS_JSON} and {LEADERBOARDS_HTML} to {args.output_dir}")
+
+
+if __name__ == '__main__':
+    main()
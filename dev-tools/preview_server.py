@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+GPSA Results Preview Server
+Serves meet pages and season archives rendered on request, without writing any files.
+
+Meet pages are rendered straight from .sd3 files (or .sd3 members of .zip files)
+with SDIFParser + HTMLGenerator, and season archives from results/YYYY with
+build_archive. Rendered pages are kept in a bounded LRU cache keyed by a hash
+of their inputs, so reloading an unchanged page is free and editing or
+replacing an input is picked up on the next request.
+
+Routes:
+    /                        list of meets and seasons
+    /meet/<source>           meet page rendered from an SDIF source
+    /season/YYYY/            season archive rendered from results/YYYY
+    /season/YYYY/<file>      files in results/YYYY (meet pages linked from the archive)
+"""
+
+import argparse
+import hashlib
+import html
+import logging
+import os
+import sys
+import threading
+import zipfile
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+
+from build_archive import ArchiveBuildError, discover_season_dirs, render_season
+from build_site import season_fingerprint
+from bulk_process_results import process_sdif
+
+# --- Configuration ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+
+DEFAULT_PORT = 8000
+DEFAULT_CACHE_SIZE = 64
+
+
+class RenderCache:
+    """
+    Thread-safe LRU cache of rendered pages.
+
+    Keys are hashes of a page's inputs, so a changed input simply misses and
+    the stale page ages out of the cache.
+    """
+
+    def __init__(self, max_entries=DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, render):
+        """Returns the cached page for key, calling render() to build it on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Render outside the lock so slow pages don't block other requests
+        page = render()
+
+        with self._lock:
+            self._entries[key] = page
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return page
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SourceIndex:
+    """
+    Finds the SDIF sources under the input paths and hashes their content.
+
+    Content hashes are memoized against each file's size and mtime, so an
+    unchanged source is never re-read just to look up its cache entry.
+    """
+
+    def __init__(self, paths):
+        self.paths = paths
+        self._digests = {}
+        self._lock = threading.Lock()
+
+    def sources(self):
+        """
+        Lists the current sources, named like bulk_process_results.iter_sdif_sources().
+
+        Returns:
+            Dict mapping source name -> (file path, zip member or None).
+        """
+        found = {}
+        for path in self.paths:
+            files = [os.path.join(path, name) for name in sorted(os.listdir(path))] if os.path.isdir(path) else [path]
+            for file_path in files:
+                name = os.path.basename(file_path)
+                if name.lower().endswith('.sd3'):
+                    found[name] = (file_path, None)
+                elif name.lower().endswith('.zip'):
+                    try:
+                        with zipfile.ZipFile(file_path) as archive:
+                            for member in archive.namelist():
+                                if member.lower().endswith('.sd3'):
+                                    found[f"{name}:{member}"] = (file_path, member)
+                    except (OSError, zipfile.BadZipFile):
+                        logging.warning(f"Skipping unreadable zip file: {file_path}")
+        return found
+
+    def read(self, file_path, member=None):
+        """
+        Returns (sha256 hex digest, bytes or None) for a source.
+
+        The bytes are None when the source is unchanged since it was last hashed;
+        callers then fetch them with read_bytes() only if they have to render.
+        """
+        stat = os.stat(file_path)
+        fingerprint = (stat.st_size, stat.st_mtime_ns)
+        memo_key = (file_path, member)
+
+        with self._lock:
+            memo = self._digests.get(memo_key)
+        if memo and memo[0] == fingerprint:
+            return memo[1], None
+
+        raw = self.read_bytes(file_path, member)
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            self._digests[memo_key] = (fingerprint, digest)
+        return digest, raw
+
+    def read_bytes(self, file_path, member=None):
+        """Reads a source's bytes."""
+        if member is None:
+            with open(file_path, 'rb') as f:
+                return f.read()
+        with zipfile.ZipFile(file_path) as archive:
+            return archive.read(member)
+
+
+def render_home(sources, season_dirs, cache):
+    """Renders the preview home page listing every meet and season."""
+    meet_items = ''.join(
+        f'<li><a href="/meet/{quote(name)}">{html.escape(name)}</a></li>' for name in sorted(sources)
+    ) or '<li>No .sd3 or .zip inputs found.</li>'
+    season_items = ''.join(
+        f'<li><a href="/season/{os.path.basename(d)}/">{os.path.basename(d)}</a></li>' for d in season_dirs
+    ) or '<li>No season folders found.</li>'
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <title>GPSA Results Preview</title>
+  <style>
+    body {{ font-family: 'Inter', system-ui, sans-serif; margin: 2rem auto; max-width: 48rem; color: #002366; }}
+    h1 {{ border-bottom: 3px solid #d9242b; padding-bottom: 0.5rem; }}
+    a {{ color: #0033a0; }}
+    li {{ margin: 0.25rem 0; }}
+    footer {{ color: #6b7280; font-size: 0.875rem; margin-top: 2rem; }}
+  </style>
+</head>
+<body>
+  <h1>GPSA Results Preview</h1>
+  <h2>Meets ({len(sources)})</h2>
+  <ul>{meet_items}</ul>
+  <h2>Season Archives ({len(season_dirs)})</h2>
+  <ul>{season_items}</ul>
+  <footer>Rendered on request; nothing is written to disk. Cache: {len(cache)} page(s), {cache.hits} hit(s), {cache.misses} miss(es).</footer>
+</body>
+</html>"""
+
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    """Routes preview requests (the server instance carries the sources, results dir and cache)."""
+
+    def do_GET(self):
+        path = unquote(urlsplit(self.path).path)
+        try:
+            if path == '/':
+                sources = self.server.source_index.sources()
+                self.send_page(render_home(sources, discover_season_dirs(self.server.results_dir), self.server.cache))
+            elif path.startswith('/meet/'):
+                self.serve_meet(path[len('/meet/'):])
+            elif path.startswith('/season/'):
+                self.serve_season(path[len('/season/'):])
+            else:
+                self.send_error(HTTPStatus.NOT_FOUND)
+        except ArchiveBuildError as e:
+            self.send_error(HTTPStatus.UNPROCESSABLE_ENTITY, str(e))
+        except Exception as e:
+            logging.exception(f"Error rendering {path}")
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    def serve_meet(self, name):
+        """Renders (or fetches from cache) the meet page for an SDIF source."""
+        source = self.server.source_index.sources().get(name)
+        if source is None:
+            self.send_error(HTTPStatus.NOT_FOUND, f"No SDIF source named {name}")
+            return
+
+        source_index = self.server.source_index
+        digest, raw = source_index.read(*source)
+
+        def render():
+            return process_sdif(raw if raw is not None else source_index.read_bytes(*source)).html
+
+        self.send_page(self.server.cache.get_or_render(('meet', digest), render))
+
+    def serve_season(self, rest):
+        """Renders a season archive, or serves a file from the season folder."""
+        year, _, filename = rest.partition('/')
+        season_dir = os.path.join(self.server.results_dir, year)
+        if not (year.isdigit() and len(year) == 4 and os.path.isdir(season_dir)):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        if not filename:
+            if not rest.endswith('/'):
+                # Keep relative links in the archive pointing inside the season folder
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header('Location', f"/season/{year}/")
+                self.end_headers()
+                return
+            fingerprint = sorted(season_fingerprint(season_dir).items())
+            digest = hashlib.sha256(repr(fingerprint).encode('utf-8')).hexdigest()
+            self.send_page(self.server.cache.get_or_render(('season', year, digest), lambda: render_season(season_dir)))
+            return
+
+        file_path = os.path.join(season_dir, filename)
+        if os.path.basename(filename) != filename or not os.path.isfile(file_path):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        with open(file_path, 'rb') as f:
+            content_type = 'application/json' if filename.endswith('.json') else 'text/html; charset=utf-8'
+            self.send_page(f.read(), content_type)
+
+    def send_page(self, body, content_type='text/html; charset=utf-8'):
+        """Sends a 200 response with the given body."""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(input_paths, results_dir, host='127.0.0.1', port=DEFAULT_PORT, cache_size=DEFAULT_CACHE_SIZE):
+    """
+    Creates the preview HTTP server (call serve_forever() on the result).
+
+    Args:
+        input_paths: .sd3/.zip files or directories containing them
+        results_dir: Results directory with YYYY season folders
+        host: Interface to bind (default: localhost only)
+        port: Port to listen on
+        cache_size: Maximum number of rendered pages kept in memory
+    """
+    server = ThreadingHTTPServer((host, port), PreviewHandler)
+    server.source_index = SourceIndex(input_paths)
+    server.results_dir = results_dir
+    server.cache = RenderCache(cache_size)
+    return server
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Preview meet pages and season archives rendered on request, without writing files.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/preview_server.py -i ~/meet_night
+  python dev-tools/preview_server.py -i night1.zip -i night2.zip --port 8080
+  python dev-tools/preview_server.py                 # season archives only
+        """
+    )
+    parser.add_argument('-i', '--input', dest='inputs', action='append', default=[],
+                        help='.sd3/.zip file or directory of them (repeatable)')
+    parser.add_argument('-r', '--results', dest='results_dir', type=str,
+                        default=os.path.join(REPO_ROOT, 'results'),
+                        help='Results directory with YYYY season folders (default: results/ in the repository)')
+    parser.add_argument('-p', '--port', type=int, default=DEFAULT_PORT,
+                        help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'Maximum rendered pages kept in memory (default: {DEFAULT_CACHE_SIZE})')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show build_archive progress while rendering seasons')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(levelname)s: %(message)s',
+                        handlers=[logging.StreamHandler(sys.stdout)])
+
+    for path in args.inputs:
+        if not os.path.exists(path):
+            logging.error(f"Input does not exist: {path}")
+            sys.exit(1)
+
+    server = create_server(args.inputs, args.results_dir, port=args.port, cache_size=args.cache_size)
+    print(f"🔎 Previewing at http://127.0.0.1:{args.port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+GPSA Team Rosters
+Per-team, per-season roster JSON built incrementally from SDIF meet files.
+
+Every swimmer with an individual swim in an ingested meet is on their team's
+roster: name, gender, age group, number of meets, and their best time in each
+event swum. tools/roster.html fetches a team's file (a few KB) instead of
+making coaches upload and parse a SwimTopia CSV in the browser.
+
+The rosters live in the season folder (results/YYYY/rosters/):
+
+    index.json  {"version": 2, "season": 2025,
+                 "meets": {"<fingerprint>": {"name": ..., "date": ..., "swims": 212}},
+                 "teams": {"GG": {"name": "Glenwood Gators", "swimmers": 84, "file": "GG.json"}}}
+    GG.json     {"version": 2, "season": 2025, "team": "GG", "name": "Glenwood Gators",
+                 "swimmers": [{"name": ..., "gender": "F", "age_group": "9-10", "meets": 5,
+                               "last_swam": "2025-07-17",
+                               "events": [{"event_id": 7, "label": "Girls 9-10 50m Freestyle",
+                                           "time": "41.20", "seconds": 41.2, "swims": 4,
+                                           "meet": ..., "date": ...}]}]}
+
+Most swimmers are minors, so the published files carry no ages and no swimmer
+ids. Those live only in .rosters-state.json next to them (gitignored): the
+state the next run loads, with the ingested meets (by content fingerprint), so
+feeding the same .sd3 again is a no-op. A run rewrites only the files of teams
+that swam in its new meets, then index.json, and the state file last.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Set
+
+from build_archive import setup_logging
+from event_catalog import EventCatalog
+from swims import PRIVATE_FIELDS, IncrementalSwimStore, Swim, check_store_paths, folder_season, format_time
+
+# --- Configuration ---
+ROSTERS_DIRNAME = 'rosters'
+INDEX_FILENAME = 'index.json'
+STATE_FILENAME = '.rosters-state.json'
+FORMAT_VERSION = 2
+
+# GPSA age groups by oldest age, as labeled on the roster tool
+AGE_GROUPS = ((8, '8 & Under'), (10, '9-10'), (12, '11-12'), (14, '13-14'), (18, '15-18'))
+
+
+def age_group(age: Optional[int]) -> Optional[str]:
+    """The GPSA age group for a swimmer's age, or None if the age is unknown or over 18."""
+    if not age:
+        return None
+    for oldest, label in AGE_GROUPS:
+        if age <= oldest:
+            return label
+    return None
+
+
+class RosterStore(IncrementalSwimStore):
+    """Rosters of every team for one season, indexed by team and then by swimmer."""
+
+    SEASON_MISMATCH = "the rosters are for the {season} season"
+    CHANGE_LABEL = 'swim(s)'
+
+    def __init__(self, season: Optional[int] = None, catalog: Optional[EventCatalog] = None):
+        super().__init__(season, catalog)
+        # Team code -> {'name', 'swimmers': swimmer_key -> entry}
+        self.teams: Dict[str, Dict] = {}
+        # Teams changed since the rosters were loaded
+        self.dirty: Set[str] = set()
+
+    def _team(self, code: str, name: str = '') -> Dict:
+        team = self.teams.get(code)
+        if team is None:
+            team = self.teams[code] = {'name': name or code, 'swimmers': {}}
+        elif name and team['name'] == code:
+            team['name'] = name
+        return team
+
+    def add(self, swim: Swim, first_of_meet: bool = False):
+        """Record one swim on its swimmer's roster entry (first_of_meet counts a new meet for them)."""
+        swimmers = self._team(swim.team)['swimmers']
+        entry = swimmers.get(swim.swimmer_key)
+        if entry is None:
+            entry = swimmers[swim.swimmer_key] = {
+                'swimmer_id': swim.swimmer_key, 'name': swim.swimmer, 'gender': '', 'age': None,
+                'age_group': None, 'meets': 0, 'last_swam': '', 'events': {},
+            }
+        self.dirty.add(swim.team)
+
+        event = self.catalog.key(swim.event)
+        if event.gender in ('F', 'M'):
+            entry['gender'] = event.gender
+        if first_of_meet:
+            entry['meets'] += 1
+        # The latest meet decides the swimmer's name spelling and age
+        if swim.date >= entry['last_swam']:
+            entry['last_swam'] = swim.date
+            entry['name'] = swim.swimmer
+            if swim.age.isdigit():
+                entry['age'] = int(swim.age)
+        entry['age_group'] = age_group(entry['age']) or entry['age_group'] or event.age
+
+        best = entry['events'].get(swim.event)
+        if best is None:
+            entry['events'][swim.event] = {
+                'event_id': swim.event, 'time': format_time(swim.seconds), 'seconds': swim.seconds,
+                'swims': 1, 'meet': swim.meet, 'date': swim.date,
+            }
+            return
+        best['swims'] += 1
+        if swim.seconds < best['seconds']:
+            best.update(time=format_time(swim.seconds), seconds=swim.seconds, meet=swim.meet, date=swim.date)
+
+    def add_swims(self, data: Dict, swims: List[Swim]) -> int:
+        """Record every swim of a new meet on the rosters; returns the number of swims added."""
+        for team in data['teams'].values():
+            self._team(team['code'], team['name'])
+        seen = set()
+        for swim in swims:
+            key = (swim.team, swim.swimmer_key)
+            self.add(swim, key not in seen)
+            seen.add(key)
+        return len(swims)
+
+    def _swimmers(self, code: str) -> List[Dict]:
+        """A team's roster entries by name, each with its events as a list in program order."""
+        swimmers = []
+        entries = self.teams[code]['swimmers'].values()
+        for entry in sorted(entries, key=lambda entry: (entry['name'], entry['swimmer_id'])):
+            events = sorted(entry['events'].values(), key=lambda best: self.catalog.sort_key(best['event_id']))
+            swimmers.append(dict(entry, events=events))
+        return swimmers
+
+    def team_dict(self, code: str) -> Dict:
+        """JSON-serializable roster of one team (the format of <TEAM>.json), without PRIVATE_FIELDS."""
+        swimmers = []
+        for entry in self._swimmers(code):
+            published = {name: value for name, value in entry.items() if name not in PRIVATE_FIELDS}
+            published['events'] = [dict(best, label=self.catalog.label(best['event_id'])) for best in entry['events']]
+            swimmers.append(published)
+        return {'version': FORMAT_VERSION, 'season': self.season, 'team': code, 'name': self.teams[code]['name'],
+                'swimmers': swimmers}
+
+    def index_dict(self) -> Dict:
+        """The published team list plus ingested meets (the format of index.json)."""
+        return {
+            'version': FORMAT_VERSION,
+            'season': self.season,
+            'meets': self.meets,
+            'teams': {code: {'name': team['name'], 'swimmers': len(team['swimmers']), 'file': f"{code}.json"}
+                      for code, team in sorted(self.teams.items()) if team['swimmers']},
+        }
+
+    def state_dict(self) -> Dict:
+        """Everything the next run needs, including PRIVATE_FIELDS (the format of .rosters-state.json)."""
+        return {
+            'version': FORMAT_VERSION,
+            'season': self.season,
+            'meets': self.meets,
+            'teams': {code: {'name': team['name'], 'swimmers': self._swimmers(code)}
+                      for code, team in sorted(self.teams.items())},
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict, catalog: Optional[EventCatalog] = None) -> 'RosterStore':
+        """Rebuild the store from state_dict() output."""
+        store = cls(state.get('season'), catalog)
+        store.meets = state.get('meets', {})
+        for code, team in state.get('teams', {}).items():
+            swimmers = {entry['swimmer_id']: dict(entry, events={best['event_id']: best for best in entry['events']})
+                        for entry in team['swimmers']}
+            store.teams[code] = {'name': team['name'], 'swimmers': swimmers}
+        return store
+
+
+def _write_json(path: str, document: Dict):
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(document, f, separators=(',', ':'))
+    os.replace(path + '.tmp', path)
+
+
+def load_rosters(rosters_dir: str) -> RosterStore:
+    """Load the roster state in rosters_dir, or return an empty store if there are no rosters yet."""
+    state_path = os.path.join(rosters_dir, STATE_FILENAME)
+    if not os.path.exists(state_path):
+        if os.path.exists(os.path.join(rosters_dir, INDEX_FILENAME)):
+            raise ValueError(f"{rosters_dir} has rosters but no {STATE_FILENAME}; "
+                             f"rebuild them with --rebuild and every meet of the season")
+        return RosterStore()
+    with open(state_path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    if state.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{state_path} has an unsupported format; rebuild it with --rebuild")
+    return RosterStore.from_state(state)
+
+
+def save_rosters(store: RosterStore, rosters_dir: str) -> int:
+    """
+    Write the changed team files, index.json, then the state file (saving new catalog events first).
+
+    Returns:
+        Number of team files written.
+    """
+    os.makedirs(rosters_dir, exist_ok=True)
+    store.catalog.save()
+    written = 0
+    for code in sorted(store.dirty):
+        if store.teams[code]['swimmers']:
+            _write_json(os.path.join(rosters_dir, f"{code}.json"), store.team_dict(code))
+            written += 1
+    _write_json(os.path.join(rosters_dir, INDEX_FILENAME), store.index_dict())
+    _write_json(os.path.join(rosters_dir, STATE_FILENAME), store.state_dict())
+    store.dirty.clear()
+    return written
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Update the per-team season rosters (JSON for tools/roster.html) from SDIF meet files.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/rosters.py -i ~/meet_night -o results/2025
+  python dev-tools/rosters.py -i ~/season_2025 -o results/2025 --rebuild
+        """
+    )
+    parser.add_argument('-i', '--input', dest='inputs', action='append', required=True,
+                        help='.sd3/.zip file or directory of them (repeatable)')
+    parser.add_argument('-o', '--output', dest='output_dir', type=str, required=True,
+                        help=f'Season folder; rosters are written to its {ROSTERS_DIRNAME}/ folder (e.g. results/2025)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Ignore the existing rosters and start from empty ones')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    check_store_paths(args.inputs, args.output_dir)
+
+    rosters_dir = os.path.join(args.output_dir, ROSTERS_DIRNAME)
+    try:
+        store = RosterStore() if args.rebuild else load_rosters(rosters_dir)
+        store.check_season(folder_season(args.output_dir))
+    except ValueError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+    if args.rebuild and os.path.isdir(rosters_dir):
+        # Every team roster is rewritten; remove files of teams no longer present
+        for filename in os.listdir(rosters_dir):
+            if filename.endswith('.json') and filename not in (INDEX_FILENAME, STATE_FILENAME):
+                os.remove(os.path.join(rosters_dir, filename))
+
+    ingested, swims = store.update_from_sources(args.inputs)
+    written = save_rosters(store, rosters_dir)
+
+    swimmers = sum(len(team['swimmers']) for team in store.teams.values())
+    logging.info(f"Ingested {ingested} meet(s) ({swims} swim(s)); {len(store.meets)} meet(s), "
+                 f"{swimmers} swimmer(s) on {len(store.index_dict()['teams'])} team roster(s)")
+    logging.info(f"Wrote {written} team roster(s) and {INDEX_FILENAME} to {rosters_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+GPSA SDIF Layout
+The fixed-width SDIF record layouts, defined once for the Python and JavaScript parsers.
+
+lib/sdif-layout.json is the single definition of the SDIF columns that
+SDIFParser (bulk_process_results.py) and parseSdif()/parseAgeCode()
+(lib/publicity-core.js) read. Columns there are 1-based, as in the SDIF v3
+specification; both sides compile them into 0-based [begin, end) slices, the
+field-extraction tables their parsers index by field name.
+
+Browsers and the publicity API cannot read a JSON file synchronously, so
+publicity-core.js imports the same data from lib/sdif-layout.js, an ES module
+generated from the JSON by this script:
+
+    python dev-tools/sdif_layout.py              # print the compiled layouts
+    python dev-tools/sdif_layout.py --check      # exit 1 if sdif-layout.js is stale
+    python dev-tools/sdif_layout.py --write-js   # regenerate sdif-layout.js
+
+sdif_parity.py checks that the generated module is current before comparing
+the two parsers.
+"""
+
+import argparse
+import functools
+import json
+import logging
+import operator
+import os
+import sys
+from typing import Callable, Dict, NamedTuple
+
+# --- Configuration ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LIB_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), 'lib')
+DEFAULT_LAYOUT_PATH = os.path.join(LIB_DIR, 'sdif-layout.json')
+JS_MODULE_PATH = os.path.join(LIB_DIR, 'sdif-layout.js')
+FORMAT_VERSION = 1
+
+JS_MODULE_HEADER = """/**
+ * GPSA SDIF Layout
+ * Generated from sdif-layout.json by dev-tools/sdif_layout.py - do not edit.
+ * Change sdif-layout.json, then run: python dev-tools/sdif_layout.py --write-js
+ */
+
+export const SDIF_LAYOUT = """
+
+
+class RecordLayout(NamedTuple):
+    """Compiled layout of one record type."""
+    code: str
+    name: str
+    min_length: int             # shorter records are skipped
+    fields: Dict[str, slice]    # field name -> slice of the line
+
+    def getter(self, *names: str) -> Callable:
+        """
+        Extractor returning the named fields of a line in one call, in the order
+        given (a bare string for a single name), like operator.itemgetter.
+        """
+        return operator.itemgetter(*(self.fields[name] for name in names))
+
+
+class AgeCodeLayout(NamedTuple):
+    """Compiled layout of an event age code, e.g. "0910" or "UN08"."""
+    length: int
+    under: str                  # lower bound meaning "and under"
+    over: str                   # upper bound meaning "and over"
+    lower: slice
+    upper: slice
+
+
+class SDIFLayout(NamedTuple):
+    record_code: slice
+    records: Dict[str, RecordLayout]
+    age_code: AgeCodeLayout
+
+
+def _column_slice(column: Dict, where: str) -> slice:
+    """Convert a 1-based {"start", "length"} column to a 0-based slice."""
+    start, length = column.get('start'), column.get('length')
+    if not isinstance(start, int) or not isinstance(length, int) or start < 1 or length < 1:
+        raise ValueError(f"{where}: start and length must be positive integers")
+    return slice(start - 1, start - 1 + length)
+
+
+def load_spec(path: str = DEFAULT_LAYOUT_PATH) -> Dict:
+    """Read the layout definition (the JSON document, uncompiled)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    if spec.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path} has an unsupported format")
+    return spec
+
+
+def compile_layout(spec: Dict) -> SDIFLayout:
+    """Compile a layout definition into slice tables."""
+    records = {}
+    for code, record in spec['records'].items():
+        fields = {name: _column_slice(column, f"{code}.{name}") for name, column in record['fields'].items()}
+        records[code] = RecordLayout(code, record.get('name', code), record.get('minLength', 0), fields)
+
+    age = spec['ageCode']
+    age_code = AgeCodeLayout(age['length'], age['under'], age['over'],
+                             _column_slice(age['fields']['lower'], 'ageCode.lower'),
+                             _column_slice(age['fields']['upper'], 'ageCode.upper'))
+    return SDIFLayout(_column_slice(spec['recordCode'], 'recordCode'), records, age_code)
+
+
+def load_layout(path: str = DEFAULT_LAYOUT_PATH) -> SDIFLayout:
+    return compile_layout(load_spec(path))
+
+
+@functools.lru_cache(maxsize=None)
+def default_layout() -> SDIFLayout:
+    """The layouts from lib/sdif-layout.json, loaded on first use."""
+    return load_layout()
+
+
+def render_js(spec: Dict) -> str:
+    """The ES module publicity-core.js imports: the layout definition as an SDIF_LAYOUT constant."""
+    return JS_MODULE_HEADER + json.dumps(spec, indent=4, ensure_ascii=False) + ';\n'
+
+
+def js_module_is_current(spec: Dict, js_path: str = JS_MODULE_PATH) -> bool:
+    """True if the generated module at js_path matches the layout definition."""
+    if not os.path.exists(js_path):
+        return False
+    with open(js_path, 'r', encoding='utf-8') as f:
+        return f.read() == render_js(spec)
+
+
+def write_js(spec: Dict, js_path: str = JS_MODULE_PATH):
+    with open(js_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(render_js(spec))
+
+
+def describe(layout: SDIFLayout) -> str:
+    """Plain-text table of the compiled layouts (0-based slices)."""
+    lines = []
+    for record in layout.records.values():
+        lines.append(f"{record.code}  {record.name} (min length {record.min_length})")
+        for name, column in record.fields.items():
+            lines.append(f"    {name:<14} [{column.start}:{column.stop}]")
+    age = layout.age_code
+    lines.append(f"Age code ({age.length} chars, '{age.under}' = and under, '{age.over}' = and over)")
+    lines.append(f"    {'lower':<14} [{age.lower.start}:{age.lower.stop}]")
+    lines.append(f"    {'upper':<14} [{age.upper.start}:{age.upper.stop}]")
+    return '\n'.join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Show, check or regenerate the shared SDIF record layouts (lib/sdif-layout.json).',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/sdif_layout.py
+  python dev-tools/sdif_layout.py --check
+  python dev-tools/sdif_layout.py --write-js
+        """
+    )
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument('--check', action='store_true',
+                        help='Exit with status 1 if lib/sdif-layout.js does not match the JSON')
+    action.add_argument('--write-js', action='store_true',
+                        help='Regenerate lib/sdif-layout.js from the JSON')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    # Imported here so the parser can load layouts without build_archive's dependencies
+    from build_archive import setup_logging
+    setup_logging(verbose=args.verbose)
+
+    try:
+        spec = load_spec()
+        layout = compile_layout(spec)
+    except (OSError, ValueError, KeyError) as e:
+        logging.error(f"Invalid layout {DEFAULT_LAYOUT_PATH}: {e}")
+        sys.exit(1)
+
+    if args.write_js:
+        write_js(spec)
+        logging.info(f"Wrote {JS_MODULE_PATH}")
+    elif args.check:
+        if not js_module_is_current(spec):
+            logging.error(f"{JS_MODULE_PATH} is out of date; run: python dev-tools/sdif_layout.py --write-js")
+            sys.exit(1)
+        logging.info(f"{JS_MODULE_PATH} is up to date")
+    else:
+        print(describe(layout))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+/**
+ * GPSA SDIF Parity - JavaScript side
+ * Run by dev-tools/sdif_parity.py: parses every corpus file with
+ * lib/publicity-core.js and prints the parsed data and timings as JSON.
+ *
+ * Usage: node dev-tools/sdif_parity.mjs <manifest.json>
+ * Manifest: { "files": [paths], "repeat": 5, "ageCodes": [codes] }
+ */
+
+import { readFileSync } from 'node:fs';
+import { performance } from 'node:perf_hooks';
+import { parseAgeCode, parseSdif } from '../lib/publicity-core.js';
+
+const manifest = JSON.parse(readFileSync(process.argv[2], 'utf-8'));
+const texts = manifest.files.map(path => readFileSync(path, 'utf-8'));
+
+const results = texts.map(text => parseSdif(text));
+
+// Best of several timed passes over the whole corpus
+let best = Infinity;
+for (let pass = 0; pass < manifest.repeat; pass++) {
+    const start = performance.now();
+    for (const text of texts) {
+        parseSdif(text);
+    }
+    best = Math.min(best, performance.now() - start);
+}
+
+const ageCodes = {};
+for (const code of manifest.ageCodes) {
+    ageCodes[code] = parseAgeCode(code);
+}
+
+process.stdout.write(JSON.stringify({ results, ageCodes, seconds: best / 1000 }));
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+GPSA SDIF Parity
+Differential test and benchmark of the two SDIF parsers.
+
+SDIFParser (bulk_process_results.py) builds the archive, and parseSdif()
+(lib/publicity-core.js) builds publicity pages in the browser and the API.
+Both read the record layouts in lib/sdif-layout.json (see sdif_layout.py).
+This tool runs both over the same corpus and compares what they produce:
+
+- a synthetic corpus of dual meets generated from a seed, a quarter of them
+  with damaged records (trimmed or cut lines, blank or bad places, odd age
+  codes, unknown strokes), so the skip rules are exercised too;
+- real meet files given with -i (.sd3, .zip or directories of them).
+
+Every file is decoded once (decode_sdif) and both parsers get the same text,
+so only the parsers are compared. Fields only the Python parser produces
+(eventId, swimmerId, age, diagnostics) are left out of the comparison.
+parseAgeCode() is also compared directly over a grid of valid and invalid
+age codes. The JavaScript side runs in Node.js (dev-tools/sdif_parity.mjs).
+
+Each parser's throughput is the best of --repeat timed passes over the corpus.
+The tool exits with status 1 on any difference, so a parser optimization on
+either side can be checked, and measured, before it lands.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from build_archive import setup_logging
+from bulk_process_results import SDIFParser, decode_sdif, iter_sdif_sources
+from event_catalog import EventCatalog
+from sdif_layout import RecordLayout, default_layout, js_module_is_current, load_spec
+
+# --- Configuration ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+NODE_WORKER = os.path.join(SCRIPT_DIR, 'sdif_parity.mjs')
+DEFAULT_SYNTHETIC_MEETS = 24
+DEFAULT_SEED = 2025
+DEFAULT_REPEAT = 5
+RECORD_WIDTH = 160
+DAMAGED_MEET_RATE = 0.25
+DAMAGED_RECORD_RATE = 0.05
+MAX_REPORTED_DIFFERENCES = 10
+
+# Result fields both parsers produce
+COMMON_RESULT_FIELDS = ('place', 'swimmer', 'teamCode', 'time', 'points', 'swimmers')
+
+# Synthetic meets: (age code, individual distance, butterfly distance)
+SYNTHETIC_AGE_GROUPS = (('UN08', 25, 25), ('0910', 50, 25), ('1112', 50, 50), ('1314', 50, 50), ('1518', 50, 50))
+SYNTHETIC_TEAMS = (
+    ('VAGG', 'Glendale Gators'), ('VAWW', 'Wendwood Wahoos'), ('VACC', 'Colony Cudas'),
+    ('VAKK', 'Kingsmill Kingfish'), ('RMSC', 'Riverside Marlins'), ('VAPP', 'Poquoson Piranhas'),
+)
+SYNTHETIC_NAMES = ('Smith', 'Johnson', 'Nguyen', 'Garcia', "O'Brien", 'Peña', 'Müller', 'Lee', 'Brown', 'Davis')
+SYNTHETIC_FIRST_NAMES = ('Ava', 'Liam', 'Zoë', 'Noah', 'José', 'Emma', 'Mia', 'Eli', 'Chloé', 'Sam')
+ODD_AGE_CODES = ('UNOV', 'UN10', '15OV', '1010', '    ', 'XXXX', '1a10', 'UNXX', '08')
+
+# parseAgeCode() grid: every pair of these halves, plus short and long codes
+AGE_CODE_HALVES = ('UN', 'OV', '08', '10', '8 ', ' 8', '00', '99', '  ', 'XX', '1a', '+1', '-1', '1.')
+EXTRA_AGE_CODES = ('', '0', '081', 'UNO', '0810X', 'UNOVX')
+
+
+def compose(record: RecordLayout, values: Dict[str, str], width: int = RECORD_WIDTH) -> str:
+    """Build a fixed-width record, writing each value into its layout field."""
+    line = [' '] * width
+    line[0:2] = record.code
+    for name, value in values.items():
+        column = record.fields[name]
+        line[column] = value[:column.stop - column.start].ljust(column.stop - column.start)
+    return ''.join(line)
+
+
+def _number(value, width: int) -> str:
+    return str(value).rjust(width)
+
+
+def _format_time(seconds: float) -> str:
+    minutes, seconds = divmod(round(seconds * 100), 6000)
+    return f"{minutes}:{seconds / 100:05.2f}" if minutes else f"{seconds / 100:.2f}"
+
+
+def synthetic_meet(rnd: random.Random, number: int) -> str:
+    """One generated dual meet (occasionally three teams), records padded like real exports."""
+    records = default_layout().records
+    teams = rnd.sample(SYNTHETIC_TEAMS, 3 if rnd.random() < 0.1 else 2)
+    date = f"{rnd.randint(6, 7):02d}{rnd.randint(1, 28):02d}{rnd.randint(2022, 2026)}"
+    if rnd.random() < 0.05:
+        date = date[:4]
+    host = '' if rnd.random() < 0.05 else teams[0][1]
+
+    events = []
+    for age_code, distance, fly_distance in SYNTHETIC_AGE_GROUPS:
+        for gender in ('F', 'M'):
+            for stroke in '1234':
+                events.append((gender, fly_distance if stroke == '4' else distance, stroke, age_code, False))
+            if age_code in ('1314', '1518'):
+                events.append((gender, 100, '5', age_code, False))
+            events.append((gender, 100 if age_code in ('UN08', '0910') else 200, '7', age_code, True))
+    events.append(('X', 200, '6', 'UNOV', True))
+
+    lines = [compose(records['B1'], {'meetName': f"Dual Meet {number}", 'startDate': date}),
+             compose(records['B2'], {'hostName': host})]
+    for team_code, team_name in teams:
+        lines.append(compose(records['C1'], {'teamCode': team_code, 'teamName': team_name}))
+        for event_number, (gender, distance, stroke, age_code, relay) in enumerate(events, 1):
+            event = {'gender': gender, 'distance': _number(distance, 4), 'stroke': stroke,
+                     'eventNumber': _number(event_number, 4), 'ageCode': age_code}
+            if relay:
+                place = rnd.randint(1, len(teams) * 2)
+                lines.append(compose(records['E0'], dict(
+                    event, relayTeam='A', finalTime=_number(_format_time(distance * 0.7 + rnd.random() * 40), 8),
+                    place=_number(place, 3), points=_number(max(0, 8 - 2 * place), 4))))
+                for leg in range(4):
+                    lines.append(compose(records['F0'], {'swimmerName': f"{rnd.choice(SYNTHETIC_NAMES)}, "
+                                                                        f"{rnd.choice(SYNTHETIC_FIRST_NAMES)} {leg}"}))
+                continue
+            for _ in range(rnd.randint(2, 4)):
+                outcome = rnd.random()
+                if outcome < 0.05:
+                    time_text, place, points = 'DQ', '', ''
+                elif outcome < 0.08:
+                    time_text, place, points = 'NS', '0', '0'
+                else:
+                    place_number = rnd.randint(1, 8)
+                    time_text = _format_time(distance * 0.45 + rnd.random() * distance * 0.4)
+                    place = str(place_number)
+                    points = '2.5' if outcome > 0.98 else str(max(0, 6 - place_number))
+                lines.append(compose(records['D0'], dict(
+                    event, swimmerName=f"{rnd.choice(SYNTHETIC_NAMES)}, {rnd.choice(SYNTHETIC_FIRST_NAMES)}",
+                    swimmerId=f"{rnd.getrandbits(40):012X}", age=_number(rnd.randint(6, 18), 2),
+                    finalTime=_number(time_text, 8), place=_number(place, 3), points=_number(points, 4))))
+    return '\n'.join(lines) + '\n'
+
+
+def damage(rnd: random.Random, text: str) -> str:
+    """Apply the defects seen in hand-edited or badly exported files to a few records."""
+    records = default_layout().records
+    lines = text.split('\n')
+    for i, line in enumerate(lines):
+        if not line or rnd.random() >= DAMAGED_RECORD_RATE:
+            continue
+        fields = records[line[:2]].fields if line[:2] in records else {}
+        defect = rnd.choice(('trim', 'cut', 'place', 'bad place', 'event', 'age code', 'stroke', 'gender'))
+        if defect == 'trim':
+            lines[i] = line.rstrip()
+        elif defect == 'cut':
+            lines[i] = line[:rnd.randint(2, len(line))]
+        else:
+            name, value = {
+                'place': ('place', ''), 'bad place': ('place', ' x1'), 'event': ('eventNumber', '0'),
+                'age code': ('ageCode', rnd.choice(ODD_AGE_CODES)), 'stroke': ('stroke', '9'), 'gender': ('gender', ''),
+            }[defect]
+            if name in fields:
+                column = fields[name]
+                width = column.stop - column.start
+                lines[i] = line[:column.start] + value.rjust(width)[:width] + line[column.stop:]
+    return '\n'.join(lines)
+
+
+def synthetic_corpus(count: int, seed: int) -> Iterator[Tuple[str, str]]:
+    """Yield (name, text) for count generated meets; the same seed gives the same corpus."""
+    rnd = random.Random(seed)
+    for number in range(1, count + 1):
+        text = synthetic_meet(rnd, number)
+        if rnd.random() < DAMAGED_MEET_RATE:
+            yield f"synthetic-{number:03d}-damaged.sd3", damage(rnd, text)
+        else:
+            yield f"synthetic-{number:03d}.sd3", text
+
+
+def age_code_grid() -> List[str]:
+    return [lower + upper for lower in AGE_CODE_HALVES for upper in AGE_CODE_HALVES] + list(EXTRA_AGE_CODES)
+
+
+def comparable(data: Dict) -> Dict:
+    """The part of a parse result both parsers produce, in a form that compares equal."""
+    teams = {code: {'name': team.get('name'), 'code': team.get('code'), 'score': round(team.get('score', 0), 6)}
+             for code, team in data['teams'].items()}
+    events = {}
+    for number, event in data['events'].items():
+        results = [{field: result.get(field) for field in COMMON_RESULT_FIELDS if field in result}
+                   for result in event['results']]
+        events[number] = {'description': event['description'], 'type': event['type'], 'results': results}
+    meet = {key: data['meet'].get(key) for key in ('name', 'startDate', 'hostName')}
+    return {'meet': meet, 'teams': teams, 'events': events}
+
+
+def differences(python, javascript, path: str = '') -> Iterator[str]:
+    """Describe where two comparable() values differ, one line per differing leaf."""
+    if isinstance(python, dict) and isinstance(javascript, dict):
+        for key in sorted(set(python) | set(javascript), key=str):
+            if key not in python:
+                yield f"{path}.{key}: only in JavaScript"
+            elif key not in javascript:
+                yield f"{path}.{key}: only in Python"
+            else:
+                yield from differences(python[key], javascript[key], f"{path}.{key}")
+    elif isinstance(python, list) and isinstance(javascript, list):
+        if len(python) != len(javascript):
+            yield f"{path}: {len(python)} item(s) in Python, {len(javascript)} in JavaScript"
+        for index, (a, b) in enumerate(zip(python, javascript)):
+            yield from differences(a, b, f"{path}[{index}]")
+    elif python != javascript:
+        yield f"{path}: Python {python!r}, JavaScript {javascript!r}"
+
+
+def run_python(texts: List[str], repeat: int) -> Tuple[List[Dict], float]:
+    """Parse every text with SDIFParser; returns the results and the best timed pass in seconds."""
+    # A catalog without a file, so new events are never saved to event_catalog.json
+    catalog = EventCatalog(None)
+    results = [SDIFParser(catalog).parse(text) for text in texts]
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            SDIFParser(catalog).parse(text)
+        best = min(best, time.perf_counter() - start)
+    return results, best
+
+
+def run_javascript(node: str, paths: List[str], repeat: int, age_codes: List[str], work_dir: str) -> Dict:
+    """Run the Node.js worker over the corpus files; returns its results, ageCodes and seconds."""
+    manifest = os.path.join(work_dir, 'manifest.json')
+    with open(manifest, 'w', encoding='utf-8') as f:
+        json.dump({'files': paths, 'repeat': repeat, 'ageCodes': age_codes}, f)
+    completed = subprocess.run([node, NODE_WORKER, manifest], capture_output=True, text=True, encoding='utf-8')
+    if completed.returncode != 0:
+        raise RuntimeError(f"{NODE_WORKER} failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout)
+
+
+def _throughput(name: str, seconds: float, size: int, records: int) -> str:
+    return (f"  {name:<22} {seconds * 1000:9.1f} ms  {size / seconds / 1e6:7.1f} MB/s  "
+            f"{records / seconds:12,.0f} records/s")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Compare and benchmark the Python and JavaScript SDIF parsers on the same corpus.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/sdif_parity.py
+  python dev-tools/sdif_parity.py -i ~/season_2025 -i ~/season_2024
+  python dev-tools/sdif_parity.py --synthetic 200 --seed 7 --repeat 10
+  python dev-tools/sdif_parity.py --synthetic 0 -i ~/meet_night --keep-corpus /tmp/parity
+        """
+    )
+    parser.add_argument('-i', '--input', dest='inputs', action='append', default=[],
+                        help='Real .sd3/.zip file or directory of them to add to the corpus (repeatable)')
+    parser.add_argument('--synthetic', type=int, default=DEFAULT_SYNTHETIC_MEETS,
+                        help=f'Number of generated meets (default: {DEFAULT_SYNTHETIC_MEETS})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f'Seed for the generated meets (default: {DEFAULT_SEED})')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'Timed passes per parser; the best is reported (default: {DEFAULT_REPEAT})')
+    parser.add_argument('--keep-corpus', dest='keep_corpus', type=str,
+                        help='Write the corpus to this directory and keep it (default: a temporary directory)')
+    parser.add_argument('--node', type=str, default='node',
+                        help='Node.js executable (default: node)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    for path in args.inputs:
+        if not os.path.exists(path):
+            logging.error(f"Input does not exist: {path}")
+            sys.exit(1)
+    if args.repeat < 1 or args.synthetic < 0:
+        logging.error("--repeat must be at least 1 and --synthetic at least 0")
+        sys.exit(1)
+    node = shutil.which(args.node)
+    if node is None:
+        logging.error(f"Node.js not found ({args.node}); it is needed to run lib/publicity-core.js")
+        sys.exit(1)
+    if not js_module_is_current(load_spec()):
+        logging.error("lib/sdif-layout.js is out of date; run: python dev-tools/sdif_layout.py --write-js")
+        sys.exit(1)
+
+    corpus = list(synthetic_corpus(args.synthetic, args.seed))
+    synthetic_count = len(corpus)
+    corpus.extend((source, decode_sdif(raw)) for source, raw in iter_sdif_sources(args.inputs))
+    if not corpus:
+        logging.error("The corpus is empty")
+        sys.exit(1)
+
+    work_dir: Optional[str] = args.keep_corpus
+    temporary = None
+    if work_dir:
+        os.makedirs(work_dir, exist_ok=True)
+    else:
+        temporary = tempfile.TemporaryDirectory(prefix='sdif-parity-')
+        work_dir = temporary.name
+    try:
+        paths = []
+        for index, (source, text) in enumerate(corpus):
+            path = os.path.join(work_dir, f"{index:04d}-{os.path.basename(source).replace(':', '_')}")
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            paths.append(path)
+
+        texts = [text for _, text in corpus]
+        age_codes = age_code_grid()
+        logging.info(f"Parsing {len(corpus)} file(s) with Python...")
+        python_results, python_seconds = run_python(texts, args.repeat)
+        logging.info(f"Parsing {len(corpus)} file(s) with JavaScript ({node})...")
+        try:
+            javascript = run_javascript(node, paths, args.repeat, age_codes, work_dir)
+        except (RuntimeError, ValueError) as e:
+            logging.error(str(e))
+            sys.exit(1)
+    finally:
+        if temporary is not None:
+            temporary.cleanup()
+
+    mismatched = 0
+    for (source, _), python, js in zip(corpus, python_results, javascript['results']):
+        found = list(differences(comparable(python), comparable(js)))
+        if found:
+            mismatched += 1
+            logging.error(f"{source}: {len(found)} difference(s)")
+            for line in found[:MAX_REPORTED_DIFFERENCES]:
+                logging.error(f"    {line}")
+        else:
+            logging.debug(f"{source}: identical")
+
+    age_mismatches = [code for code in age_codes
+                      if SDIFParser._parse_age_code(code) != javascript['ageCodes'].get(code)]
+    for code in age_mismatches[:MAX_REPORTED_DIFFERENCES]:
+        logging.error(f"parseAgeCode({code!r}): Python {SDIFParser._parse_age_code(code)!r}, "
+                      f"JavaScript {javascript['ageCodes'].get(code)!r}")
+
+    size = sum(len(text.encode('utf-8')) for text in texts)
+    records = sum(sum(1 for line in text.split('\n') if len(line) >= 2) for text in texts)
+    logging.info(f"Corpus: {len(corpus)} file(s) ({synthetic_count} synthetic, {len(corpus) - synthetic_count} real), "
+                 f"{size / 1e6:.2f} MB, {records:,} records")
+    logging.info(f"Best of {args.repeat} pass(es):")
+    logging.info(_throughput('Python SDIFParser', python_seconds, size, records))
+    logging.info(_throughput('JavaScript parseSdif', javascript['seconds'], size, records))
+
+    if mismatched or age_mismatches:
+        logging.error(f"Parsers differ on {mismatched} file(s) and {len(age_mismatches)} age code(s)")
+        sys.exit(1)
+    logging.info(f"Parsers agree on all {len(corpus)} file(s) and {len(age_codes)} age codes")
+
+
+if __name__ == '__main__':
+    main()
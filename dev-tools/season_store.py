@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+GPSA Season Store
+Indexed season-best times, built incrementally from SDIF meet files.
+
+The store keeps every swimmer's best time in every individual event of a
+season, indexed by event and then by swimmer, so tools that need season bests
+(seed_meet.py) look them up directly instead of re-reading every .sd3 file.
+Each run ingests only new meets; meets are recognized by content fingerprint.
+
+Events are keyed by event catalog id (see event_catalog.py). The store holds
+every swimmer's exact age and hashed id, and most swimmers are minors, so it is
+never published: it is saved as .season-bests.json in the season folder
+(results/YYYY/), a hidden file that is gitignored:
+
+    {"version": 2, "season": 2025,
+     "meets": {"<fingerprint>": {"name": ..., "date": ..., "swims": 212}},
+     "events": [{"event_id": 7, "label": "Girls 9-10 50m Freestyle",
+                 "bests": [{"swimmer_id": ..., "swimmer": ..., "team": ..., "age": ...,
+                            "seconds": 34.12, "time": "34.12", "meet": ..., "date": ...}]}]}
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+from build_archive import setup_logging
+from event_catalog import EventCatalog
+from swims import IncrementalSwimStore, Swim, check_store_paths, folder_season, format_time
+
+# --- Configuration ---
+STORE_FILENAME = '.season-bests.json'
+FORMAT_VERSION = 2
+
+
+class SeasonStore(IncrementalSwimStore):
+    """Best time per swimmer per individual event for one season."""
+
+    CHANGE_LABEL = 'new season best(s)'
+
+    def __init__(self, season: Optional[int] = None, catalog: Optional[EventCatalog] = None):
+        super().__init__(season, catalog)
+        # Event catalog id -> swimmer_key -> best entry
+        self.bests: Dict[int, Dict[str, Dict]] = {}
+
+    def add(self, swim: Swim) -> bool:
+        """Record a swim; returns True if it is the swimmer's new best in that event."""
+        event_bests = self.bests.get(swim.event)
+        if event_bests is None:
+            event_bests = self.bests[swim.event] = {}
+        best = event_bests.get(swim.swimmer_key)
+        if best is not None and best['seconds'] <= swim.seconds:
+            return False
+        event_bests[swim.swimmer_key] = {
+            'swimmer_id': swim.swimmer_key, 'swimmer': swim.swimmer, 'team': swim.team, 'age': swim.age,
+            'seconds': swim.seconds, 'time': format_time(swim.seconds), 'meet': swim.meet, 'date': swim.date,
+        }
+        return True
+
+    def add_swims(self, data: Dict, swims: List[Swim]) -> int:
+        """Record every swim of a new meet; returns the number of new season bests."""
+        return sum(self.add(swim) for swim in swims)
+
+    def events(self) -> List[int]:
+        """Event ids with at least one time, in program order (gender, age group, stroke, distance)."""
+        return sorted(self.bests, key=self.catalog.sort_key)
+
+    def event_bests(self, event: int) -> List[Dict]:
+        """Season bests for one event, fastest first (equal times by swimmer name)."""
+        return sorted(self.bests.get(event, {}).values(), key=lambda entry: (entry['seconds'], entry['swimmer']))
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable store (the format of .season-bests.json)."""
+        return {
+            'version': FORMAT_VERSION,
+            'season': self.season,
+            'meets': self.meets,
+            'events': [
+                {'event_id': event_id, 'label': self.catalog.label(event_id), 'bests': self.event_bests(event_id)}
+                for event_id in self.events()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict, catalog: Optional[EventCatalog] = None) -> 'SeasonStore':
+        """Rebuild the store from to_dict() output."""
+        store = cls(state.get('season'), catalog)
+        store.meets = state.get('meets', {})
+        for event in state.get('events', []):
+            store.bests[event['event_id']] = {entry['swimmer_id']: entry for entry in event['bests']}
+        return store
+
+
+def load_store(path: str) -> SeasonStore:
+    """Load a season store, or return an empty one if the file does not exist."""
+    if not os.path.exists(path):
+        return SeasonStore()
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    if state.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path} has an unsupported format; rebuild it with --rebuild")
+    return SeasonStore.from_dict(state)
+
+
+def save_store(store: SeasonStore, path: str):
+    """Write a season store as compact JSON (saving new catalog events first)."""
+    store.catalog.save()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(store.to_dict(), f, separators=(',', ':'))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Update the season-best times store from SDIF meet files.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/season_store.py -i ~/meet_night -o results/2025
+  python dev-tools/season_store.py -i ~/season_2025 -o results/2025 --rebuild
+        """
+    )
+    parser.add_argument('-i', '--input', dest='inputs', action='append', required=True,
+                        help='.sd3/.zip file or directory of them (repeatable)')
+    parser.add_argument('-o', '--output', dest='output_dir', type=str, required=True,
+                        help=f'Season folder holding {STORE_FILENAME} (e.g. results/2025)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help=f'Ignore the existing {STORE_FILENAME} and start from an empty store')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    check_store_paths(args.inputs, args.output_dir)
+
+    store_path = os.path.join(args.output_dir, STORE_FILENAME)
+    try:
+        store = SeasonStore() if args.rebuild else load_store(store_path)
+        store.check_season(folder_season(args.output_dir))
+    except ValueError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+    ingested, new_bests = store.update_from_sources(args.inputs)
+    save_store(store, store_path)
+
+    swimmers = sum(len(event_bests) for event_bests in store.bests.values())
+    logging.info(f"Ingested {ingested} meet(s) ({new_bests} new season best(s)); "
+                 f"{len(store.meets)} meet(s), {len(store.bests)} event(s), {swimmers} swimmer-event best(s) stored")
+    logging.info(f"Wrote {store_path}")
+
+
+if __name__ == '__main__':
+    main()
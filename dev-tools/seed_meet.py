@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+GPSA Meet Seeding
+Builds psych and heat sheets for an invitational (e.g. the City Meet) from the
+season-best times in season_store.py's store.
+
+Entries are each swimmer's season best in each individual event, filtered by
+the entry rules (teams, events, entries per team, entries per event). Each
+event is ranked fastest first and seeded by standard timed-finals rules:
+
+    - the fastest swimmers swim in the last heat, the slowest in the first
+    - every heat is full except the first, which gets at least --min-heat
+      swimmers (taken from the second heat when needed)
+    - within a heat, swimmers are placed center-out by seed time: lanes
+      4, 5, 3, 6, 2, 7, 1, 8 in an 8-lane pool
+
+Nothing is reparsed; the store is already indexed by event, so seeding a whole
+meet is a sort per event and takes milliseconds.
+"""
+
+import argparse
+import html
+import json
+import logging
+import os
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from build_archive import setup_logging
+from bulk_process_results import HTMLGenerator
+from season_store import STORE_FILENAME, SeasonStore, load_store
+
+# --- Configuration ---
+DEFAULT_LANES = 8
+DEFAULT_MIN_HEAT = 3
+PSYCH_SHEET_FILENAME = 'psych-sheet.html'
+HEAT_SHEET_FILENAME = 'heat-sheet.html'
+ENTRIES_FILENAME = 'entries.json'
+
+
+class EntryRules(NamedTuple):
+    """Which season bests become entries (None means no limit)."""
+    teams: Optional[frozenset] = None
+    events: Optional[frozenset] = None
+    max_per_team: Optional[int] = None
+    max_per_event: Optional[int] = None
+
+
+class SeededEvent(NamedTuple):
+    """One event of the meet: ranked entries (psych sheet) and heats of (lane, entry) in swim order."""
+    number: int
+    event: int  # event catalog id
+    label: str
+    entries: List[Dict]
+    heats: List[List[Tuple[int, Dict]]]
+
+
+def lane_order(lanes: int) -> List[int]:
+    """Lanes in seeding order, center-out: 8 lanes -> [4, 5, 3, 6, 2, 7, 1, 8]."""
+    center = (lanes + 1) // 2
+    order = [center]
+    for offset in range(1, lanes):
+        for lane in (center + offset, center - offset):
+            if 1 <= lane <= lanes:
+                order.append(lane)
+    return order
+
+
+def heat_sizes(entry_count: int, lanes: int, min_heat: int) -> List[int]:
+    """
+    Number of swimmers in each heat, in swim order (slowest heat first).
+
+    All heats are full except the first; if the first would have fewer than
+    min_heat swimmers, the second heat gives up swimmers to fill it, as long
+    as it keeps min_heat itself.
+    """
+    if entry_count <= 0:
+        return []
+    heat_count = -(-entry_count // lanes)
+    sizes = [lanes] * heat_count
+    sizes[0] = entry_count - lanes * (heat_count - 1)
+    if heat_count > 1 and sizes[0] < min_heat:
+        moved = max(0, min(min_heat - sizes[0], sizes[1] - min_heat))
+        sizes[0] += moved
+        sizes[1] -= moved
+    return sizes
+
+
+def seed_heats(entries: Sequence[Dict], lanes: int = DEFAULT_LANES,
+               min_heat: int = DEFAULT_MIN_HEAT) -> List[List[Tuple[int, Dict]]]:
+    """
+    Seed ranked entries (fastest first) into heats.
+
+    Returns:
+        Heats in swim order, each a list of (lane, entry) sorted by lane.
+    """
+    order = lane_order(lanes)
+    heats = []
+    end = len(entries)
+    # Heats are listed slowest first, so each takes the slowest remaining block;
+    # within a block the fastest swimmer gets the first lane in center-out order
+    for size in heat_sizes(len(entries), lanes, min_heat):
+        heats.append(sorted(zip(order, entries[end - size:end])))
+        end -= size
+    return heats
+
+
+def select_entries(bests: Sequence[Dict], rules: EntryRules) -> List[Dict]:
+    """Apply the entry rules to an event's season bests (fastest first)."""
+    entries = []
+    per_team: Dict[str, int] = {}
+    for entry in bests:
+        team = entry['team']
+        if rules.teams is not None and team not in rules.teams:
+            continue
+        if rules.max_per_team is not None:
+            if per_team.get(team, 0) >= rules.max_per_team:
+                continue
+            per_team[team] = per_team.get(team, 0) + 1
+        entries.append(entry)
+        if rules.max_per_event is not None and len(entries) >= rules.max_per_event:
+            break
+    return entries
+
+
+def seed_meet(store: SeasonStore, rules: EntryRules = EntryRules(), lanes: int = DEFAULT_LANES,
+              min_heat: int = DEFAULT_MIN_HEAT) -> List[SeededEvent]:
+    """
+    Seed every event in the store that passes the rules and has at least one entry.
+
+    Events are numbered in program order (gender, age group, stroke, distance).
+    """
+    seeded = []
+    for event in store.events():
+        label = store.catalog.label(event)
+        if rules.events is not None and label not in rules.events:
+            continue
+        entries = select_entries(store.event_bests(event), rules)
+        if entries:
+            seeded.append(SeededEvent(len(seeded) + 1, event, label, entries, seed_heats(entries, lanes, min_heat)))
+    return seeded
+
+
+def _entry_cells(entry: Dict) -> str:
+    return (f'<td>{html.escape(entry["swimmer"])}</td><td class="center">{html.escape(entry["age"])}</td>'
+            f'<td class="center">{html.escape(entry["team"])}</td><td class="center">{entry["time"]}</td>')
+
+
+def _event_table(first_header: str, rows: List[str]) -> str:
+    return f"""            <div class="table-wrapper narrow">
+                <table>
+                    <thead>
+                        <tr>
+                            <th class="center">{first_header}</th>
+                            <th>Swimmer</th>
+                            <th class="center">Age</th>
+                            <th class="center">Team</th>
+                            <th class="center">Seed Time</th>
+                        </tr>
+                    </thead>
+                    <tbody>{''.join(rows)}</tbody>
+                </table>
+            </div>"""
+
+
+def render_psych_sheet(meet_name: str, seeded: List[SeededEvent]) -> str:
+    """Psych sheet: every event's entries ranked by seed time."""
+    sections = []
+    for item in seeded:
+        rows = [f'<tr><td class="center">{rank}</td>{_entry_cells(entry)}</tr>'
+                for rank, entry in enumerate(item.entries, 1)]
+        sections.append(f'            <h2>Event {item.number}: {html.escape(item.label)}</h2>\n'
+                        + _event_table('Rank', rows))
+    return HTMLGenerator.page(f"{html.escape(meet_name)} Psych Sheet", '\n\n'.join(sections))
+
+
+def render_heat_sheet(meet_name: str, seeded: List[SeededEvent]) -> str:
+    """Heat sheet: every event's heats with lane assignments."""
+    sections = []
+    for item in seeded:
+        sections.append(f'            <h2>Event {item.number}: {html.escape(item.label)}</h2>')
+        for heat_number, heat in enumerate(item.heats, 1):
+            rows = [f'<tr><td class="center">{lane}</td>{_entry_cells(entry)}</tr>' for lane, entry in heat]
+            sections.append(f'            <h3 class="center">Heat {heat_number} of {len(item.heats)}</h3>\n'
+                            + _event_table('Lane', rows))
+    return HTMLGenerator.page(f"{html.escape(meet_name)} Heat Sheet", '\n'.join(sections))
+
+
+def entries_json(meet_name: str, season: Optional[int], rules: EntryRules, lanes: int, min_heat: int,
+                 seeded: List[SeededEvent]) -> Dict:
+    """Machine-readable entries and seeding (the format of entries.json)."""
+    return {
+        'meet': meet_name,
+        'season': season,
+        'lanes': lanes,
+        'min_heat': min_heat,
+        'rules': {
+            'teams': sorted(rules.teams) if rules.teams is not None else None,
+            'events': sorted(rules.events) if rules.events is not None else None,
+            'max_per_team': rules.max_per_team,
+            'max_per_event': rules.max_per_event,
+        },
+        'events': [
+            {'number': item.number, 'event_id': item.event, 'label': item.label,
+             'entries': [dict(entry, rank=rank) for rank, entry in enumerate(item.entries, 1)],
+             'heats': [[{'lane': lane, 'swimmer_id': entry['swimmer_id']} for lane, entry in heat]
+                       for heat in item.heats]}
+            for item in seeded
+        ],
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Seed an invitational from season-best times and write psych and heat sheets.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/seed_meet.py -s results/2025 -o invitationals/CityMeet/2025
+  python dev-tools/seed_meet.py -s results/2025 -o /tmp/seeding --max-per-team 4
+  python dev-tools/seed_meet.py -s results/2025 -o /tmp/seeding --team GG --team WW \\
+      --event "Girls 9-10 50m Freestyle" --lanes 6
+        """
+    )
+    parser.add_argument('-s', '--store', type=str, required=True,
+                        help=f'Season folder containing {STORE_FILENAME} (see season_store.py), or the file itself')
+    parser.add_argument('-o', '--output', dest='output_dir', type=str, required=True,
+                        help='Directory for the psych sheet, heat sheet and entries.json')
+    parser.add_argument('--meet-name', type=str, default='City Meet',
+                        help='Meet name shown on the sheets (default: City Meet)')
+    parser.add_argument('--lanes', type=int, default=DEFAULT_LANES,
+                        help=f'Lanes in the pool (default: {DEFAULT_LANES})')
+    parser.add_argument('--min-heat', type=int, default=DEFAULT_MIN_HEAT,
+                        help=f'Minimum swimmers in the first heat (default: {DEFAULT_MIN_HEAT})')
+    parser.add_argument('--team', dest='teams', action='append',
+                        help='Only enter swimmers from this team code (repeatable; default: all teams)')
+    parser.add_argument('--event', dest='events', action='append',
+                        help='Only seed this event, e.g. "Girls 9-10 50m Freestyle" (repeatable; default: all)')
+    parser.add_argument('--max-per-team', type=int, default=None,
+                        help='Entries per team per event (fastest first)')
+    parser.add_argument('--max-per-event', type=int, default=None,
+                        help='Entries per event (fastest first)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    if args.lanes < 1 or args.min_heat < 1:
+        parser.error("--lanes and --min-heat must be at least 1")
+
+    store_path = os.path.join(args.store, STORE_FILENAME) if os.path.isdir(args.store) else args.store
+    if not os.path.exists(store_path):
+        logging.error(f"Season store not found: {store_path} (build it with season_store.py)")
+        sys.exit(1)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    store = load_store(store_path)
+    rules = EntryRules(
+        teams=frozenset(args.teams) if args.teams else None,
+        events=frozenset(args.events) if args.events else None,
+        max_per_team=args.max_per_team,
+        max_per_event=args.max_per_event,
+    )
+
+    started = time.perf_counter()
+    seeded = seed_meet(store, rules, args.lanes, args.min_heat)
+    elapsed = time.perf_counter() - started
+
+    if rules.events is not None:
+        missing = rules.events - {item.label for item in seeded}
+        for label in sorted(missing):
+            logging.warning(f"No entries for event: {label}")
+
+    outputs = {
+        PSYCH_SHEET_FILENAME: render_psych_sheet(args.meet_name, seeded),
+        HEAT_SHEET_FILENAME: render_heat_sheet(args.meet_name, seeded),
+        ENTRIES_FILENAME: json.dumps(entries_json(args.meet_name, store.season, rules, args.lanes,
+                                                  args.min_heat, seeded), indent=1),
+    }
+    for filename, content in outputs.items():
+        with open(os.path.join(args.output_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    entry_count = sum(len(item.entries) for item in seeded)
+    heat_count = sum(len(item.heats) for item in seeded)
+    logging.info(f"Seeded {entry_count} entries into {heat_count} heats across {len(seeded)} events "
+                 f"in {elapsed * 1000:.1f} ms")
+    logging.info(f"Wrote {', '.join(outputs)} to {args.output_dir}")
+
+
+if __name__ == '__main__':
+    main()
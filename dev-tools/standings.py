@@ -0,0 +1,164 @@
+"""
+GPSA Standings Engine
+Computes dual meet standings with tie-breakers from a season's meet list.
+
+Teams are assigned a dense index on first sight; wins, losses, ties, points for
+and points against live in parallel lists indexed by team, and head-to-head
+results live in a square matrix of net results (+1 per win, -1 per loss).
+
+Ranking order:
+    1. Standings points (win = 1, tie = 0.5)
+    2. Fewest losses
+    3. Head-to-head net result among the teams still tied
+    4. Point differential (points for - points against)
+    5. Team abbreviation (stable, deterministic output)
+"""
+
+import json
+from collections import defaultdict
+
+
+class StandingsEngine:
+    """Accumulates dual meet results and ranks teams."""
+
+    def __init__(self, teams=()):
+        self.teams = []
+        self.index = {}
+        self.wins = []
+        self.losses = []
+        self.ties = []
+        self.points_for = []
+        self.points_against = []
+        self.head_to_head = []
+        for team_abbr in teams:
+            self._team_index(team_abbr)
+
+    @classmethod
+    def from_meets(cls, meets, teams=()):
+        """Builds an engine from an iterable of parsed meet dicts in a single pass."""
+        engine = cls(teams)
+        for meet in meets:
+            engine.add_meet(meet['home_abbr'], meet['home_score'], meet['away_abbr'], meet['away_score'])
+        return engine
+
+    def _team_index(self, team_abbr):
+        """Returns the index for a team, growing every per-team array on first sight."""
+        idx = self.index.get(team_abbr)
+        if idx is None:
+            idx = len(self.teams)
+            self.index[team_abbr] = idx
+            self.teams.append(team_abbr)
+            for column in (self.wins, self.losses, self.ties):
+                column.append(0)
+            for column in (self.points_for, self.points_against):
+                column.append(0.0)
+            for row in self.head_to_head:
+                row.append(0)
+            self.head_to_head.append([0] * len(self.teams))
+        return idx
+
+    def add_meet(self, home_abbr, home_score, away_abbr, away_score):
+        """Records a single dual meet result."""
+        home = self._team_index(home_abbr)
+        away = self._team_index(away_abbr)
+
+        self.points_for[home] += home_score
+        self.points_against[home] += away_score
+        self.points_for[away] += away_score
+        self.points_against[away] += home_score
+
+        if home_score > away_score:
+            winner, loser = home, away
+        elif away_score > home_score:
+            winner, loser = away, home
+        else:
+            self.ties[home] += 1
+            self.ties[away] += 1
+            return
+
+        self.wins[winner] += 1
+        self.losses[loser] += 1
+        self.head_to_head[winner][loser] += 1
+        self.head_to_head[loser][winner] -= 1
+
+    @property
+    def has_ties(self):
+        """True if any meet in the season ended in a tie."""
+        return any(self.ties)
+
+    def record(self, team_abbr):
+        """Returns the record for a team as a dict (all zeros for teams with no meets)."""
+        idx = self._team_index(team_abbr)
+        return {
+            'team': team_abbr,
+            'wins': self.wins[idx],
+            'losses': self.losses[idx],
+            'ties': self.ties[idx],
+            'points_for': self.points_for[idx],
+            'points_against': self.points_against[idx],
+            'point_differential': self.points_for[idx] - self.points_against[idx],
+        }
+
+    def rank(self, team_abbrs):
+        """
+        Orders teams by the tie-breaker rules described in the module docstring.
+
+        Args:
+            team_abbrs: Teams to rank (typically a single division)
+
+        Returns:
+            List of team abbreviations, best first.
+        """
+        indices = [self._team_index(abbr) for abbr in team_abbrs]
+
+        # Group by the primary keys, then break ties within each group
+        groups = defaultdict(list)
+        for idx in indices:
+            groups[(self.wins[idx] + 0.5 * self.ties[idx], -self.losses[idx])].append(idx)
+
+        ranked = []
+        for key in sorted(groups, reverse=True):
+            group = groups[key]
+            if len(group) > 1:
+                group.sort(key=lambda i: (
+                    -sum(self.head_to_head[i][j] for j in group),
+                    -(self.points_for[i] - self.points_against[i]),
+                    self.teams[i],
+                ))
+            ranked.extend(self.teams[i] for i in group)
+        return ranked
+
+    def to_dict(self, division_assignments, year=None, team_names=None):
+        """
+        Builds the JSON-serializable standings document.
+
+        Args:
+            division_assignments: Dict mapping division names to team abbreviations
+            year: Season year, included when given
+            team_names: Optional map of team abbreviation -> full team name
+        """
+        team_names = team_names or {}
+        divisions = {}
+        for division_name, division_teams in division_assignments.items():
+            rows = []
+            for rank, team_abbr in enumerate(self.rank(division_teams), 1):
+                row = {'rank': rank, **self.record(team_abbr)}
+                row['name'] = team_names.get(team_abbr, team_abbr)
+                rows.append(row)
+            divisions[division_name] = rows
+
+        document = {}
+        if year is not None:
+            document['season'] = year
+        document['divisions'] = divisions
+        document['head_to_head'] = {
+            'teams': list(self.teams),
+            'matrix': [list(row) for row in self.head_to_head],
+        }
+        return document
+
+    def write_json(self, path, division_assignments, year=None, team_names=None):
+        """Writes standings.json for other site tools to consume."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(division_assignments, year, team_names), f, indent=2)
+            f.write('\n')
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+GPSA Swim Analytics
+Grouped time statistics (min, median, percentiles, season improvement) over
+the column export written by swim_columns.py.
+
+The column files are mapped read-only without copying: as numpy.memmap arrays
+when NumPy is installed, otherwise as memoryviews over mmap. With NumPy every
+statistic is computed with one sort and vectorized indexing, so multi-season
+questions over hundreds of thousands of swims take milliseconds; without it
+the same results come from a pure-Python fallback.
+
+    from swim_analytics import SwimTable, grouped_stats, select
+
+    table = SwimTable('.swim-columns')
+    for stats in grouped_stats(table, rows=select(table, season=2025)):
+        table.event_label(stats.group), stats.median, stats.percentiles[90]
+"""
+
+import argparse
+import json
+import math
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from event_catalog import EventCatalog, default_catalog
+from swim_columns import COLUMNS, DEFAULT_COLUMNS_DIR, column_path, load_meta
+from swims import format_time
+
+try:
+    import numpy as np
+except ImportError:  # optional: fall back to pure Python
+    np = None
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+GROUP_COLUMNS = ('event', 'age', 'meet')
+
+
+class GroupStats(NamedTuple):
+    """Statistics of one group, in hundredths of a second."""
+    group: int
+    count: int
+    min: float
+    median: float
+    percentiles: Dict[int, float]
+
+
+class SwimTable:
+    """
+    A column export mapped into memory, one read-only array per column.
+
+    Columns are attributes named as in swim_columns.COLUMNS (hundredths,
+    event, swimmer, meet, date, age, place). Event ids are resolved through
+    the event catalog.
+    """
+
+    def __init__(self, columns_dir: str = DEFAULT_COLUMNS_DIR, use_numpy: bool = True,
+                 catalog: Optional[EventCatalog] = None):
+        self.meta = load_meta(columns_dir)
+        self.catalog = catalog if catalog is not None else default_catalog()
+        self.rows = self.meta['rows']
+        self.numpy = use_numpy and np is not None
+        self._maps = []
+        for column in COLUMNS:
+            setattr(self, column.name, self._map(column_path(columns_dir, column), column))
+
+    def _map(self, path: str, column):
+        itemsize = array(column.typecode).itemsize
+        if self.numpy:
+            if not self.rows:
+                return np.empty(0, dtype=column.dtype)
+            return np.memmap(path, dtype=column.dtype, mode='r', shape=(self.rows,))
+        if not self.rows:
+            return array(column.typecode)
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        if sys.byteorder == 'big':
+            # Columns are little-endian; a big-endian host needs a swapped copy
+            values = array(column.typecode, mapped[:self.rows * itemsize])
+            values.byteswap()
+            return values
+        return memoryview(mapped)[:self.rows * itemsize].cast(column.typecode)
+
+    def event_label(self, event_id: int) -> str:
+        return self.catalog.label(event_id)
+
+    def event_ids(self, labels: Sequence[str]) -> List[int]:
+        """Ids of the events with the given labels (unknown labels are ignored)."""
+        found = (self.catalog.find(label) for label in labels)
+        return [event_id for event_id in found if event_id is not None]
+
+
+def select(table: SwimTable, season: Optional[int] = None, event_ids: Optional[Sequence[int]] = None):
+    """
+    Row numbers matching the filters (all rows if none are given).
+
+    Returns:
+        A NumPy index array, or a list of row numbers without NumPy.
+    """
+    if table.numpy:
+        mask = np.ones(table.rows, dtype=bool)
+        if season is not None:
+            mask &= (table.date // 10000) == season
+        if event_ids is not None:
+            mask &= np.isin(table.event, np.asarray(event_ids, dtype=table.event.dtype))
+        return np.flatnonzero(mask)
+
+    events = set(event_ids) if event_ids is not None else None
+    dates, event_column = table.date, table.event
+    return [row for row in range(table.rows)
+            if (season is None or dates[row] // 10000 == season)
+            and (events is None or event_column[row] in events)]
+
+
+def _interpolate(sorted_values: List, q: float) -> float:
+    """Linear-interpolated percentile q of sorted values (NumPy's default method)."""
+    position = (len(sorted_values) - 1) * q / 100
+    low = math.floor(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def _grouped(groups, values, percentiles: Sequence[int], use_numpy: bool) -> List[GroupStats]:
+    """Per-group count, min, median and percentiles of values, groups in ascending id order."""
+    wanted = sorted(set(percentiles) | {50})
+    if use_numpy:
+        if not len(values):
+            return []
+        order = np.lexsort((values, groups))
+        sorted_values = values[order].astype(np.float64)
+        sorted_groups = groups[order]
+        starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+        counts = np.diff(np.r_[starts, len(sorted_groups)])
+        results = {}
+        for q in wanted:
+            position = starts + (counts - 1) * (q / 100)
+            low = np.floor(position).astype(np.int64)
+            high = np.minimum(low + 1, starts + counts - 1)
+            results[q] = sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+        return [GroupStats(int(sorted_groups[start]), int(count), float(sorted_values[start]),
+                           float(results[50][i]), {q: float(results[q][i]) for q in percentiles})
+                for i, (start, count) in enumerate(zip(starts, counts))]
+
+    by_group = defaultdict(list)
+    for group, value in zip(groups, values):
+        by_group[group].append(value)
+    stats = []
+    for group in sorted(by_group):
+        group_values = sorted(by_group[group])
+        count = len(group_values)
+        stats.append(GroupStats(group, count, float(group_values[0]),
+                                float(_interpolate(group_values, 50)),
+                                {q: float(_interpolate(group_values, q)) for q in percentiles}))
+    return stats
+
+
+def grouped_stats(table: SwimTable, by: str = 'event', rows=None,
+                  percentiles: Sequence[int] = DEFAULT_PERCENTILES) -> List[GroupStats]:
+    """
+    Time statistics per event (or per age, or per meet).
+
+    Args:
+        table: Mapped column export
+        by: Column to group on: 'event', 'age' or 'meet'
+        rows: Row numbers from select() (default: every row)
+        percentiles: Percentiles to report, 0-100
+    """
+    groups, values = getattr(table, by), table.hundredths
+    if rows is not None:
+        if table.numpy:
+            groups, values = groups[rows], values[rows]
+        else:
+            groups, values = [groups[row] for row in rows], [values[row] for row in rows]
+    return _grouped(groups, values, percentiles, table.numpy)
+
+
+def improvement_stats(table: SwimTable, rows=None,
+                      percentiles: Sequence[int] = DEFAULT_PERCENTILES) -> List[GroupStats]:
+    """
+    Distribution of in-season improvement per event.
+
+    For every swimmer who swam an event at least twice in a season, the
+    improvement is their first time of the season minus their best; the
+    statistics are over those improvements (hundredths), grouped by event.
+    """
+    if table.numpy:
+        index = rows if rows is not None else np.arange(table.rows)
+        if not len(index):
+            return []
+        swimmer, event = table.swimmer[index], table.event[index]
+        date, values = table.date[index], table.hundredths[index].astype(np.int64)
+        season = date // 10000
+        order = np.lexsort((values, date, season, event, swimmer))
+        swimmer, event, season, values = swimmer[order], event[order], season[order], values[order]
+        new_group = np.r_[True, (swimmer[1:] != swimmer[:-1]) | (event[1:] != event[:-1])
+                          | (season[1:] != season[:-1])]
+        starts = np.flatnonzero(new_group)
+        counts = np.diff(np.r_[starts, len(values)])
+        improvement = values[starts] - np.minimum.reduceat(values, starts)
+        repeated = counts >= 2
+        return _grouped(event[starts][repeated], improvement[repeated], percentiles, True)
+
+    swims = defaultdict(list)
+    for row in (rows if rows is not None else range(table.rows)):
+        date = table.date[row]
+        swims[(table.swimmer[row], table.event[row], date // 10000)].append((date, table.hundredths[row]))
+    events, improvements = [], []
+    for (swimmer, event, season), history in swims.items():
+        if len(history) >= 2:
+            first = min(history)[1]
+            events.append(event)
+            improvements.append(first - min(value for _, value in history))
+    return _grouped(events, improvements, percentiles, False)
+
+
+def _format_hundredths(value: float, as_time: bool = True) -> str:
+    return format_time(value / 100) if as_time else f"{value / 100:.2f}"
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Percentile, minimum and median times over the swim column export.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/swim_analytics.py --season 2025
+  python dev-tools/swim_analytics.py --event "Girls 9-10 50m Freestyle" --percentiles 10,50,90
+  python dev-tools/swim_analytics.py --season 2025 --improvement
+  python dev-tools/swim_analytics.py --by age --json
+        """
+    )
+    parser.add_argument('-d', '--columns', dest='columns_dir', type=str, default=DEFAULT_COLUMNS_DIR,
+                        help='Column directory written by swim_columns.py (default: .swim-columns/)')
+    parser.add_argument('--season', type=int, default=None,
+                        help='Only swims from this season (default: all seasons)')
+    parser.add_argument('--event', dest='events', action='append',
+                        help='Only this event, e.g. "Girls 9-10 50m Freestyle" (repeatable)')
+    parser.add_argument('--by', choices=GROUP_COLUMNS, default='event',
+                        help='Group by event (default), swimmer age or meet')
+    parser.add_argument('--percentiles', type=str, default=','.join(map(str, DEFAULT_PERCENTILES)),
+                        help='Comma-separated percentiles (default: 10,25,50,75,90)')
+    parser.add_argument('--improvement', action='store_true',
+                        help='Report first-to-best improvement per swimmer instead of times (by event)')
+    parser.add_argument('--json', action='store_true',
+                        help='Print JSON instead of a table')
+    args = parser.parse_args()
+
+    try:
+        percentiles = [int(q) for q in args.percentiles.split(',') if q.strip()]
+    except ValueError:
+        parser.error("--percentiles must be comma-separated integers")
+    if any(not 0 <= q <= 100 for q in percentiles):
+        parser.error("--percentiles must be between 0 and 100")
+
+    if not os.path.exists(os.path.join(args.columns_dir, 'meta.json')):
+        print(f"❌ No column export in {args.columns_dir} (create one with swim_columns.py)")
+        return 1
+
+    table = SwimTable(args.columns_dir)
+    started = time.perf_counter()
+    event_ids = table.event_ids(args.events) if args.events else None
+    rows = select(table, season=args.season, event_ids=event_ids)
+    if args.improvement:
+        stats = improvement_stats(table, rows, percentiles)
+        by = 'event'
+    else:
+        stats = grouped_stats(table, args.by, rows, percentiles)
+        by = args.by
+    if by == 'event':
+        stats.sort(key=lambda s: table.catalog.sort_key(s.group))
+    elapsed = time.perf_counter() - started
+
+    def group_name(group):
+        if by == 'event':
+            return table.event_label(group)
+        if by == 'meet':
+            return table.meta['meets'][group]['name']
+        return str(group) if group else 'Unknown'
+
+    if args.json:
+        print(json.dumps([{by: group_name(s.group), 'count': s.count, 'min': round(s.min / 100, 3),
+                           'median': round(s.median / 100, 3),
+                           'percentiles': {str(q): round(value / 100, 3) for q, value in s.percentiles.items()}}
+                          for s in stats], indent=1))
+        return 0
+
+    as_time = not args.improvement
+    headers = [by.capitalize(), 'Swims' if as_time else 'Swimmers', 'Min', 'Median']
+    headers += [f"P{q}" for q in percentiles]
+    lines = [[group_name(s.group), str(s.count), _format_hundredths(s.min, as_time),
+              _format_hundredths(s.median, as_time)]
+             + [_format_hundredths(s.percentiles[q], as_time) for q in percentiles]
+             for s in stats]
+    widths = [max(len(row[i]) for row in [headers] + lines) for i in range(len(headers))]
+    for row in [headers] + lines:
+        print('  '.join(cell.ljust(width) if i == 0 else cell.rjust(width)
+                        for i, (cell, width) in enumerate(zip(row, widths))))
+
+    engine = 'NumPy' if table.numpy else 'pure Python'
+    print(f"\n📊 {len(rows)} of {table.rows} swims, {len(stats)} group(s) in {elapsed * 1000:.1f} ms ({engine})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+GPSA Swim Columns
+Exports every parsed swim into typed, memory-mappable column files.
+
+Per-meet HTML is the wrong shape for questions like "how fast is a typical
+9-10 50 free". This export stage writes all individual swims, across any
+number of seasons, as one flat little-endian binary file per column:
+
+    hundredths.bin  <u4  final time in hundredths of a second
+    event.bin       <u2  event id       (event catalog id, see event_catalog.py)
+    swimmer.bin     <u4  swimmer id     (index into meta.json "swimmers")
+    meet.bin        <u4  meet id        (index into meta.json "meets")
+    date.bin        <u4  meet date as YYYYMMDD (0 if unknown)
+    age.bin         <u1  swimmer age (0 if unknown)
+    place.bin       <u2  place
+
+meta.json holds the row count, each column's file and dtype, and the swimmer
+and meet id tables; event ids are shared with every other tool through the
+event catalog, so the export needs no event table of its own. Row i of every
+column describes the same swim. The files have no headers, so numpy.memmap (or
+mmap + memoryview) maps them without copying; swim_analytics.py does exactly
+that.
+
+Exports are incremental: meets already in meta.json (by content fingerprint)
+are skipped and new rows are appended. meta.json is written last, and its row
+count is authoritative, so rows left over from an interrupted export are
+ignored on load and overwritten by the next export.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from build_archive import setup_logging
+from bulk_process_results import SDIFParser, decode_sdif, iter_sdif_sources, sdif_fingerprint
+from event_catalog import default_catalog
+from swims import iter_swims
+
+# --- Configuration ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+
+DEFAULT_COLUMNS_DIR = os.path.join(REPO_ROOT, '.swim-columns')
+META_FILENAME = 'meta.json'
+FORMAT_VERSION = 2
+
+
+class Column(NamedTuple):
+    """A column file: name, NumPy-style dtype and the matching array module typecode."""
+    name: str
+    dtype: str
+    typecode: str
+
+
+def _typecode(size: int, signed: bool = False) -> str:
+    """array typecode with the given item size (C type sizes vary by platform)."""
+    for code in ('bhilq' if signed else 'BHILQ'):
+        if array(code).itemsize == size:
+            return code
+    raise RuntimeError(f"No array typecode with item size {size}")
+
+
+COLUMNS = (
+    Column('hundredths', '<u4', _typecode(4)),
+    Column('event', '<u2', _typecode(2)),
+    Column('swimmer', '<u4', _typecode(4)),
+    Column('meet', '<u4', _typecode(4)),
+    Column('date', '<u4', _typecode(4)),
+    Column('age', '<u1', _typecode(1)),
+    Column('place', '<u2', _typecode(2)),
+)
+
+
+def column_path(columns_dir: str, column: Column) -> str:
+    """Path of a column's data file."""
+    return os.path.join(columns_dir, f"{column.name}.bin")
+
+
+def empty_meta() -> Dict:
+    """meta.json for an empty export."""
+    return {
+        'version': FORMAT_VERSION,
+        'rows': 0,
+        'columns': {column.name: {'file': f"{column.name}.bin", 'dtype': column.dtype} for column in COLUMNS},
+        'swimmers': [],
+        'meets': [],
+    }
+
+
+def load_meta(columns_dir: str) -> Dict:
+    """Read meta.json, or return empty metadata if the export does not exist yet."""
+    path = os.path.join(columns_dir, META_FILENAME)
+    if not os.path.exists(path):
+        return empty_meta()
+    with open(path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path} has an unsupported format; re-export with --rebuild")
+    return meta
+
+
+def save_meta(columns_dir: str, meta: Dict):
+    """Write meta.json atomically, after the column data it describes."""
+    path = os.path.join(columns_dir, META_FILENAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(meta, f, separators=(',', ':'))
+    os.replace(path + '.tmp', path)
+
+
+class ColumnWriter:
+    """Appends rows to an export, assigning ids to new swimmers and meets."""
+
+    def __init__(self, columns_dir: str, meta: Dict):
+        self.columns_dir = columns_dir
+        self.meta = meta
+        self.buffers = {column.name: array(column.typecode) for column in COLUMNS}
+        self.swimmer_ids = {key: i for i, key in enumerate(meta['swimmers'])}
+        self.meet_fingerprints = {meet['fingerprint'] for meet in meta['meets']}
+
+    def _id(self, ids: Dict, table: List, value) -> int:
+        found = ids.get(value)
+        if found is None:
+            found = ids[value] = len(table)
+            table.append(value)
+        return found
+
+    def add_meet(self, data: Dict, fingerprint: str) -> int:
+        """
+        Buffer every individual swim of a parsed meet.
+
+        Returns:
+            Rows added, or -1 if the meet was already exported.
+        """
+        if fingerprint in self.meet_fingerprints:
+            return -1
+        self.meet_fingerprints.add(fingerprint)
+        meet_id = len(self.meta['meets'])
+        rows = 0
+        date = 0
+        for swim in iter_swims(data):
+            date = int(swim.date.replace('-', '')) if swim.date else 0
+            self.buffers['hundredths'].append(round(swim.seconds * 100))
+            self.buffers['event'].append(swim.event)
+            self.buffers['swimmer'].append(self._id(self.swimmer_ids, self.meta['swimmers'], swim.swimmer_key))
+            self.buffers['meet'].append(meet_id)
+            self.buffers['date'].append(date)
+            self.buffers['age'].append(int(swim.age) if swim.age.isdigit() and int(swim.age) < 256 else 0)
+            self.buffers['place'].append(min(swim.place, 0xFFFF))
+            rows += 1
+        self.meta['meets'].append({'fingerprint': fingerprint, 'name': data['meet'].get('name', ''),
+                                   'date': date, 'rows': rows})
+        return rows
+
+    def flush(self):
+        """Append the buffered rows to the column files, then record them in meta.json."""
+        # Event ids in the new rows must be in the saved catalog before meta.json refers to them
+        default_catalog().save()
+        rows = self.meta['rows']
+        added = len(self.buffers['hundredths'])
+        os.makedirs(self.columns_dir, exist_ok=True)
+        for column in COLUMNS:
+            buffer = self.buffers[column.name]
+            if sys.byteorder == 'big':
+                buffer.byteswap()
+            with open(column_path(self.columns_dir, column), 'ab') as f:
+                # Drop rows from an interrupted export that meta.json never recorded
+                f.truncate(rows * buffer.itemsize)
+                buffer.tofile(f)
+            self.buffers[column.name] = array(column.typecode)
+        self.meta['rows'] = rows + added
+        save_meta(self.columns_dir, self.meta)
+
+
+def export_swims(columns_dir: str, inputs: Iterable[str], rebuild: bool = False) -> Tuple[int, int]:
+    """
+    Export the swims of every SDIF source under the input paths.
+
+    Returns:
+        Tuple (meets exported, rows added)
+    """
+    meta = empty_meta() if rebuild else load_meta(columns_dir)
+    if rebuild:
+        for column in COLUMNS:
+            if os.path.exists(column_path(columns_dir, column)):
+                os.remove(column_path(columns_dir, column))
+
+    writer = ColumnWriter(columns_dir, meta)
+    meets = rows = 0
+    for source, raw in iter_sdif_sources(inputs):
+        added = writer.add_meet(SDIFParser().parse(decode_sdif(raw)), sdif_fingerprint(raw))
+        if added < 0:
+            logging.debug(f"  {source}: already exported")
+            continue
+        logging.info(f"  {source}: {added} swim(s)")
+        meets += 1
+        rows += added
+    writer.flush()
+    return meets, rows
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Export parsed swims into memory-mappable column files for analytics.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dev-tools/swim_columns.py -i ~/meet_night
+  python dev-tools/swim_columns.py -i ~/sd3/2023 -i ~/sd3/2024 -i ~/sd3/2025 --rebuild
+  python dev-tools/swim_columns.py -i ~/meet_night -o /tmp/swim-columns
+        """
+    )
+    parser.add_argument('-i', '--input', dest='inputs', action='append', required=True,
+                        help='.sd3/.zip file or directory of them (repeatable)')
+    parser.add_argument('-o', '--output', dest='columns_dir', type=str, default=DEFAULT_COLUMNS_DIR,
+                        help='Column directory (default: .swim-columns/ in the repository root)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Discard the existing export and start over')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose logging output')
+    args = parser.parse_args()
+
+    setup_logging(verbose=args.verbose)
+
+    for path in args.inputs:
+        if not os.path.exists(path):
+            logging.error(f"Input does not exist: {path}")
+            sys.exit(1)
+
+    try:
+        meets, rows = export_swims(args.columns_dir, args.inputs, rebuild=args.rebuild)
+    except ValueError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+    meta = load_meta(args.columns_dir)
+    logging.info(f"Exported {meets} new meet(s), {rows} swim(s); {args.columns_dir} now holds "
+                 f"{meta['rows']} swims from {len(meta['meets'])} meet(s) and "
+                 f"{len(meta['swimmers'])} swimmer(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+GPSA Swim Records
+Swim times and individual swims extracted from parsed SDIF meets.
+
+Shared by the season tools that work on individual swims rather than rendered
+pages (leaderboards.py, season_store.py, rosters.py). Meets are parsed with
+bulk_process_results.SDIFParser; this module turns its results into flat Swim
+records:
+
+    from bulk_process_results import SDIFParser, decode_sdif
+    from swims import iter_swims
+
+    data = SDIFParser().parse(decode_sdif(raw))
+    for swim in iter_swims(data):
+        swim.event, swim.swimmer, swim.seconds
+
+Events are identified by their event catalog id (see event_catalog.py).
+
+The stores those tools keep subclass IncrementalSwimStore, which ingests each
+meet once (by content fingerprint) and leaves only the per-swim accumulation
+to the subclass.
+"""
+
+import abc
+import hashlib
+import logging
+import os
+import re
+import sys
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from bulk_process_results import SDIFParser, decode_sdif, iter_sdif_sources, sdif_fingerprint
+from event_catalog import EventCatalog, default_catalog
+
+# Final times such as "35.12" or "1:05.23"; anything else (NT, NS, DQ, DNF, SCR) is not a time.
+TIME_PATTERN = re.compile(r'^(?:(\d+):)?(\d+(?:\.\d+)?)$')
+
+# Swimmer fields the tools keep in their unpublished state files but never publish
+# under results/ (most swimmers are minors): the hashed identity and the exact age.
+PRIVATE_FIELDS = ('swimmer_id', 'age')
+
+
+class Swim(NamedTuple):
+    """One individual swim with a valid final time."""
+    event: int  # event catalog id
+    swimmer: str
+    swimmer_key: str
+    team: str
+    age: str
+    time: str
+    seconds: float
+    place: int
+    meet: str
+    date: str
+
+
+def parse_time(text: str) -> Optional[float]:
+    """
+    Convert an SDIF final time to seconds.
+
+    Returns:
+        Seconds as a float, or None for NT, NS, DQ, DNF, SCR and blank times.
+    """
+    match = TIME_PATTERN.match(text.strip())
+    if not match:
+        return None
+    minutes, seconds = match.groups()
+    return int(minutes or 0) * 60 + float(seconds)
+
+
+def format_time(seconds: float) -> str:
+    """Format seconds like a meet time: 35.12, 1:05.23."""
+    minutes, rest = divmod(round(seconds * 100), 6000)
+    if minutes:
+        return f"{minutes}:{rest // 100:02d}.{rest % 100:02d}"
+    return f"{rest // 100}.{rest % 100:02d}"
+
+
+def meet_date(data: Dict) -> str:
+    """The meet's start date as YYYY-MM-DD, or '' if the file has none."""
+    start_date = data['meet'].get('startDate', '')
+    if len(start_date) != 8:
+        return ''
+    return f"{start_date[4:]}-{start_date[0:2]}-{start_date[2:4]}"
+
+
+def swimmer_key(result: Dict) -> str:
+    """
+    Opaque identity of the swimmer behind a result.
+
+    Built from the team plus the USS ID when the meet file carries one,
+    otherwise team plus name, and hashed so it can be published without
+    exposing the ID (older USS IDs embed the swimmer's birth date).
+    """
+    identity = f"{result['teamCode']}:{result.get('swimmerId') or result['swimmer']}"
+    return hashlib.sha1(identity.encode('utf-8')).hexdigest()[:16]
+
+
+def iter_swims(data: Dict) -> Iterator[Swim]:
+    """
+    Yield every individual swim with a valid final time from a parsed meet.
+
+    Relays, and events without a catalog id (distance not a number), are skipped.
+    """
+    meet_name = data['meet'].get('name', '')
+    date = meet_date(data)
+
+    for event in data['events'].values():
+        key = event['eventId']
+        if event['type'] != 'Individual' or key is None:
+            continue
+
+        for result in event['results']:
+            seconds = parse_time(result['time'])
+            if seconds is None:
+                continue
+            yield Swim(key, result['swimmer'], swimmer_key(result), result['teamCode'], result.get('age', ''),
+                       result['time'], seconds, result['place'], meet_name, date)
+
+
+class IncrementalSwimStore(abc.ABC):
+    """
+    Season state built one meet at a time from the meets' individual swims.
+
+    Ingested meets are recorded by sdif_fingerprint() in self.meets, so feeding
+    the same file again is a no-op, and meets from another season than the
+    store's are skipped. The season comes from the output folder (check_season)
+    or else from the first meet ingested. Subclasses implement add_swims().
+    """
+
+    # Completes "Skipping <meet>: <year> meet, but ..."
+    SEASON_MISMATCH = "the store holds the {season} season"
+    # Logged after each ingested meet with add_swims()'s count, e.g. "12 new season best(s)"
+    CHANGE_LABEL = 'change(s)'
+
+    def __init__(self, season: Optional[int] = None, catalog: Optional[EventCatalog] = None):
+        self.season = season
+        self.catalog = catalog if catalog is not None else default_catalog()
+        # Fingerprint -> {'name', 'date', 'swims'} for every ingested meet
+        self.meets: Dict[str, Dict] = {}
+
+    @abc.abstractmethod
+    def add_swims(self, data: Dict, swims: List[Swim]) -> int:
+        """Accumulate the swims of one new meet of the season; returns the number of changes."""
+
+    def check_season(self, season: Optional[int]):
+        """
+        Tie the store to the season of its output folder (see folder_season).
+
+        Raises:
+            ValueError: if the store already holds another season
+        """
+        if season is None:
+            return
+        if self.season is None:
+            self.season = season
+        elif self.season != season:
+            raise ValueError(f"The existing data is for the {self.season} season, but the output folder is "
+                             f"for {season}; check -o, or rerun with --rebuild and the {season} meets")
+
+    def ingest_swims(self, data: Dict, fingerprint: str) -> Optional[int]:
+        """
+        Add every individual swim of a parsed meet.
+
+        Args:
+            data: SDIFParser output
+            fingerprint: sdif_fingerprint() of the meet file, used to skip meets already ingested
+
+        Returns:
+            add_swims()'s count, or None if the meet was skipped (already
+            ingested, or from another season).
+        """
+        if fingerprint in self.meets:
+            return None
+        swims = list(iter_swims(data))
+        year = int(swims[0].date[:4]) if swims and swims[0].date else None
+        if self.season is None:
+            self.season = year
+        elif year is not None and year != self.season:
+            logging.warning(f"Skipping {data['meet'].get('name', 'meet')}: {year} meet, "
+                            f"but {self.SEASON_MISMATCH.format(season=self.season)}")
+            return None
+
+        changes = self.add_swims(data, swims)
+        self.meets[fingerprint] = {'name': data['meet'].get('name', ''),
+                                   'date': swims[0].date if swims else '', 'swims': len(swims)}
+        return changes
+
+    def update_from_sources(self, inputs: Iterable[str]) -> Tuple[int, int]:
+        """
+        Ingest every SDIF source under the input paths.
+
+        Returns:
+            Tuple (meets ingested, total of add_swims()'s counts)
+        """
+        ingested = changes = 0
+        for source, raw in iter_sdif_sources(inputs):
+            fingerprint = sdif_fingerprint(raw)
+            if fingerprint in self.meets:
+                logging.info(f"  {source}: already ingested")
+                continue
+            result = self.ingest_swims(SDIFParser().parse(decode_sdif(raw)), fingerprint)
+            if result is not None:
+                logging.info(f"  {source}: {result} {self.CHANGE_LABEL}")
+                ingested += 1
+                changes += result
+        return ingested, changes
+
+
+def folder_season(output_dir: str) -> Optional[int]:
+    """The season of a season folder such as results/2025, or None if its name is not a year."""
+    name = os.path.basename(os.path.normpath(os.path.abspath(output_dir)))
+    return int(name) if re.fullmatch(r'\d{4}', name) else None
+
+
+def check_store_paths(inputs: Iterable[str], output_dir: str):
+    """Exit with an error unless every input and the season output folder exist (store tools' main)."""
+    for path in inputs:
+        if not os.path.exists(path):
+            logging.error(f"Input does not exist: {path}")
+            sys.exit(1)
+    if not os.path.isdir(output_dir):
+        logging.error(f"Output directory does not exist: {output_dir}")
+        sys.exit(1)
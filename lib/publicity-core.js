@@ -5,8 +5,14 @@
  * Used by:
  * - tools/publicity.html (browser)
  * - publicity-server/server.mjs (Node.js API)
+ *
+ * SDIF record columns come from sdif-layout.js, generated from sdif-layout.json,
+ * which dev-tools/bulk_process_results.py reads too. dev-tools/sdif_parity.py
+ * checks that parseSdif() and the Python parser agree.
  */
 
+import { SDIF_LAYOUT } from './sdif-layout.js';
+
 // =============================================================================
 // Constants
 // =============================================================================
@@ -31,6 +37,69 @@ export const GENDER_MAP = {
     'X': 'Mixed'
 };
 
+// =============================================================================
+// SDIF Layout
+// =============================================================================
+
+/**
+ * Compiles the SDIF layout definition (1-based columns) into 0-based
+ * [begin, end) field tables for substring().
+ *
+ * @param {object} spec - Layout definition, as in lib/sdif-layout.json
+ * @returns {{ recordCode: number[], records: object, ageCode: object }} Compiled layout
+ */
+export function compileLayout(spec) {
+    const column = ({ start, length }) => [start - 1, start - 1 + length];
+    const records = {};
+    for (const [code, record] of Object.entries(spec.records)) {
+        const fields = {};
+        for (const [name, field] of Object.entries(record.fields)) {
+            fields[name] = column(field);
+        }
+        records[code] = { minLength: record.minLength || 0, fields };
+    }
+    const age = spec.ageCode;
+    return {
+        recordCode: column(spec.recordCode),
+        records,
+        ageCode: {
+            length: age.length,
+            under: age.under,
+            over: age.over,
+            lower: column(age.fields.lower),
+            upper: column(age.fields.upper)
+        }
+    };
+}
+
+export const LAYOUT = compileLayout(SDIF_LAYOUT);
+
+const B1 = LAYOUT.records.B1.fields;
+const B2 = LAYOUT.records.B2.fields;
+const C1 = LAYOUT.records.C1.fields;
+const D0 = LAYOUT.records.D0;
+const E0 = LAYOUT.records.E0;
+const F0 = LAYOUT.records.F0;
+
+function field(line, [begin, end]) {
+    return line.substring(begin, end);
+}
+
+/**
+ * Parses a whole-number field the way the Python parser's int() does:
+ * surrounding spaces and a sign are allowed, anything else is NaN.
+ */
+function parseSdifInt(text) {
+    return /^\s*[+-]?\d+\s*$/.test(text) ? parseInt(text, 10) : NaN;
+}
+
+/**
+ * Parses a decimal field (points) the way the Python parser's float() does.
+ */
+function parseSdifFloat(text) {
+    return /^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$/.test(text) ? parseFloat(text) : NaN;
+}
+
 // =============================================================================
 // Utility Functions
 // =============================================================================
@@ -61,25 +130,26 @@ export function escapeHtml(text) {
  * @returns {string} Human-readable age group (e.g., "8-10", "10 & Under", "Open")
  */
 export function parseAgeCode(ageCode) {
-    if (!ageCode || ageCode.length < 4) return 'Open';
+    const layout = LAYOUT.ageCode;
+    if (!ageCode || ageCode.length < layout.length) return 'Open';
 
-    const lowerStr = ageCode.substring(0, 2);
-    const upperStr = ageCode.substring(2, 4);
+    const lowerStr = field(ageCode, layout.lower);
+    const upperStr = field(ageCode, layout.upper);
 
-    if (lowerStr === 'UN' && upperStr === 'OV') return 'Open';
+    if (lowerStr === layout.under && upperStr === layout.over) return 'Open';
 
-    if (lowerStr === 'UN') {
-        const upperAge = parseInt(upperStr, 10);
+    if (lowerStr === layout.under) {
+        const upperAge = parseSdifInt(upperStr);
         return isNaN(upperAge) ? 'Open' : `${upperAge} & Under`;
     }
 
-    if (upperStr === 'OV') {
-        const lowerAge = parseInt(lowerStr, 10);
+    if (upperStr === layout.over) {
+        const lowerAge = parseSdifInt(lowerStr);
         return isNaN(lowerAge) ? 'Open' : `${lowerAge} & Over`;
     }
 
-    const lowerAge = parseInt(lowerStr, 10);
-    const upperAge = parseInt(upperStr, 10);
+    const lowerAge = parseSdifInt(lowerStr);
+    const upperAge = parseSdifInt(upperStr);
 
     if (isNaN(lowerAge) || isNaN(upperAge)) return 'Open';
 
@@ -155,10 +225,11 @@ export function parseSdif(data) {
     let lastRelayResult = null;
 
     function createEventObject(line, type) {
-        const genderCode = type === 'Individual' ? line.substring(66, 67) : line.substring(20, 21);
-        const ageCode = type === 'Individual' ? line.substring(76, 80) : line.substring(30, 34);
-        const distance = type === 'Individual' ? line.substring(67, 71).trim() : line.substring(21, 25).trim();
-        const strokeCode = type === 'Individual' ? line.substring(71, 72) : line.substring(25, 26);
+        const fields = type === 'Individual' ? D0.fields : E0.fields;
+        const genderCode = field(line, fields.gender);
+        const ageCode = field(line, fields.ageCode);
+        const distance = field(line, fields.distance).trim();
+        const strokeCode = field(line, fields.stroke);
         const gender = GENDER_MAP[genderCode] || 'Unknown';
         let age = parseAgeCode(ageCode);
 
@@ -175,22 +246,22 @@ export function parseSdif(data) {
     }
 
     lines.forEach(line => {
-        const code = line.substring(0, 2);
+        const code = field(line, LAYOUT.recordCode);
         try {
             switch (code) {
                 case 'B1':
-                    meet.name = line.substring(11, 41).trim();
-                    meet.startDate = line.substring(121, 129).trim(); // MMDDYYYY
+                    meet.name = field(line, B1.meetName).trim();
+                    meet.startDate = field(line, B1.startDate).trim(); // MMDDYYYY
                     lastRelayResult = null;
                     break;
                 case 'B2': // Capture Host Team Name
-                    if (!meet.hostName) { // Only capture the first host listed
-                        meet.hostName = line.substring(11, 41).trim();
+                    if (meet.hostName === undefined) { // Only capture the first host listed
+                        meet.hostName = field(line, B2.hostName).trim();
                     }
                     break;
                 case 'C1':
-                    const rawTeamCode = line.substring(11, 17).trim();
-                    const teamName = line.substring(17, 47).trim();
+                    const rawTeamCode = field(line, C1.teamCode).trim();
+                    const teamName = field(line, C1.teamName).trim();
                     currentTeamCode = rawTeamCode;
                     if (!teams[rawTeamCode]) {
                         let displayCode = rawTeamCode;
@@ -203,12 +274,18 @@ export function parseSdif(data) {
                     break;
                 case 'D0':
                     lastRelayResult = null;
-                    const eventNumD0 = line.substring(72, 76).trim();
+                    if (line.length < D0.minLength) break;
+                    const eventNumD0 = field(line, D0.fields.eventNumber).trim();
                     if (eventNumD0 && eventNumD0 !== '0') {
-                        const swimmerName = line.substring(11, 39).trim();
-                        const finalTime = line.substring(115, 123).trim();
-                        const place = parseInt(line.substring(135, 138).trim(), 10);
-                        const points = parseFloat(line.substring(138, 142).trim()) || 0;
+                        const swimmerName = field(line, D0.fields.swimmerName).trim();
+                        const finalTime = field(line, D0.fields.finalTime).trim();
+                        const placeStr = field(line, D0.fields.place).trim();
+                        const pointsStr = field(line, D0.fields.points).trim();
+                        // Swims without a place (e.g. exhibition) are not results
+                        if (!placeStr) break;
+                        const place = parseSdifInt(placeStr);
+                        const points = pointsStr ? parseSdifFloat(pointsStr) : 0;
+                        if (isNaN(place) || isNaN(points)) break;
                         if (!events[eventNumD0]) {
                             events[eventNumD0] = createEventObject(line, 'Individual');
                         }
@@ -227,19 +304,26 @@ export function parseSdif(data) {
                     }
                     break;
                 case 'E0':
-                    const eventNumE0 = line.substring(26, 30).trim();
+                    // F0 names that follow belong to this relay, or to none if it is skipped
+                    lastRelayResult = null;
+                    if (line.length < E0.minLength) break;
+                    const eventNumE0 = field(line, E0.fields.eventNumber).trim();
                     if (eventNumE0 && eventNumE0 !== '0') {
-                        const relayTeamChar = line.substring(11, 12).trim();
-                        const relayFinalTime = line.substring(72, 80).trim();
-                        const relayPlace = parseInt(line.substring(92, 95).trim(), 10);
-                        const relayPoints = parseFloat(line.substring(95, 99).trim()) || 0;
+                        const relayTeamChar = field(line, E0.fields.relayTeam).trim();
+                        const relayFinalTime = field(line, E0.fields.finalTime).trim();
+                        const relayPlaceStr = field(line, E0.fields.place).trim();
+                        const relayPointsStr = field(line, E0.fields.points).trim();
+                        if (!relayPlaceStr) break;
+                        const relayPlace = parseSdifInt(relayPlaceStr);
+                        const relayPoints = relayPointsStr ? parseSdifFloat(relayPointsStr) : 0;
+                        if (isNaN(relayPlace) || isNaN(relayPoints)) break;
                         if (!events[eventNumE0]) {
                             events[eventNumE0] = createEventObject(line, 'Relay');
                         }
                         if (relayPlace && currentTeamCode) {
                             const relayResultObject = {
                                 place: relayPlace,
-                                swimmer: `${teams[currentTeamCode]?.name || currentTeamCode} '${relayTeamChar}'`,
+                                swimmer: `${teams[currentTeamCode]?.name ?? currentTeamCode} '${relayTeamChar}'`,
                                 teamCode: teams[currentTeamCode]?.code,
                                 time: relayFinalTime,
                                 points: relayPoints,
@@ -250,14 +334,12 @@ export function parseSdif(data) {
                             if (teams[currentTeamCode]) {
                                 teams[currentTeamCode].score += relayPoints;
                             }
-                        } else {
-                            lastRelayResult = null;
                         }
                     }
                     break;
                 case 'F0':
-                    if (lastRelayResult) {
-                        const swimmerName = line.substring(22, 50).trim();
+                    if (lastRelayResult && line.length >= F0.minLength) {
+                        const swimmerName = field(line, F0.fields.swimmerName).trim();
                         if (swimmerName) {
                             lastRelayResult.swimmers.push(swimmerName);
                         }
@@ -272,7 +354,7 @@ export function parseSdif(data) {
 
     // Generate meet title from host and away team names
     const teamList = Object.values(teams);
-    if (meet.hostName && meet.startDate && teamList.length === 2) {
+    if (meet.hostName && meet.startDate?.length === 8 && teamList.length === 2) {
         const year = meet.startDate.substring(4);
         const awayTeam = teamList.find(team => team.name !== meet.hostName);
         if (awayTeam) {
@@ -0,0 +1,171 @@
+/**
+ * GPSA SDIF Layout
+ * Generated from sdif-layout.json by dev-tools/sdif_layout.py - do not edit.
+ * Change sdif-layout.json, then run: python dev-tools/sdif_layout.py --write-js
+ */
+
+export const SDIF_LAYOUT = {
+    "version": 1,
+    "description": "SDIF v3 record layouts read by the GPSA parsers (bulk_process_results.py SDIFParser, publicity-core.js parseSdif). Columns are 1-based as in the SDIF specification. Records shorter than minLength are skipped. After editing, run: python dev-tools/sdif_layout.py --write-js",
+    "recordCode": {
+        "start": 1,
+        "length": 2
+    },
+    "records": {
+        "B1": {
+            "name": "Meet",
+            "minLength": 0,
+            "fields": {
+                "meetName": {
+                    "start": 12,
+                    "length": 30
+                },
+                "startDate": {
+                    "start": 122,
+                    "length": 8
+                }
+            }
+        },
+        "B2": {
+            "name": "Meet host",
+            "minLength": 0,
+            "fields": {
+                "hostName": {
+                    "start": 12,
+                    "length": 30
+                }
+            }
+        },
+        "C1": {
+            "name": "Team",
+            "minLength": 0,
+            "fields": {
+                "teamCode": {
+                    "start": 12,
+                    "length": 6
+                },
+                "teamName": {
+                    "start": 18,
+                    "length": 30
+                }
+            }
+        },
+        "D0": {
+            "name": "Individual event",
+            "minLength": 142,
+            "fields": {
+                "swimmerName": {
+                    "start": 12,
+                    "length": 28
+                },
+                "swimmerId": {
+                    "start": 40,
+                    "length": 12
+                },
+                "age": {
+                    "start": 64,
+                    "length": 2
+                },
+                "gender": {
+                    "start": 67,
+                    "length": 1
+                },
+                "distance": {
+                    "start": 68,
+                    "length": 4
+                },
+                "stroke": {
+                    "start": 72,
+                    "length": 1
+                },
+                "eventNumber": {
+                    "start": 73,
+                    "length": 4
+                },
+                "ageCode": {
+                    "start": 77,
+                    "length": 4
+                },
+                "finalTime": {
+                    "start": 116,
+                    "length": 8
+                },
+                "place": {
+                    "start": 136,
+                    "length": 3
+                },
+                "points": {
+                    "start": 139,
+                    "length": 4
+                }
+            }
+        },
+        "E0": {
+            "name": "Relay event",
+            "minLength": 99,
+            "fields": {
+                "relayTeam": {
+                    "start": 12,
+                    "length": 1
+                },
+                "gender": {
+                    "start": 21,
+                    "length": 1
+                },
+                "distance": {
+                    "start": 22,
+                    "length": 4
+                },
+                "stroke": {
+                    "start": 26,
+                    "length": 1
+                },
+                "eventNumber": {
+                    "start": 27,
+                    "length": 4
+                },
+                "ageCode": {
+                    "start": 31,
+                    "length": 4
+                },
+                "finalTime": {
+                    "start": 73,
+                    "length": 8
+                },
+                "place": {
+                    "start": 93,
+                    "length": 3
+                },
+                "points": {
+                    "start": 96,
+                    "length": 4
+                }
+            }
+        },
+        "F0": {
+            "name": "Relay name",
+            "minLength": 50,
+            "fields": {
+                "swimmerName": {
+                    "start": 23,
+                    "length": 28
+                }
+            }
+        }
+    },
+    "ageCode": {
+        "length": 4,
+        "under": "UN",
+        "over": "OV",
+        "fields": {
+            "lower": {
+                "start": 1,
+                "length": 2
+            },
+            "upper": {
+                "start": 3,
+                "length": 2
+            }
+        }
+    }
+};